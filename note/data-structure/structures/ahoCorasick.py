@@ -0,0 +1,221 @@
+"""
+Aho-Corasick 法による複数パターンの一括検索
+
+たくさんのキーワードを、テキストを 1 回走査するだけで全て見つける
+（キーワードごとに走査すると O(キーワード数 × テキスト長) かかる）
+
+仕組み:
+1. 全てのパターンでトライ木を作る（状態 = トライ木のノード = あるパターンの接頭辞）
+2. BFS でトライ木を浅い順にたどり、失敗リンクを求める
+   fail[v] = v の文字列の真の接尾辞のうち、トライ木にある最長のもの
+3. 同じ BFS の中で遷移表 goto[v][c] を完成させる
+   - v に文字 c の子があれば、その子
+   - なければ goto[fail[v]][c]（fail[v] は v より浅いので計算済み）
+   → テキストの 1 文字ごとに表を 1 回引くだけで状態が進む（失敗リンクをたどるループがない）
+4. 状態 v で終わるパターン = v 自身のパターン + 出力リンクでつながった状態のパターン
+
+遷移表の持ち方:
+- パターンに現れる文字に 0 .. σ-1 の番号をつけ、goto を長さ (状態数 × σ) の平たい array に持つ
+- パターンに現れない文字が来たら、どのパターンの途中でもなくなるので根に戻る
+
+パターンごとの出現回数:
+- 各状態に何回いたか (visits) だけを数え、最後に失敗リンクの木の葉から根へ足し上げる
+  → 走査中は 1 文字あたり表引きと加算だけで済む
+
+時間計算量: 構築 O(Σ|p| σ)、走査 O(テキスト長 + 出現数)、回数の集計 O(状態数)
+"""
+
+from array import array
+
+
+class AhoCorasick:
+    """
+    複数パターンの検索オートマトン（テキストを分割して少しずつ渡せる）
+
+    Attributes:
+        patterns: パターンのリスト（番号は添字）
+        sigma: パターンに現れる文字の種類数
+        goto: goto[v * sigma + c] = 状態 v で文字番号 c を読んだ後の状態
+        fail: 失敗リンク
+        order: BFS で状態を訪れた順
+    """
+
+    def __init__(self, patterns: list) -> None:
+        """
+        Args:
+            patterns: パターンのリスト（str のリスト、または bytes のリスト）
+
+        Raises:
+            ValueError: 空のパターンがあるとき
+
+        例:
+            ac = AhoCorasick(["he", "she", "his", "hers"])
+            ac.feed("ushers") -> [(1, 1), (2, 0), (2, 3)]   # (開始位置, パターンの番号)
+        """
+        if any(len(p) == 0 for p in patterns):
+            raise ValueError("patterns must be non-empty")
+
+        self.patterns = list(patterns)
+
+        # 文字の番号
+        self.code = {}
+        for p in self.patterns:
+            for c in p:
+                if c not in self.code:
+                    self.code[c] = len(self.code)
+        sigma = max(1, len(self.code))
+        self.sigma = sigma
+
+        # === 1. トライ木 ===
+        # children[v] = {文字番号: 子}、ends[v] = v で終わるパターンの番号
+        children = [{}]
+        ends = [[]]
+        self.terminal = []
+        for pid, p in enumerate(self.patterns):
+            v = 0
+            for c in p:
+                k = self.code[c]
+                nxt = children[v].get(k)
+                if nxt is None:
+                    nxt = len(children)
+                    children[v][k] = nxt
+                    children.append({})
+                    ends.append([])
+                v = nxt
+            ends[v].append(pid)
+            self.terminal.append(v)
+
+        num_states = len(children)
+        self.ends = ends
+
+        # === 2, 3. BFS で失敗リンクと遷移表を作る ===
+        goto = array("i", [0]) * (num_states * sigma)
+        fail = array("i", [0]) * num_states
+        # 出力リンク: 失敗リンクをたどって最初に見つかる、パターンが終わる状態（なければ 0）
+        output = array("i", [0]) * num_states
+
+        order = [0]
+        for k, child in children[0].items():
+            goto[k] = child
+            order.append(child)
+
+        head = 1
+        while head < len(order):
+            v = order[head]
+            head += 1
+
+            f = fail[v]
+            output[v] = f if ends[f] else output[f]
+
+            base = v * sigma
+            fbase = f * sigma
+            goto[base : base + sigma] = goto[fbase : fbase + sigma]
+            for k, child in children[v].items():
+                goto[base + k] = child
+                fail[child] = goto[fbase + k]
+                order.append(child)
+
+        self.goto = goto
+        self.fail = fail
+        self.output = output
+        self.order = order
+
+        self.reset()
+
+    def reset(self) -> None:
+        """走査の状態と回数を最初に戻す"""
+        self.state = 0
+        self.offset = 0
+        self.visits = array("q", [0]) * len(self.fail)
+
+    def feed(self, chunk, report: bool = True) -> list[tuple[int, int]]:
+        """
+        テキストの続きを読む（前回の feed の続きとして扱うので、パターンが境目をまたいでもよい）
+
+        Args:
+            chunk: テキストの一部（パターンと同じ型: str または bytes）
+            report: False なら出現位置を集めず、回数 (counts) のためだけに走査する（速い）
+
+        Returns:
+            この chunk の中で終わる出現 (開始位置, パターンの番号) のリスト
+            開始位置はこれまでに読んだテキスト全体での位置
+        """
+        goto = self.goto
+        code = self.code
+        sigma = self.sigma
+        visits = self.visits
+        state = self.state
+
+        if not report:
+            for c in chunk:
+                k = code.get(c)
+                state = 0 if k is None else goto[state * sigma + k]
+                visits[state] += 1
+            self.state = state
+            self.offset += len(chunk)
+            return []
+
+        ends = self.ends
+        output = self.output
+        patterns = self.patterns
+        matches = []
+        end = self.offset
+        for c in chunk:
+            end += 1
+            k = code.get(c)
+            state = 0 if k is None else goto[state * sigma + k]
+            visits[state] += 1
+
+            v = state if ends[state] else output[state]
+            while v:
+                for pid in ends[v]:
+                    matches.append((end - len(patterns[pid]), pid))
+                v = output[v]
+
+        self.state = state
+        self.offset = end
+        return matches
+
+    def counts(self) -> list[int]:
+        """
+        これまでに読んだテキストでの、各パターンの出現回数
+
+        状態 v にいたとき、失敗リンクの祖先の状態で終わるパターンも全て出現している
+        → visits を BFS の逆順（深い方から）に失敗リンクの親へ足し上げる
+
+        例:
+            ac = AhoCorasick(["a", "aa"])
+            ac.feed("aaa", report=False)
+            ac.counts() -> [3, 2]
+        """
+        total = array("q", self.visits)
+        fail = self.fail
+        for v in reversed(self.order[1:]):
+            total[fail[v]] += total[v]
+
+        return [total[v] for v in self.terminal]
+
+    def find_all(self, text) -> list[tuple[int, int]]:
+        """
+        text 全体の出現 (開始位置, パターンの番号) を返す（走査の状態は変えない）
+        """
+        saved = (self.state, self.offset, self.visits)
+        self.reset()
+        try:
+            return self.feed(text)
+        finally:
+            self.state, self.offset, self.visits = saved
+
+
+def main():
+    """使用例"""
+    ac = AhoCorasick(["he", "she", "his", "hers"])
+
+    # テキストが分割されて届いても、境目をまたぐ出現を見つけられる
+    print(ac.feed("ush"))  # []
+    print(ac.feed("ers his"))  # [(1, 1), (2, 0), (2, 3), (7, 2)]
+    print(ac.counts())  # [1, 1, 1, 1]
+
+
+if __name__ == "__main__":
+    main()
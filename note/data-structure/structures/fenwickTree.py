@@ -0,0 +1,188 @@
+"""
+Fenwick 木 (Binary Indexed Tree) の実装
+
+累積和 prefix_sum[i] は一度作れば区間和を O(1) で求められるが、
+値を 1 つ書き換えると作り直しに O(N) かかる
+Fenwick 木は「値の更新」と「累積和」をどちらも O(log N) で行う
+
+仕組み:
+- tree[i] (1-indexed) は区間 (i - (i & -i), i] の和を持つ
+  （i & -i は i の最下位ビット = その区間の長さ）
+- 累積和: i から最下位ビットを引きながら tree を足していく
+- 更新: i に最下位ビットを足しながら tree に加える
+
+主な操作:
+- FenwickTree: 1 点への加算、区間和、累積和が w 以上になる最初の位置 (lower_bound)
+- RangeFenwickTree: 区間への加算、区間和（Fenwick 木 2 本）
+
+時間計算量: 各操作 O(log N)、構築 O(N)
+空間計算量: O(N)
+"""
+
+from array import array
+
+
+class FenwickTree:
+    """
+    1 点加算・区間和の Fenwick 木 (0-indexed のインターフェース)
+
+    Attributes:
+        n: 要素数
+        tree: 1-indexed の木（tree[0] は使わない）
+    """
+
+    def __init__(self, n: int, typecode: str | None = None) -> None:
+        """
+        全ての値が 0 の Fenwick 木を作る
+
+        Args:
+            n: 要素数
+            typecode: 値を array に入れるときの型（'q': 64bit 整数, 'd': 浮動小数点数）
+                      None なら list（Python の int なので桁あふれしない）
+        """
+        self.n = n
+        if typecode is None:
+            self.tree = [0] * (n + 1)
+        else:
+            self.tree = array(typecode, [0]) * (n + 1)
+
+    @classmethod
+    def from_list(cls, values: list, typecode: str | None = None) -> "FenwickTree":
+        """
+        配列から O(N) で Fenwick 木を作る
+
+        各 tree[i] を自分の親 i + (i & -i) に足し込んでいく
+        （1 つずつ add すると O(N log N)）
+
+        例:
+            FenwickTree.from_list([3, 1, 4, 1, 5]).sum(1, 4) -> 6
+        """
+        ft = cls(len(values), typecode)
+        tree = ft.tree
+        for i, x in enumerate(values, 1):
+            tree[i] += x
+        for i in range(1, ft.n + 1):
+            parent = i + (i & -i)
+            if parent <= ft.n:
+                tree[parent] += tree[i]
+        return ft
+
+    def add(self, i: int, x) -> None:
+        """a[i] に x を加える"""
+        i += 1
+        while i <= self.n:
+            self.tree[i] += x
+            i += i & -i
+
+    def prefix_sum(self, r: int):
+        """a[0] + ... + a[r - 1] を求める"""
+        total = 0
+        while r > 0:
+            total += self.tree[r]
+            r -= r & -r
+        return total
+
+    def sum(self, l: int, r: int):
+        """区間 [l, r) の和を求める"""
+        return self.prefix_sum(r) - self.prefix_sum(l)
+
+    def get(self, i: int):
+        """a[i] を求める"""
+        return self.sum(i, i + 1)
+
+    def set(self, i: int, x) -> None:
+        """a[i] を x に書き換える"""
+        self.add(i, x - self.get(i))
+
+    def lower_bound(self, w) -> int:
+        """
+        a[0] + ... + a[r] >= w となる最小の r を求める（全ての値が 0 以上のとき）
+
+        累積和を二分探索すると O(log^2 N) だが、木を根から降りると O(log N):
+        大きい 2 のべきから順に、その区間を足しても w に届かなければ進む
+
+        Returns:
+            最小の r（全体の和が w 未満なら n）
+
+        例:
+            FenwickTree.from_list([3, 1, 4, 1, 5]).lower_bound(5) -> 2   # 3 + 1 + 4 >= 5
+        """
+        if w <= 0:
+            return 0
+
+        pos = 0
+        step = 1 << self.n.bit_length()
+        while step > 0:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] < w:
+                pos = nxt
+                w -= self.tree[nxt]
+            step >>= 1
+
+        # pos = 累積和が w 未満となる最長の長さ → 次の要素で w に届く
+        return pos
+
+
+class RangeFenwickTree:
+    """
+    区間加算・区間和の Fenwick 木 (0-indexed のインターフェース)
+
+    区間 [l, r) に x を加えると、累積和 S(i) = a[0] + ... + a[i - 1] は
+    - i <= l:      変わらない
+    - l < i <= r:  x * (i - l) 増える
+    - r < i:       x * (r - l) 増える
+    これを S(i) = b1(i) * i + b2(i) の形で持つ（b1, b2 は 2 本の Fenwick 木の累積和）
+    """
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.b1 = FenwickTree(n + 1)
+        self.b2 = FenwickTree(n + 1)
+
+    @classmethod
+    def from_list(cls, values: list) -> "RangeFenwickTree":
+        """配列から O(N) で作る（隣との差分を b1 に、その補正 -差分 * i を b2 に入れる）"""
+        rft = cls(len(values))
+        diff = [0] * (len(values) + 1)
+        for i, x in enumerate(values):
+            diff[i] += x
+            diff[i + 1] -= x
+        rft.b1 = FenwickTree.from_list(diff)
+        rft.b2 = FenwickTree.from_list([-x * i for i, x in enumerate(diff)])
+        return rft
+
+    def range_add(self, l: int, r: int, x) -> None:
+        """区間 [l, r) の全ての値に x を加える"""
+        self.b1.add(l, x)
+        self.b1.add(r, -x)
+        self.b2.add(l, -x * l)
+        self.b2.add(r, x * r)
+
+    def prefix_sum(self, r: int):
+        """a[0] + ... + a[r - 1] を求める"""
+        return self.b1.prefix_sum(r) * r + self.b2.prefix_sum(r)
+
+    def sum(self, l: int, r: int):
+        """区間 [l, r) の和を求める"""
+        return self.prefix_sum(r) - self.prefix_sum(l)
+
+    def get(self, i: int):
+        """a[i] を求める（差分の累積和）"""
+        return self.b1.prefix_sum(i + 1)
+
+
+def main():
+    """使用例"""
+    ft = FenwickTree.from_list([3, 1, 4, 1, 5, 9, 2, 6])
+    print(ft.sum(2, 5))  # 4 + 1 + 5 = 10
+    ft.add(3, 10)
+    print(ft.sum(2, 5))  # 20
+    print(ft.lower_bound(9))  # 3 + 1 + 4 + 11 >= 9 → 3
+
+    rft = RangeFenwickTree.from_list([0, 0, 0, 0, 0])
+    rft.range_add(1, 4, 2)
+    print(rft.sum(0, 5), rft.get(2))  # 6 2
+
+
+if __name__ == "__main__":
+    main()
@@ -124,6 +124,34 @@ class MinHeap:
 
         self.heap[i] = x
 
+    def replace_top(self, x):
+        """
+        最小値を削除してから x を挿入する（pop + push を 1 回の降下で行う）
+
+        k-way マージのように「最小値を取り出して、同じ列の次の値を入れる」
+        操作が続くときに、push の上昇を省ける
+        """
+        if not self.heap:
+            self.heap.append(x)
+            return
+
+        # 根の位置に穴をあけ、x を入れる位置まで降ろしていく
+        i = 0
+        while i * 2 + 1 < len(self.heap):
+            child1 = i * 2 + 1
+            child2 = i * 2 + 2
+
+            if child2 < len(self.heap) and self.heap[child2] < self.heap[child1]:
+                child1 = child2
+
+            if self.heap[child1] >= x:
+                break
+
+            self.heap[i] = self.heap[child1]
+            i = child1
+
+        self.heap[i] = x
+
     def is_empty(self):
         return len(self.heap) == 0
 
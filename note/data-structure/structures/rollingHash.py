@@ -0,0 +1,102 @@
+"""
+ローリングハッシュ (Rolling Hash) の実装
+
+文字列を B 進数とみなした値を MOD で割った余りをハッシュ値にする
+  hash(s[0:n]) = s[0] B^(n-1) + s[1] B^(n-2) + ... + s[n-1]  (mod MOD)
+
+前もって接頭辞のハッシュ h[i] = hash(s[0:i]) と B のべき乗を求めておけば、
+任意の部分文字列のハッシュが O(1) で求まる
+  hash(s[l:r]) = h[r] - h[l] * B^(r-l)  (mod MOD)
+
+衝突（違う文字列が同じハッシュになること）を避けるため:
+- MOD = 2^61 - 1（メルセンヌ素数、衝突確率は 1 回の比較で約 N / 2^61）
+- 基数 B はプロセスごとに乱数で選ぶ（狙って衝突する入力を作りにくくする）
+- 違う文字列どうしを比べるときは同じ B を使う必要がある（デフォルトで共通の BASE を使う）
+
+時間計算量: 構築 O(N)、部分文字列のハッシュ・比較 O(1)、2 つの位置からの最長共通接頭辞 O(log N)
+"""
+
+import random
+
+MOD = (1 << 61) - 1
+BASE = random.randrange(1 << 20, MOD - 1)
+
+
+class RollingHash:
+    """
+    文字列 s の部分文字列のハッシュを O(1) で求める
+
+    Attributes:
+        h: h[i] = hash(s[0:i])
+        power: power[i] = BASE^i (mod MOD)
+    """
+
+    def __init__(self, s: str, base: int = BASE) -> None:
+        """
+        例:
+            rh = RollingHash("abcabc")
+            rh.get(0, 3) == rh.get(3, 6) -> True
+        """
+        self.n = len(s)
+        self.base = base
+
+        h = [0] * (self.n + 1)
+        power = [1] * (self.n + 1)
+        for i, c in enumerate(s):
+            h[i + 1] = (h[i] * base + ord(c)) % MOD
+            power[i + 1] = power[i] * base % MOD
+
+        self.h = h
+        self.power = power
+
+    def get(self, l: int, r: int) -> int:
+        """s[l:r] のハッシュ値"""
+        return (self.h[r] - self.h[l] * self.power[r - l]) % MOD
+
+    def equal(self, l1: int, l2: int, length: int) -> bool:
+        """s[l1 : l1 + length] と s[l2 : l2 + length] が等しいか（ハッシュ値で判定）"""
+        return self.get(l1, l1 + length) == self.get(l2, l2 + length)
+
+    def lcp(self, i: int, other: "RollingHash", j: int) -> int:
+        """
+        self の位置 i からと other の位置 j からの最長共通接頭辞の長さ
+
+        長さ L で一致するなら L より短くても一致する（単調）ので、L を二分探索する
+
+        例:
+            RollingHash("abcab").lcp(0, RollingHash("abd"), 0) -> 2
+        """
+        if self.base != other.base:
+            raise ValueError("hashes with different bases cannot be compared")
+
+        lo, hi = 0, min(self.n - i, other.n - j)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.get(i, i + mid) == other.get(j, j + mid):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+
+def longest_common_prefix(strs: list[str]) -> str:
+    """
+    全ての文字列の最長共通接頭辞（leet-code 14 の別解）
+
+    最初の文字列と他の各文字列の LCP の最小値を、ローリングハッシュの二分探索で求める
+    計算量: O(Σ |s| + k log L) (k: 文字列の数、L: 最短の長さ)
+
+    例:
+        longest_common_prefix(["flower", "flow", "flight"]) -> "fl"
+    """
+    if not strs:
+        return ""
+
+    first = RollingHash(strs[0])
+    length = len(strs[0])
+    for s in strs[1:]:
+        length = min(length, first.lcp(0, RollingHash(s), 0))
+        if length == 0:
+            break
+
+    return strs[0][:length]
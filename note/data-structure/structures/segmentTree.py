@@ -0,0 +1,268 @@
+"""
+セグメント木 (Segment Tree) の実装
+
+区間に対する集約（和・最小値・最大値など）と値の更新を O(log N) で行う
+Fenwick 木と違い、和以外の演算（最小値など、引き算できないもの）にも使える
+
+モノイド:
+- 結合法則を満たす演算 op と単位元 e の組
+  例: (和, 0), (最小値, INF), (最大値, -INF), (gcd, 0), (行列の積, 単位行列)
+- 演算を引数で受け取るので、1 つの実装でいろいろな集約に使える
+
+配列での表現（再帰なし）:
+- size = N 以上の最小の 2 のべき
+- tree[size + i] が葉 a[i]、tree[k] = op(tree[2k], tree[2k + 1])（根は tree[1]）
+- 区間 [l, r) の集約は、葉から根に向かって l と r を同時に上げながら求める
+
+遅延評価 (LazySegmentTree):
+- 区間への作用（区間加算、区間代入など）を、区間全体を覆うノードに「保留」しておき、
+  そのノードの子を見る必要ができたときに子へ伝える
+- 作用 f は mapping(f, x) で値に作用し、composition(f, g) = 「g のあとに f」で合成する
+
+時間計算量: 各操作 O(log N)、構築 O(N)
+空間計算量: O(N)
+"""
+
+
+class SegmentTree:
+    """
+    1 点更新・区間集約のセグメント木
+
+    Attributes:
+        n: 要素数
+        size: 葉の数（n 以上の最小の 2 のべき）
+        tree: 長さ 2 * size の配列（tree[1] が根）
+    """
+
+    def __init__(self, values: list, op, e) -> None:
+        """
+        配列から O(N) で作る
+
+        Args:
+            values: 初期値の配列
+            op: 2 つの値をまとめる関数（結合法則を満たす）
+            e: op の単位元
+
+        例:
+            st = SegmentTree([5, 3, 7, 1], min, float("inf"))
+            st.prod(0, 3) -> 3
+        """
+        self.n = len(values)
+        self.op = op
+        self.e = e
+        self.size = 1 << max(0, (self.n - 1).bit_length())
+
+        self.tree = [e] * (2 * self.size)
+        self.tree[self.size : self.size + self.n] = values
+        for k in range(self.size - 1, 0, -1):
+            self.tree[k] = op(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def set(self, i: int, x) -> None:
+        """a[i] を x に書き換える"""
+        k = i + self.size
+        self.tree[k] = x
+        k >>= 1
+        while k > 0:
+            self.tree[k] = self.op(self.tree[2 * k], self.tree[2 * k + 1])
+            k >>= 1
+
+    def get(self, i: int):
+        """a[i] を求める"""
+        return self.tree[i + self.size]
+
+    def prod(self, l: int, r: int):
+        """
+        op(a[l], a[l + 1], ..., a[r - 1]) を求める（区間 [l, r)）
+
+        l が右の子なら tree[l] を左側の結果に、r が右の子なら tree[r - 1] を右側の結果に
+        取り込んでから親に上がる（op は可換とは限らないので左右を分けて持つ）
+        """
+        left = self.e
+        right = self.e
+        l += self.size
+        r += self.size
+
+        while l < r:
+            if l & 1:
+                left = self.op(left, self.tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                right = self.op(self.tree[r], right)
+            l >>= 1
+            r >>= 1
+
+        return self.op(left, right)
+
+    def all_prod(self):
+        """全体の集約"""
+        return self.tree[1]
+
+
+class LazySegmentTree:
+    """
+    区間作用・区間集約のセグメント木（遅延評価）
+
+    Attributes:
+        tree: 各ノードの集約値（保留中の作用は反映済み）
+        lazy: 各ノードが子にまだ伝えていない作用
+    """
+
+    def __init__(self, values: list, op, e, mapping, composition, id_) -> None:
+        """
+        Args:
+            values: 初期値の配列
+            op, e: 値のモノイド
+            mapping: mapping(f, x) = 値 x に作用 f を施した結果
+            composition: composition(f, g) = g を施したあとに f を施す作用
+            id_: 何もしない作用
+
+        例（区間加算・区間最小値）:
+            st = LazySegmentTree([5, 3, 7, 1], min, float("inf"),
+                                 lambda f, x: f + x, lambda f, g: f + g, 0)
+            st.apply(0, 2, 10)
+            st.prod(0, 3) -> 7
+        """
+        self.n = len(values)
+        self.op = op
+        self.e = e
+        self.mapping = mapping
+        self.composition = composition
+        self.id = id_
+        self.log = max(0, (self.n - 1).bit_length())
+        self.size = 1 << self.log
+
+        self.tree = [e] * (2 * self.size)
+        self.lazy = [id_] * self.size
+        self.tree[self.size : self.size + self.n] = values
+        for k in range(self.size - 1, 0, -1):
+            self._update(k)
+
+    def _update(self, k: int) -> None:
+        """子の値から tree[k] を計算し直す"""
+        self.tree[k] = self.op(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def _all_apply(self, k: int, f) -> None:
+        """ノード k に作用 f を施す（葉でなければ子に伝える分を lazy にためる）"""
+        self.tree[k] = self.mapping(f, self.tree[k])
+        if k < self.size:
+            self.lazy[k] = self.composition(f, self.lazy[k])
+
+    def _push(self, k: int) -> None:
+        """ノード k の保留中の作用を子に伝える"""
+        f = self.lazy[k]
+        if f != self.id:
+            self._all_apply(2 * k, f)
+            self._all_apply(2 * k + 1, f)
+            self.lazy[k] = self.id
+
+    def _push_path(self, l: int, r: int) -> None:
+        """区間 [l, r)（葉の番号）の両端の祖先の作用を、根から順に伝える"""
+        for i in range(self.log, 0, -1):
+            if ((l >> i) << i) != l:
+                self._push(l >> i)
+            if ((r >> i) << i) != r:
+                self._push((r - 1) >> i)
+
+    def set(self, i: int, x) -> None:
+        """a[i] を x に書き換える"""
+        k = i + self.size
+        for j in range(self.log, 0, -1):
+            self._push(k >> j)
+        self.tree[k] = x
+        for j in range(1, self.log + 1):
+            self._update(k >> j)
+
+    def get(self, i: int):
+        """a[i] を求める"""
+        k = i + self.size
+        for j in range(self.log, 0, -1):
+            self._push(k >> j)
+        return self.tree[k]
+
+    def prod(self, l: int, r: int):
+        """op(a[l], ..., a[r - 1]) を求める"""
+        if l == r:
+            return self.e
+
+        l += self.size
+        r += self.size
+        self._push_path(l, r)
+
+        left = self.e
+        right = self.e
+        while l < r:
+            if l & 1:
+                left = self.op(left, self.tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                right = self.op(self.tree[r], right)
+            l >>= 1
+            r >>= 1
+
+        return self.op(left, right)
+
+    def all_prod(self):
+        """全体の集約"""
+        return self.tree[1]
+
+    def apply(self, l: int, r: int, f) -> None:
+        """
+        区間 [l, r) の全ての値に作用 f を施す
+
+        1. 両端の祖先の保留中の作用を伝える
+        2. 区間を覆うノード（O(log N) 個）に f を施す
+        3. 両端の祖先の値を計算し直す
+        """
+        if l == r:
+            return
+
+        l += self.size
+        r += self.size
+        self._push_path(l, r)
+
+        l2, r2 = l, r
+        while l < r:
+            if l & 1:
+                self._all_apply(l, f)
+                l += 1
+            if r & 1:
+                r -= 1
+                self._all_apply(r, f)
+            l >>= 1
+            r >>= 1
+        l, r = l2, r2
+
+        for i in range(1, self.log + 1):
+            if ((l >> i) << i) != l:
+                self._update(l >> i)
+            if ((r >> i) << i) != r:
+                self._update((r - 1) >> i)
+
+
+def main():
+    """使用例"""
+    print("=== 区間最小値 ===")
+    st = SegmentTree([5, 3, 7, 1, 4], min, float("inf"))
+    print(st.prod(0, 3))  # 3
+    st.set(1, 10)
+    print(st.prod(0, 3))  # 5
+
+    print("=== 区間加算・区間和 ===")
+    # 値 = (和, 区間の長さ)、作用 = 加える値
+    st = LazySegmentTree(
+        [(x, 1) for x in [1, 2, 3, 4, 5]],
+        lambda a, b: (a[0] + b[0], a[1] + b[1]),
+        (0, 0),
+        lambda f, x: (x[0] + f * x[1], x[1]),
+        lambda f, g: f + g,
+        0,
+    )
+    st.apply(1, 4, 10)
+    print(st.prod(0, 5)[0])  # 15 + 30 = 45
+    print(st.get(2)[0])  # 13
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+スパーステーブル (Sparse Table) の実装
+
+値が変わらない配列に対して、区間の最小値・最大値などを O(1) で答える
+（値の更新が必要ならセグメント木を使う）
+
+SparseTable（冪等な演算: min, max, gcd, and, or など）:
+- table[k][i] = op(a[i], ..., a[i + 2^k - 1])（長さ 2^k の区間の集約）
+- table[k] は table[k - 1] の 2 つの区間をまとめて作る → 構築 O(N log N)
+- 区間 [l, r) は、長さ 2^k (2^k <= r - l < 2^(k+1)) の 2 つの区間
+  [l, l + 2^k) と [r - 2^k, r) で覆える
+  重なった部分を 2 回数えても結果が変わらない演算（冪等）なら O(1)
+
+DisjointSparseTable（結合法則を満たす任意の演算: 和、積、行列の積など）:
+- 配列を幅 2^(k+1) のブロックに分け、ブロックの中央 mid から
+  左へ向かう累積 op(a[i..mid-1]) と右へ向かう累積 op(a[mid..i]) を持つ
+- 区間 [l, r] は、l と r が初めて別の半分に分かれるブロックの段 k = (l ^ r) の最上位ビット
+  で、左の累積と右の累積を 1 回 op するだけで求まる（重なりがない）
+
+時間計算量: 構築 O(N log N)、問い合わせ O(1)
+空間計算量: O(N log N)
+"""
+
+
+class SparseTable:
+    """
+    冪等な演算の区間集約を O(1) で答えるスパーステーブル
+
+    Attributes:
+        table: table[k][i] = op(a[i .. i + 2^k - 1])
+    """
+
+    def __init__(self, values: list, op=min) -> None:
+        """
+        Args:
+            values: 配列
+            op: 冪等で結合法則を満たす 2 引数の関数（デフォルト: min）
+
+        例:
+            SparseTable([5, 3, 7, 1, 4]).query(0, 3) -> 3
+            SparseTable([5, 3, 7, 1, 4], max).query(2, 5) -> 7
+        """
+        self.n = len(values)
+        self.op = op
+        self.table = [list(values)]
+
+        # 1 段上の行は、前の行を half ずらして要素ごとに op する（map で行単位にまとめて計算）
+        k = 1
+        while (1 << k) <= self.n:
+            prev = self.table[-1]
+            half = 1 << (k - 1)
+            self.table.append(list(map(op, prev[: len(prev) - half], prev[half:])))
+            k += 1
+
+    def query(self, l: int, r: int):
+        """
+        op(a[l], ..., a[r - 1]) を求める（区間 [l, r)、l < r）
+
+        Raises:
+            ValueError: 区間が空のとき（単位元がないので値を決められない）
+        """
+        if l >= r:
+            raise ValueError("empty range")
+
+        k = (r - l).bit_length() - 1
+        row = self.table[k]
+        return self.op(row[l], row[r - (1 << k)])
+
+    def query_many(self, ranges) -> list:
+        """
+        いくつもの区間 [l, r) にまとめて答える
+
+        1 回ごとの属性の参照や関数呼び出しを省いて、まとめてループする
+
+        Args:
+            ranges: (l, r) の組の列
+
+        Returns:
+            各区間の集約のリスト
+
+        例:
+            SparseTable([5, 3, 7, 1, 4]).query_many([(0, 2), (2, 5)]) -> [3, 1]
+        """
+        table = self.table
+        op = self.op
+        result = []
+        for l, r in ranges:
+            if l >= r:
+                raise ValueError("empty range")
+            k = (r - l).bit_length() - 1
+            row = table[k]
+            result.append(op(row[l], row[r - (1 << k)]))
+        return result
+
+
+class DisjointSparseTable:
+    """
+    結合法則を満たす任意の演算の区間集約を O(1) で答える（冪等でなくてよい）
+
+    Attributes:
+        table: table[k][i] = i を含む幅 2^(k+1) のブロックの中央 mid について、
+               i < mid なら op(a[i .. mid - 1])、i >= mid なら op(a[mid .. i])
+    """
+
+    def __init__(self, values: list, op) -> None:
+        """
+        Args:
+            values: 配列
+            op: 結合法則を満たす 2 引数の関数
+
+        例:
+            DisjointSparseTable([3, 1, 4, 1, 5], lambda x, y: x + y).query(1, 4) -> 6
+        """
+        self.values = list(values)
+        self.n = len(values)
+        self.op = op
+        self.table = []
+
+        k = 0
+        while (1 << k) < self.n:
+            half = 1 << k
+            row = [None] * self.n
+
+            for start in range(0, self.n, 2 * half):
+                mid = start + half
+                if mid >= self.n:
+                    # 右半分がないブロックは、両端が別の半分に分かれる区間がない
+                    break
+
+                # 中央から左へ
+                acc = values[mid - 1]
+                row[mid - 1] = acc
+                for i in range(mid - 2, start - 1, -1):
+                    acc = op(values[i], acc)
+                    row[i] = acc
+
+                # 中央から右へ
+                acc = values[mid]
+                row[mid] = acc
+                for i in range(mid + 1, min(start + 2 * half, self.n)):
+                    acc = op(acc, values[i])
+                    row[i] = acc
+
+            self.table.append(row)
+            k += 1
+
+    def query(self, l: int, r: int):
+        """
+        op(a[l], ..., a[r - 1]) を求める（区間 [l, r)、l < r）
+
+        Raises:
+            ValueError: 区間が空のとき
+        """
+        if l >= r:
+            raise ValueError("empty range")
+
+        r -= 1
+        if l == r:
+            return self.values[l]
+
+        row = self.table[(l ^ r).bit_length() - 1]
+        return self.op(row[l], row[r])
+
+    def query_many(self, ranges) -> list:
+        """
+        いくつもの区間 [l, r) にまとめて答える
+
+        Args:
+            ranges: (l, r) の組の列
+
+        Returns:
+            各区間の集約のリスト
+        """
+        return [self.query(l, r) for l, r in ranges]
+
+
+def main():
+    """使用例"""
+    prices = [7, 1, 5, 3, 6, 4]
+
+    print("=== 区間の最小値・最大値 ===")
+    lo = SparseTable(prices, min)
+    hi = SparseTable(prices, max)
+    print(lo.query(1, 4), hi.query(1, 4))  # 1 5
+    # 日 i に売るときの最大利益 = prices[i] - (それまでの最小値)
+    print(max(prices[i] - lo.query(0, i + 1) for i in range(len(prices))))  # 5
+
+    print("=== 区間和（冪等でない演算） ===")
+    dst = DisjointSparseTable(prices, lambda x, y: x + y)
+    print(dst.query_many([(0, 6), (2, 5), (3, 4)]))  # [26, 14, 3]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+部分列判定のための索引 (next-occurrence table)
+
+1 つの長い文字列 t に対して「s は t の部分列か」を何度も問い合わせる
+1 回ずつ t を先頭から走査すると O(|t|) かかるが、
+「位置 i 以降で文字 c が最初に現れる位置」を前もって求めておけば、
+s の各文字について次の位置へ飛ぶだけで済む
+
+2 つの持ち方:
+- 文字種 (alphabet) を指定した場合: 表 nxt[i][c] を平たい array に持つ
+  構築 O(|t| σ)、問い合わせ O(|s|) (σ: 文字種の数)
+- 指定しない場合: 文字ごとに出現位置の昇順リストを持ち、二分探索で次の位置を求める
+  構築 O(|t|)、問い合わせ O(|s| log |t|)（文字種が多くてもメモリが増えない）
+"""
+
+from array import array
+from bisect import bisect_left
+
+
+class SubsequenceIndex:
+    """
+    文字列 t の部分列判定の索引
+
+    Attributes:
+        n: t の長さ
+        code: 文字 → 0 .. σ-1 の番号（alphabet を指定したとき）
+        nxt: nxt[i * σ + c] = i 以降で文字 c が最初に現れる位置（なければ n）
+        positions: 文字 → 出現位置の昇順リスト（alphabet を指定しないとき）
+    """
+
+    def __init__(self, t: str, alphabet: str | None = None) -> None:
+        """
+        Args:
+            t: 検索対象の文字列
+            alphabet: t と問い合わせに現れる文字の集合（例: "abcdefghijklmnopqrstuvwxyz"）
+
+        例:
+            index = SubsequenceIndex("ahbgdc", "abcdefghijklmnopqrstuvwxyz")
+            index.is_subsequence("abc") -> True
+        """
+        self.n = len(t)
+        self.code = None
+        self.nxt = None
+        self.positions = None
+
+        if alphabet is not None:
+            self.code = {c: k for k, c in enumerate(alphabet)}
+            sigma = len(alphabet)
+            self.sigma = sigma
+
+            # 後ろから作る: 行 i は行 i + 1 をコピーして、t[i] の列だけ i にする
+            nxt = array("i", [self.n]) * ((self.n + 1) * sigma)
+            for i in range(self.n - 1, -1, -1):
+                base = i * sigma
+                nxt[base : base + sigma] = nxt[base + sigma : base + 2 * sigma]
+                nxt[base + self.code[t[i]]] = i
+            self.nxt = nxt
+        else:
+            positions = {}
+            for i, c in enumerate(t):
+                positions.setdefault(c, []).append(i)
+            self.positions = positions
+
+    def match_end(self, s: str) -> int:
+        """
+        s を t の前から貪欲に部分列として対応させたときの、最後の文字の次の位置
+
+        Returns:
+            s が部分列なら、対応させた最後の位置 + 1（s が空なら 0）、部分列でなければ -1
+        """
+        n = self.n
+        i = 0
+
+        if self.nxt is not None:
+            nxt = self.nxt
+            code = self.code
+            sigma = self.sigma
+            for c in s:
+                k = code.get(c)
+                if k is None:
+                    return -1
+                # 行 n は全て n（もう文字がない）
+                j = nxt[i * sigma + k]
+                if j == n:
+                    return -1
+                i = j + 1
+            return i
+
+        positions = self.positions
+        for c in s:
+            pos = positions.get(c)
+            if pos is None:
+                return -1
+            k = bisect_left(pos, i)
+            if k == len(pos):
+                return -1
+            i = pos[k] + 1
+        return i
+
+    def is_subsequence(self, s: str) -> bool:
+        """s が t の部分列か"""
+        return self.match_end(s) != -1
+
+    def is_subsequence_many(self, queries) -> list[bool]:
+        """
+        いくつもの s についてまとめて判定する
+
+        例:
+            SubsequenceIndex("ahbgdc").is_subsequence_many(["abc", "axc"]) -> [True, False]
+        """
+        return [self.match_end(s) != -1 for s in queries]
@@ -0,0 +1,131 @@
+"""
+接尾辞配列 (Suffix Array) と LCP 配列の実装
+
+接尾辞配列:
+- 文字列 s の全ての接尾辞 s[i:] を辞書順に並べたときの開始位置 i の列
+- ダブリング: 先頭 k 文字での順位の組 (rank[i], rank[i + k]) でソートすると
+  先頭 2k 文字での順位がわかる → k を 1, 2, 4, ... と倍にしていく
+
+LCP 配列 (Kasai 法):
+- lcp[j] = 辞書順で j - 1 番目と j 番目の接尾辞の最長共通接頭辞の長さ
+- s[i:] の次に s[i+1:] を調べると、LCP は高々 1 しか減らないので全体で O(N)
+
+任意の 2 つの接尾辞の最長共通接頭辞:
+- 辞書順で間にある lcp の最小値になる → スパーステーブルで O(1)
+
+時間計算量: 構築 O(N log^2 N)（ダブリングの各段でソート）、lcp(i, j) O(1)、
+            パターンの出現回数 O(|p| log N)
+空間計算量: O(N log N)（スパーステーブル）
+"""
+
+from structures.sparseTable import SparseTable
+
+
+class SuffixArray:
+    """
+    文字列 s の接尾辞配列と LCP の索引
+
+    Attributes:
+        s: 元の文字列
+        sa: 接尾辞配列（sa[j] = 辞書順で j 番目の接尾辞の開始位置）
+        rank: sa の逆（rank[i] = s[i:] が辞書順で何番目か）
+        lcp: lcp[j] = s[sa[j - 1]:] と s[sa[j]:] の最長共通接頭辞の長さ（lcp[0] = 0）
+    """
+
+    def __init__(self, s: str) -> None:
+        """
+        例:
+            SuffixArray("banana").sa -> [5, 3, 1, 0, 4, 2]
+            # a, ana, anana, banana, na, nana
+        """
+        self.s = s
+        n = len(s)
+
+        # === 接尾辞配列（ダブリング） ===
+        rank = [ord(c) for c in s]
+        sa = list(range(n))
+        k = 1
+        while True:
+            # 先頭 2k 文字での比較キー（後ろが足りない接尾辞は -1 で小さくする）
+            key = [(rank[i], rank[i + k] if i + k < n else -1) for i in range(n)]
+            sa.sort(key=key.__getitem__)
+
+            new_rank = [0] * n
+            for j in range(1, n):
+                new_rank[sa[j]] = new_rank[sa[j - 1]] + (key[sa[j]] != key[sa[j - 1]])
+            rank = new_rank
+
+            # 全ての順位が異なれば完了
+            if n == 0 or rank[sa[-1]] == n - 1:
+                break
+            k *= 2
+
+        self.sa = sa
+        self.rank = rank
+
+        # === LCP 配列（Kasai 法） ===
+        lcp = [0] * n
+        h = 0
+        for i in range(n):
+            if rank[i] == 0:
+                h = 0
+                continue
+            j = sa[rank[i] - 1]
+            while i + h < n and j + h < n and s[i + h] == s[j + h]:
+                h += 1
+            lcp[rank[i]] = h
+            if h > 0:
+                h -= 1
+        self.lcp = lcp
+
+        self._lcp_table = SparseTable(lcp, min) if n > 0 else None
+
+    def lcp_of(self, i: int, j: int) -> int:
+        """
+        s[i:] と s[j:] の最長共通接頭辞の長さ
+
+        例:
+            SuffixArray("banana").lcp_of(1, 3) -> 3   # "anana" と "ana"
+        """
+        if i == j:
+            return len(self.s) - i
+
+        a, b = self.rank[i], self.rank[j]
+        if a > b:
+            a, b = b, a
+        return self._lcp_table.query(a + 1, b + 1)
+
+    def _bound(self, pattern: str, upper: bool) -> int:
+        """
+        pattern で始まる接尾辞の範囲の端を二分探索する
+
+        upper=False: 先頭 |p| 文字が pattern 以上になる最初の位置
+        upper=True:  先頭 |p| 文字が pattern より大きくなる最初の位置
+        """
+        s = self.s
+        sa = self.sa
+        m = len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            head = s[sa[mid] : sa[mid] + m]
+            if head < pattern or (upper and head == pattern):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def count(self, pattern: str) -> int:
+        """
+        pattern が s に何回現れるか
+
+        例:
+            SuffixArray("banana").count("ana") -> 2
+        """
+        return self._bound(pattern, True) - self._bound(pattern, False)
+
+    def find_all(self, pattern: str) -> list[int]:
+        """pattern が現れる位置の昇順リスト"""
+        lo = self._bound(pattern, False)
+        hi = self._bound(pattern, True)
+        return sorted(self.sa[lo:hi])
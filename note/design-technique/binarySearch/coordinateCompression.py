@@ -0,0 +1,172 @@
+"""
+座標圧縮 (coordinate compression)
+
+値そのものではなく「小さい方から何番目か」だけが必要なとき、
+値を 0, 1, 2, ... の小さな整数に置き換える（Fenwick 木やスイープラインの添字に使う）
+
+rank.py の rank(arr) は 1 つの配列を圧縮するたびにソートし直す
+CoordinateCompressor は一度 fit した対応を、いくつもの配列の変換や逆変換に使い回す
+
+同じ値（タイ）の番号のつけ方 (method):
+- 'dense':   異なる値を小さい順に 0, 1, 2, ...          [10, 20, 20, 30] → [0, 1, 1, 2]
+- 'sparse':  その値より小さい値の個数（rank(arr) と同じ）  [10, 20, 20, 30] → [0, 1, 1, 3]
+- 'ordinal': 同じ値は現れた順に別の番号（全て異なる番号） [10, 20, 20, 30] → [0, 1, 2, 3]
+
+計算量 (N: fit した要素数, D: 異なる値の数):
+- fit: O(N log N)
+- transform: 1 要素あたり O(1)（値 → 番号の辞書を引く）
+- inverse_transform: 1 要素あたり O(1)（dense）/ O(log D)（sparse, ordinal）
+- insert: O(D)（後ろの値の番号がずれるため）
+"""
+
+from bisect import bisect_left, bisect_right
+
+METHODS = ("dense", "sparse", "ordinal")
+
+
+class CoordinateCompressor:
+    """値と圧縮後の番号の対応を保持する"""
+
+    def __init__(self, method: str = "dense"):
+        if method not in METHODS:
+            raise ValueError(f"unknown method: {method!r}")
+        self.method = method
+        # 異なる値の昇順
+        self.values = []
+        # starts[i] = values[i] より小さい値の個数（重複も数える）
+        self.starts = []
+        # values[i] の個数
+        self.counts = []
+        # 値 → values での位置（insert で作り直しが必要になったら None）
+        self._index = None
+
+    def __len__(self) -> int:
+        """異なる値の数（dense の番号は 0 .. len - 1）"""
+        return len(self.values)
+
+    def __contains__(self, x) -> bool:
+        return x in self._get_index()
+
+    def _get_index(self) -> dict:
+        if self._index is None:
+            self._index = {v: i for i, v in enumerate(self.values)}
+        return self._index
+
+    def fit(self, arr) -> "CoordinateCompressor":
+        """
+        arr の値で対応を作る
+
+        Returns:
+            self（fit(a).transform(b) のようにつなげられる）
+        """
+        num = {}
+        for x in arr:
+            num[x] = num.get(x, 0) + 1
+
+        self.values = sorted(num)
+        self.counts = [num[v] for v in self.values]
+
+        self.starts = []
+        total = 0
+        for c in self.counts:
+            self.starts.append(total)
+            total += c
+
+        self._index = None
+        return self
+
+    def transform(self, arr) -> list[int]:
+        """
+        各値を番号に変換する
+
+        'ordinal' では、同じ値は [starts, starts + counts) の番号をこの呼び出しの中で現れた順に使う
+        （fit した配列そのものを変換すると 0 .. N-1 の並べ替えになる）
+
+        Raises:
+            ValueError: fit していない値があるとき（sparse でも ordinal でも番号が決まらない）
+
+        例:
+            CoordinateCompressor().fit([30, 10, 20]).transform([20, 30]) -> [1, 2]
+        """
+        index = self._get_index()
+        result = []
+
+        if self.method == "ordinal":
+            used = {}
+            for x in arr:
+                i = index.get(x)
+                if i is None:
+                    raise ValueError(f"{x} was not fitted")
+                k = used.get(i, 0)
+                if k >= self.counts[i]:
+                    raise ValueError(f"{x} appears more often than it was fitted")
+                used[i] = k + 1
+                result.append(self.starts[i] + k)
+            return result
+
+        dense = self.method == "dense"
+        for x in arr:
+            i = index.get(x)
+            if i is None:
+                raise ValueError(f"{x} was not fitted")
+            result.append(i if dense else self.starts[i])
+
+        return result
+
+    def fit_transform(self, arr) -> list[int]:
+        """
+        fit(arr) してから arr を変換する
+
+        例:
+            CoordinateCompressor("sparse").fit_transform([12, 43, 7, 15, 9]) -> [2, 4, 0, 3, 1]
+            （rank([12, 43, 7, 15, 9]) と同じ）
+        """
+        arr = list(arr)
+        return self.fit(arr).transform(arr)
+
+    def inverse_transform(self, codes) -> list:
+        """
+        番号を元の値に戻す
+
+        例:
+            CoordinateCompressor().fit([30, 10, 20]).inverse_transform([2, 0]) -> [30, 10]
+        """
+        if self.method == "dense":
+            return [self.values[c] for c in codes]
+
+        # sparse / ordinal の番号 c は [starts[i], starts[i] + counts[i]) に入っている
+        return [self.values[bisect_right(self.starts, c) - 1] for c in codes]
+
+    def lower_bound(self, x) -> int:
+        """
+        x 以上の最小の値の dense の番号（fit していない値の範囲の問い合わせに使う）
+
+        例:
+            CoordinateCompressor().fit([10, 20, 30]).lower_bound(15) -> 1
+        """
+        return bisect_left(self.values, x)
+
+    def insert(self, x) -> int:
+        """
+        値 x を 1 つ追加し、x の dense の番号を返す
+
+        新しい値なら values に挿入するので、x より大きい値の dense の番号は 1 ずつ増える
+        sparse / ordinal の番号も、x より大きい値の分が 1 ずつ増える
+
+        計算量: O(D)
+        """
+        i = bisect_left(self.values, x)
+
+        if i < len(self.values) and self.values[i] == x:
+            self.counts[i] += 1
+        else:
+            start = self.starts[i] if i < len(self.starts) else sum(self.counts)
+            self.values.insert(i, x)
+            self.starts.insert(i, start)
+            self.counts.insert(i, 1)
+            self._index = None
+
+        for j in range(i + 1, len(self.starts)):
+            self.starts[j] += 1
+
+        return i
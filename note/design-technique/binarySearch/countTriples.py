@@ -1,3 +1,14 @@
+"""
+a[i] < b[j] < c[k] となる組 (i, j, k) の数を数える
+
+- countTriples: a と c をソートし、各 b[j] について二分探索する O(N log N)
+- TripleCounter: a と c を 1 回だけソートしておき、b のまとめた問い合わせに
+  b をソートしてからの併合（マージ）で答える
+  → 同じ a, c に何度も問い合わせるとき、1 回あたり O(N + B log B) (B: b の長さ)
+- count_chains: 3 段に限らず x1 < x2 < ... < xk となる組の数を、
+  段ごとに「前の段の組の数の累積和」をとる DP で数える O(Σ N_i log N_i)
+"""
+
 import bisect
 
 
@@ -26,10 +37,102 @@ def countTriples(a, b, c):
     return total
 
 
-# テスト
-a = [1, 5]
-b = [2, 4]
-c = [3, 6]
+class TripleCounter:
+    """a と c を固定して、いろいろな b に対して countTriples を答える"""
+
+    def __init__(self, a, c):
+        self.sorted_a = sorted(a)
+        self.sorted_c = sorted(c)
+
+    def count_each(self, b):
+        """
+        各 b[j] を中心とした組の数のリストを返す
+
+        b を昇順に見ると「b[j] 未満の a の個数」「b[j] 以下の c の個数」は増える一方なので、
+        sorted_a と sorted_c のポインタを前に進めるだけで数えられる（併合と同じ）
+
+        計算量: O(N + B log B)
+
+        例:
+            TripleCounter([1, 5], [3, 6]).count_each([2, 4]) -> [2, 1]
+        """
+        sorted_a = self.sorted_a
+        sorted_c = self.sorted_c
+        na = len(sorted_a)
+        nc = len(sorted_c)
+
+        result = [0] * len(b)
+        i = 0  # b[j] 未満の a の個数
+        k = 0  # b[j] 以下の c の個数
+        for j in sorted(range(len(b)), key=lambda j: b[j]):
+            x = b[j]
+            while i < na and sorted_a[i] < x:
+                i += 1
+            while k < nc and sorted_c[k] <= x:
+                k += 1
+            result[j] = i * (nc - k)
+
+        return result
+
+    def count(self, b):
+        """
+        a[i] < b[j] < c[k] となる組の数（countTriples(a, b, c) と同じ値）
+
+        例:
+            TripleCounter([1, 5], [3, 6]).count([2, 4]) -> 3
+        """
+        return sum(self.count_each(b))
+
+
+def count_chains(stages):
+    """
+    各段から 1 つずつ選んだ x1, x2, ..., xk が x1 < x2 < ... < xk となる組の数
+
+    DP:
+    - ways[v] = 直前の段までで、最後の値が v となる組の数（1 段目は全て 1）
+    - 次の段の値 y の組の数 = (前の段の値 < y となる ways の和)
+    - 各段をソートしておけば、前の段の累積和をポインタ 1 つで前から足していける
+
+    計算量: O(Σ N_i log N_i)（ソート）+ O(Σ N_i)（DP）
+
+    Args:
+        stages: 各段の値のリスト [A1, A2, ..., Ak]
+
+    Returns:
+        組の数
+
+    例:
+        count_chains([[1, 5], [2, 4], [3, 6]]) -> 3   # countTriples と同じ
+        count_chains([[1], [2, 3], [4]]) -> 2
+    """
+    if not stages:
+        return 0
+
+    prev_values = sorted(stages[0])
+    prev_ways = [1] * len(prev_values)
+
+    for stage in stages[1:]:
+        values = sorted(stage)
+        ways = [0] * len(values)
+
+        i = 0
+        acc = 0  # prev_values[0:i] の組の数の和
+        for t, y in enumerate(values):
+            while i < len(prev_values) and prev_values[i] < y:
+                acc += prev_ways[i]
+                i += 1
+            ways[t] = acc
+
+        prev_values, prev_ways = values, ways
+
+    return sum(prev_ways)
+
+
+if __name__ == "__main__":
+    # テスト
+    a = [1, 5]
+    b = [2, 4]
+    c = [3, 6]
 
-result = countTriples(a, b, c)
-print(result)
+    result = countTriples(a, b, c)
+    print(result)
@@ -1,6 +1,13 @@
 """
 K番目に小さい積を二分探索で効率的に求める
 時間計算量: O(N log N log C), 空間計算量: O(1)
+
+発展版 (kth_product / kth_products):
+- 「積が target 以下の組の数」を二分探索ではなく尺取り（階段状に動く 2 つのポインタ）で数える
+  a が大きくなるほど a * b <= target となる b の範囲は狭くなるので、
+  b 側のポインタは後ろから前へ一方向にしか動かない → 1 回の判定が O(N)
+- 負の値や 0 を含んでもよい: 各配列を 負 / 0 / 正 に分け、符号の組ごとに絶対値で数える
+- 全体で O(N log N + N log C) (C: 積の範囲)
 """
 
 import bisect
@@ -40,3 +47,140 @@ def millionCellCalculation(arr1, arr2, K):
             right = mid
 
     return left
+
+
+def _split_by_sign(arr):
+    """配列を (負の値の絶対値の昇順, 0 の個数, 正の値の昇順) に分ける"""
+    neg = sorted(-x for x in arr if x < 0)
+    pos = sorted(x for x in arr if x > 0)
+    return neg, len(arr) - len(neg) - len(pos), pos
+
+
+def _count_abs_le(xs, ys, target):
+    """
+    正の値の昇順リスト xs, ys から 1 つずつ選んだ積が target 以下になる組の数（尺取り）
+
+    xs を小さい順に見ると、x * ys[j] <= target となる j の範囲 [0, j) は狭くなる一方
+    """
+    if target <= 0 or not xs or not ys:
+        return 0
+
+    count = 0
+    j = len(ys)
+    for x in xs:
+        while j > 0 and x * ys[j - 1] > target:
+            j -= 1
+        if j == 0:
+            break
+        count += j
+    return count
+
+
+def count_products_le(parts1, parts2, target):
+    """
+    積が target 以下になる組 (a, b) の数を符号の組ごとに数える O(N)
+
+    - 0 を含む組: 積は 0
+    - 正 × 正、負 × 負: 積は |a||b| >= 1 → |a||b| <= target を数える
+    - 正 × 負、負 × 正: 積は -|a||b| → |a||b| >= -target となる組
+      = 全ての組 - (|a||b| <= -target - 1 となる組)
+
+    Args:
+        parts1, parts2: _split_by_sign の結果
+        target: 閾値（整数）
+
+    Returns:
+        積が target 以下になる組の数
+    """
+    neg1, zero1, pos1 = parts1
+    neg2, zero2, pos2 = parts2
+    n1 = len(neg1) + zero1 + len(pos1)
+    n2 = len(neg2) + zero2 + len(pos2)
+
+    count = 0
+
+    if target >= 0:
+        count += zero1 * n2 + zero2 * n1 - zero1 * zero2
+
+    count += _count_abs_le(pos1, pos2, target)
+    count += _count_abs_le(neg1, neg2, target)
+
+    count += len(pos1) * len(neg2) - _count_abs_le(pos1, neg2, -target - 1)
+    count += len(neg1) * len(pos2) - _count_abs_le(neg1, pos2, -target - 1)
+
+    return count
+
+
+def _product_range(arr1, arr2):
+    """積の最小値と最大値（各配列の最小値・最大値の組のどれかになる）"""
+    corners = [a * b for a in (min(arr1), max(arr1)) for b in (min(arr2), max(arr2))]
+    return min(corners), max(corners)
+
+
+def _kth_in_range(parts1, parts2, K, left, right):
+    """[left, right] の範囲で、積が x 以下の組が K 個以上になる最小の x を求める"""
+    while left < right:
+        mid = (left + right) // 2
+        if count_products_le(parts1, parts2, mid) < K:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def kth_product(arr1, arr2, K):
+    """
+    arr1[i] * arr2[j] の全ての組の中で K 番目 (1-indexed) に小さい積を求める
+
+    millionCellCalculation と同じ答えを、負の値や 0 を含む配列でも求める
+    （入力の配列は書き換えない）
+
+    計算量: O(N log N + N log C)
+
+    Args:
+        arr1, arr2: 整数の配列
+        K: 何番目か (1 <= K <= len(arr1) * len(arr2))
+
+    Returns:
+        K 番目に小さい積
+
+    例:
+        kth_product([-2, 0, 3], [-1, 4], 2) -> -3
+        （積は [-8, -3, 0, 0, 2, 12]）
+    """
+    parts1 = _split_by_sign(arr1)
+    parts2 = _split_by_sign(arr2)
+    left, right = _product_range(arr1, arr2)
+
+    return _kth_in_range(parts1, parts2, K, left, right)
+
+
+def kth_products(arr1, arr2, ks):
+    """
+    いくつもの K について K 番目に小さい積をまとめて求める
+
+    - 符号ごとの分割とソートは 1 回だけ行う
+    - K を小さい順に処理し、答えは K について単調なので、
+      直前の答えを次の二分探索の下限にする（範囲がだんだん狭くなる）
+    - 同じ K は 1 回だけ探索する
+
+    Args:
+        arr1, arr2: 整数の配列
+        ks: K のリスト
+
+    Returns:
+        ks と同じ順の答えのリスト
+
+    例:
+        kth_products([-2, 0, 3], [-1, 4], [1, 6, 3]) -> [-8, 12, 0]
+    """
+    parts1 = _split_by_sign(arr1)
+    parts2 = _split_by_sign(arr2)
+    left, right = _product_range(arr1, arr2)
+
+    answer = {}
+    for K in sorted(set(ks)):
+        left = _kth_in_range(parts1, parts2, K, left, right)
+        answer[K] = left
+
+    return [answer[K] for K in ks]
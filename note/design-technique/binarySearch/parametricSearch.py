@@ -0,0 +1,392 @@
+"""
+答えを二分探索する (binary search on answer) ための汎用エンジン
+
+「x が条件を満たすか」の判定 P(x) が単調（ある値を境に False → True が切り替わる）なら、
+境目を二分探索で求められる（index.py の binarySearch2 を関数として使い回せる形にしたもの）
+
+- min_true / max_true: 整数の範囲で P(x) = True となる最小 / 最大の x
+- min_true_real / max_true_real: 実数の範囲で、許容誤差 tol まで境目を求める
+- parallel_min_true / parallel_max_true: 1 回に probes 個の点を複数プロセスで同時に判定する
+  範囲が 1 回で (probes + 1) 分の 1 になるので、繰り返しの回数が log2(probes + 1) 分の 1 になる
+
+判定の高速化の例:
+- can_place_cows_jump: 牛を置く次の小屋を bisect で飛ばして探す
+  1 回の判定が O(N) → O(M log N) (M: 牛の数)
+- can_shoot_all: 制限時間を sort する代わりに計数ソートで数える
+  1 回の判定が O(N log N) → O(N)
+"""
+
+import math
+import os
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List
+
+# 各ワーカープロセスが判定に使う関数
+_worker_pred = None
+
+
+def _search(evaluate, lo: int, hi: int, probes: int) -> int:
+    """
+    [lo, hi] で False ... False True ... True と並ぶ判定の境目を求める
+
+    left は常に False（または範囲外の lo - 1）、right は常に True（または hi + 1）の位置
+    (left, right) の内側に probes 個の点をほぼ等間隔にとってまとめて判定し、
+    False の最も右を left に、True の最も左を right にする
+
+    Args:
+        evaluate: x のリストを受け取り、判定結果のリストを返す関数
+        lo, hi: 探索範囲
+        probes: 1 回に判定する点の数
+
+    Returns:
+        True となる最小の x（なければ hi + 1）
+    """
+    left, right = lo - 1, hi + 1
+
+    while right - left > 1:
+        width = right - left
+        k = min(probes, width - 1)
+        xs = sorted({left + width * i // (k + 1) for i in range(1, k + 1)})
+
+        for x, ok in zip(xs, evaluate(xs)):
+            if ok:
+                right = x
+                break
+            left = x
+
+    return right
+
+
+def min_true(pred: Callable[[int], bool], lo: int, hi: int) -> int:
+    """
+    P(x) = True となる最小の整数 x を求める
+
+    Args:
+        pred: 単調な判定関数（x が大きいほど True になりやすい）
+        lo, hi: 探索範囲 [lo, hi]
+
+    Returns:
+        True となる最小の x（範囲内になければ hi + 1）
+
+    例:
+        min_true(lambda x: x * x >= 50, 0, 100) -> 8
+    """
+    return _search(lambda xs: [pred(x) for x in xs], lo, hi, 1)
+
+
+def max_true(pred: Callable[[int], bool], lo: int, hi: int) -> int:
+    """
+    P(x) = True となる最大の整数 x を求める
+
+    Args:
+        pred: 単調な判定関数（x が小さいほど True になりやすい）
+        lo, hi: 探索範囲 [lo, hi]
+
+    Returns:
+        True となる最大の x（範囲内になければ lo - 1）
+
+    例:
+        max_true(lambda x: x * x <= 50, 0, 100) -> 7
+    """
+    return _search(lambda xs: [not pred(x) for x in xs], lo, hi, 1) - 1
+
+
+def min_true_real(
+    pred: Callable[[float], bool], lo: float, hi: float, tol: float = 1e-9
+) -> float:
+    """
+    P(x) = True となる最小の実数 x を、誤差 tol 以内で求める
+
+    誤差は絶対誤差と相対誤差の大きい方で判定する
+    （値が大きいと float の刻みが tol より粗くなるため）
+
+    Args:
+        pred: 単調な判定関数（x が大きいほど True になりやすい）
+        lo, hi: 探索範囲（pred(hi) は True とみなす）
+        tol: 許容誤差
+
+    Returns:
+        境目の値（True 側）
+
+    例:
+        min_true_real(lambda x: x * x >= 2, 0, 2) -> 1.41421356...
+    """
+    while hi - lo > tol * max(1.0, abs(lo), abs(hi)):
+        mid = (lo + hi) / 2
+        # float の刻みより細かくできなくなったら終了
+        if mid <= lo or mid >= hi:
+            break
+        if pred(mid):
+            hi = mid
+        else:
+            lo = mid
+
+    return hi
+
+
+def max_true_real(
+    pred: Callable[[float], bool], lo: float, hi: float, tol: float = 1e-9
+) -> float:
+    """
+    P(x) = True となる最大の実数 x を、誤差 tol 以内で求める
+
+    Args:
+        pred: 単調な判定関数（x が小さいほど True になりやすい）
+        lo, hi: 探索範囲（pred(lo) は True とみなす）
+        tol: 許容誤差
+
+    Returns:
+        境目の値（True 側）
+    """
+    while hi - lo > tol * max(1.0, abs(lo), abs(hi)):
+        mid = (lo + hi) / 2
+        if mid <= lo or mid >= hi:
+            break
+        if pred(mid):
+            lo = mid
+        else:
+            hi = mid
+
+    return lo
+
+
+def _init_worker(pred) -> None:
+    """ワーカープロセスの起動時に、判定関数を 1 回だけ受け取る"""
+    global _worker_pred
+    _worker_pred = pred
+
+
+def _worker_eval(x: int) -> bool:
+    return _worker_pred(x)
+
+
+def _parallel_search(pred, lo: int, hi: int, probes, max_workers, negate: bool) -> int:
+    """parallel_min_true / parallel_max_true の本体"""
+    workers = max_workers or os.cpu_count() or 1
+    probes = probes or workers
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(pred,)
+    ) as executor:
+
+        def evaluate(xs: List[int]) -> List[bool]:
+            return [ok != negate for ok in executor.map(_worker_eval, xs)]
+
+        return _search(evaluate, lo, hi, probes)
+
+
+def parallel_min_true(
+    pred: Callable[[int], bool],
+    lo: int,
+    hi: int,
+    probes: int | None = None,
+    max_workers: int | None = None,
+) -> int:
+    """
+    min_true と同じ値を、1 回に probes 個の点を並列に判定しながら求める
+
+    判定関数はプロセスの起動時に 1 回だけ送る（pickle できる関数である必要がある:
+    モジュールの関数や functools.partial はよいが、lambda は不可）
+    1 回の判定が重い（大きな入力に対する貪欲法など）ときに効果がある
+
+    Args:
+        pred: 単調な判定関数
+        lo, hi: 探索範囲 [lo, hi]
+        probes: 1 回に判定する点の数 (デフォルト: プロセス数)
+        max_workers: 使うプロセス数 (デフォルト: CPU 数)
+
+    Returns:
+        True となる最小の x（範囲内になければ hi + 1）
+    """
+    return _parallel_search(pred, lo, hi, probes, max_workers, negate=False)
+
+
+def parallel_max_true(
+    pred: Callable[[int], bool],
+    lo: int,
+    hi: int,
+    probes: int | None = None,
+    max_workers: int | None = None,
+) -> int:
+    """
+    max_true と同じ値を、1 回に probes 個の点を並列に判定しながら求める
+
+    Returns:
+        True となる最大の x（範囲内になければ lo - 1）
+    """
+    return _parallel_search(pred, lo, hi, probes, max_workers, negate=True) - 1
+
+
+def can_place_cows_jump(positions: List[int], min_distance: int, cows: int) -> bool:
+    """
+    指定された最小距離で cows 匹の牛を配置できるかを判定する（bisect で次の小屋へ飛ぶ版）
+
+    aggressiveCows.py の can_place_cows は小屋を 1 つずつ見るが、
+    次に置ける小屋は「直前の位置 + min_distance 以上の最初の小屋」なので二分探索で求まる
+
+    計算量: O(cows log N)
+
+    Args:
+        positions: ソート済みの小屋の座標リスト
+        min_distance: 牛同士の最小距離
+        cows: 配置する牛の数
+
+    Returns:
+        配置可能なら True
+    """
+    if not positions or cows <= 0:
+        return False
+
+    N = len(positions)
+    i = 0
+    for _ in range(cows - 1):
+        i = bisect_left(positions, positions[i] + min_distance, i + 1)
+        if i == N:
+            return False
+
+    return True
+
+
+class _CowsPredicate:
+    """pickle できる判定関数 (d → can_place_cows_jump(positions, d, cows))"""
+
+    def __init__(self, positions: List[int], cows: int):
+        self.positions = positions
+        self.cows = cows
+
+    def __call__(self, min_distance: int) -> bool:
+        return can_place_cows_jump(self.positions, min_distance, self.cows)
+
+
+def aggressive_cows_search(
+    positions: List[int], cows: int, max_workers: int | None = 1
+) -> int:
+    """
+    選んだ牛同士の最小距離の最大値を求める（aggressive_cows の高速版）
+
+    - 判定は can_place_cows_jump
+    - 上限は (最後の小屋 - 最初の小屋) // (cows - 1)（等間隔に置けたときの距離）
+
+    Args:
+        positions: 小屋の座標リスト
+        cows: 配置する牛の数
+        max_workers: 1 なら逐次、それ以外は parallel_max_true で並列に判定する
+
+    Returns:
+        選んだ牛同士の最小距離の最大値
+
+    例:
+        aggressive_cows_search([1, 2, 8, 4, 9], 3) -> 3
+    """
+    if not positions or cows <= 0 or cows > len(positions):
+        return 0
+
+    sorted_positions = sorted(positions)
+    if cows == 1:
+        return sorted_positions[-1] - sorted_positions[0]
+
+    hi = (sorted_positions[-1] - sorted_positions[0]) // (cows - 1)
+
+    # lambda ではなくクラスのインスタンスにしておくと、並列版でもプロセスに送れる
+    pred = _CowsPredicate(sorted_positions, cows)
+
+    if max_workers == 1:
+        return max_true(pred, 0, hi)
+    return parallel_max_true(pred, 0, hi, max_workers=max_workers)
+
+
+def can_shoot_all(h: List[int], s: List[int], height: int) -> bool:
+    """
+    全ての風船を高度 height 以下のうちに割れるかを判定する（shootingKing の判定部分）
+
+    風船 i の制限時間 t[i] = (height - h[i]) // s[i] を求め、
+    制限時間がきつい順に 1 秒ごとに割っていけるか（どの j でも t[i] <= j の風船が j + 1 個以下か）を調べる
+
+    t.sort() の代わりに計数ソート:
+    - 制限時間が N - 1 以上の風船は、いつ割っても間に合う → N - 1 にまとめる
+    - すると値の範囲が [0, N - 1] になり、個数を数えるだけで O(N)
+
+    Args:
+        h: 各風船の初期高度
+        s: 各風船の上昇速度
+        height: 判定する高度
+
+    Returns:
+        全ての風船を割れるなら True
+    """
+    N = len(h)
+    num = [0] * N
+
+    for h_i, s_i in zip(h, s):
+        if height < h_i:
+            return False
+        num[min((height - h_i) // s_i, N - 1)] += 1
+
+    # 制限時間が j 以下の風船の数 <= j + 1 か
+    total = 0
+    for j in range(N):
+        total += num[j]
+        if total > j + 1:
+            return False
+
+    return True
+
+
+class _ShootingPredicate:
+    """pickle できる判定関数 (height → can_shoot_all(h, s, height))"""
+
+    def __init__(self, h: List[int], s: List[int]):
+        self.h = h
+        self.s = s
+
+    def __call__(self, height: int) -> bool:
+        return can_shoot_all(self.h, self.s, height)
+
+
+def shooting_king(
+    h: List[int], s: List[int], max_workers: int | None = 1
+) -> int:
+    """
+    全ての風船を割るときの、割った高度の最大値の最小値を求める（shootingKing の高速版）
+
+    - 判定は can_shoot_all（計数ソート）
+    - 範囲を INF ではなく入力から決める:
+      下限 max(h)（これより低いと初期高度で既に超えている）、
+      上限 max(h[i] + s[i] * (N - 1))（どの順で割っても間に合う）
+
+    Args:
+        h: 各風船の初期高度
+        s: 各風船の上昇速度
+        max_workers: 1 なら逐次、それ以外は parallel_min_true で並列に判定する
+
+    Returns:
+        割った高度の最大値の最小値
+
+    例:
+        shooting_king([5, 12, 14, 21], [6, 4, 7, 2]) -> 23
+    """
+    N = len(h)
+    if N == 0:
+        return 0
+
+    lo = max(h)
+    hi = max(h_i + s_i * (N - 1) for h_i, s_i in zip(h, s))
+
+    pred = _ShootingPredicate(h, s)
+
+    if max_workers == 1:
+        return min_true(pred, lo, hi)
+    return parallel_min_true(pred, lo, hi, max_workers=max_workers)
+
+
+def main():
+    """使用例"""
+    print(aggressive_cows_search([1, 2, 8, 4, 9], 3))  # 3
+    print(shooting_king([5, 12, 14, 21], [6, 4, 7, 2]))  # 23
+    print(min_true_real(lambda x: x * x >= 2, 0, 2))  # 1.414...
+    print(math.isclose(max_true_real(lambda x: x**3 <= 10, 0, 10), 10 ** (1 / 3)))  # True
+
+
+if __name__ == "__main__":
+    main()
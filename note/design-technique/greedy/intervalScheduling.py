@@ -1,7 +1,19 @@
 """
 区間スケジューリング問題に対する貪欲法
+
+発展版（選んだ区間そのものを返す）:
+- select_intervals: 区間の数が最大になる選び方 O(N log N)
+- weighted_interval_scheduling: 重み付き区間の重みの合計が最大になる選び方
+  終了時刻でソート + 二分探索で「直前に置ける区間」を求める DP O(N log N)
+- minimum_rooms: 全区間を重ならないように最少の部屋（機械）に割り当てる
+  終了時刻の最小ヒープを使う O(N log N)
+- OnlineIntervalScheduler / OnlineRoomAllocator: 開始時刻の順に届く区間を 1 つずつ受け取る版
+
+区間は [開始時刻, 終了時刻) とみなす（終了時刻と次の開始時刻が等しければ重ならない）
 """
 
+import heapq
+from bisect import bisect_right
 from typing import List, Tuple
 
 
@@ -36,6 +48,215 @@ def solve_interval_scheduling(intervals: List[Tuple[int, int]]) -> int:
     return res
 
 
+def select_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    区間スケジューリング問題を貪欲法で解き、選んだ区間を返す
+
+    solve_interval_scheduling と同じく終了時刻が早い順に貪欲に選ぶ
+    終了時刻が同じなら開始時刻の昇順にする（長さ 0 の区間 (t, t) を、t で終わる
+    他の区間の後ろで選べるように）
+
+    Args:
+        intervals: (開始時刻, 終了時刻) のタプルのリスト
+
+    Returns:
+        選んだ区間のリスト（終了時刻の昇順）
+
+    例:
+        select_intervals([(1, 4), (3, 5), (4, 7), (6, 8)]) -> [(1, 4), (4, 7)]
+        select_intervals([(10, 10), (8, 10)]) -> [(8, 10), (10, 10)]   # 長さ 0 の区間
+    """
+    chosen = []
+    current_end_time = None
+
+    for start, end in sorted(intervals, key=lambda x: (x[1], x[0])):
+        if current_end_time is not None and start < current_end_time:
+            continue
+
+        chosen.append((start, end))
+        current_end_time = end
+
+    return chosen
+
+
+def weighted_interval_scheduling(
+    intervals: List[Tuple[int, int, int]]
+) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """
+    重み付き区間スケジューリング問題を DP で解く
+
+    アルゴリズム:
+    1. 区間を終了時刻の昇順に並べる（終了時刻が同じなら開始時刻の昇順:
+       長さ 0 の区間 (t, t) は、t で終わる他の区間の後ろに来る）
+    2. p[j] = 区間 j と重ならない（終了時刻 <= 区間 j の開始時刻）区間の個数
+       終了時刻の配列を二分探索 (bisect_right) して求める
+    3. dp[j + 1] = 先頭 j + 1 個の区間から選んだときの重みの最大値
+       = max(dp[j]            （区間 j を選ばない）,
+             dp[p[j]] + w[j]  （区間 j を選ぶ）)
+    4. dp を後ろからたどって、選んだ区間を復元する
+
+    計算量: O(N log N)
+
+    Args:
+        intervals: (開始時刻, 終了時刻, 重み) のタプルのリスト
+
+    Returns:
+        (重みの合計の最大値, 選んだ区間のリスト（終了時刻の昇順）) のタプル
+
+    例:
+        weighted_interval_scheduling([(1, 4, 2), (3, 5, 4), (4, 7, 3)]) -> (5, [(1, 4, 2), (4, 7, 3)])
+        weighted_interval_scheduling([(5, 5, 1)]) -> (1, [(5, 5, 1)])   # 長さ 0 の区間
+    """
+    jobs = sorted(intervals, key=lambda x: (x[1], x[0]))
+    ends = [end for _, end, _ in jobs]
+    N = len(jobs)
+
+    # 探索は区間 j より前（終了時刻が同じかそれ以前）の区間に限る
+    # （開始 = 終了の長さ 0 の区間が自分自身や後ろの区間を数えないように）
+    p = [bisect_right(ends, start, 0, j) for j, (start, _, _) in enumerate(jobs)]
+
+    dp = [0] * (N + 1)
+    for j in range(N):
+        dp[j + 1] = max(dp[j], dp[p[j]] + jobs[j][2])
+
+    # 復元: dp[j + 1] が dp[j] と等しければ区間 j は選ばなくてよい
+    chosen = []
+    j = N
+    while j > 0:
+        if dp[j] == dp[j - 1]:
+            j -= 1
+        else:
+            chosen.append(jobs[j - 1])
+            j = p[j - 1]
+    chosen.reverse()
+
+    return dp[N], chosen
+
+
+def minimum_rooms(
+    intervals: List[Tuple[int, int]]
+) -> Tuple[int, List[List[Tuple[int, int]]]]:
+    """
+    全ての区間を重ならないように部屋（機械）に割り当て、部屋の数を最小にする（区間分割問題）
+
+    アルゴリズム:
+    1. 区間を開始時刻の昇順に並べる
+    2. 使用中の部屋を (終了時刻, 部屋番号) の最小ヒープで持つ
+    3. 最も早く空く部屋が区間の開始時刻までに空いていればその部屋を使い、
+       空いていなければ新しい部屋を作る
+
+    部屋の数 = 同時に重なっている区間の数の最大値 になる（これより少なくはできない）
+
+    計算量: O(N log N)
+
+    Args:
+        intervals: (開始時刻, 終了時刻) のタプルのリスト
+
+    Returns:
+        (部屋の数, rooms) のタプル
+        - rooms[r]: 部屋 r に割り当てた区間のリスト（開始時刻の昇順）
+
+    例:
+        minimum_rooms([(1, 4), (2, 5), (4, 6)]) -> (2, [[(1, 4), (4, 6)], [(2, 5)]])
+    """
+    rooms = []
+    busy = []  # (終了時刻, 部屋番号)
+
+    for start, end in sorted(intervals):
+        if busy and busy[0][0] <= start:
+            _, r = busy[0]
+            heapq.heapreplace(busy, (end, r))
+        else:
+            r = len(rooms)
+            rooms.append([])
+            heapq.heappush(busy, (end, r))
+
+        rooms[r].append((start, end))
+
+    return len(rooms), rooms
+
+
+class OnlineIntervalScheduler:
+    """
+    開始時刻の順に届く区間を 1 つずつ受け取り、
+    区間の数が最大になる選び方をその時点ごとに保つ
+
+    区間 (s, e) が届いたとき（最後に選んだ区間を (s', e') とする）:
+    - s >= e' なら、そのまま選ぶ
+    - s < e' でも e < e' なら、最後に選んだ区間と入れ替える
+      （s >= s' >= その前の区間の終了時刻 なので重ならず、終了時刻が早くなる分だけ得）
+    - それ以外は選ばない
+
+    計算量: 1 区間あたり O(1)
+    """
+
+    def __init__(self):
+        self.chosen: List[Tuple[int, int]] = []
+        self.last_start = None
+
+    def add(self, start: int, end: int) -> bool:
+        """
+        区間を追加する。選んだら True を返す
+
+        Raises:
+            ValueError: 開始時刻が前に追加した区間より早いとき
+        """
+        if self.last_start is not None and start < self.last_start:
+            raise ValueError("intervals must arrive in non-decreasing order of start time")
+        self.last_start = start
+
+        if not self.chosen or self.chosen[-1][1] <= start:
+            self.chosen.append((start, end))
+            return True
+
+        if end < self.chosen[-1][1]:
+            self.chosen[-1] = (start, end)
+            return True
+
+        return False
+
+    def count(self) -> int:
+        """これまでに届いた区間から選べる最大の区間数"""
+        return len(self.chosen)
+
+
+class OnlineRoomAllocator:
+    """
+    開始時刻の順に届く区間を 1 つずつ部屋に割り当てる（minimum_rooms のオンライン版）
+
+    届いた時点で部屋を決めても、部屋の数は minimum_rooms と同じ最小値になる
+
+    計算量: 1 区間あたり O(log R) (R: 部屋の数)
+    """
+
+    def __init__(self):
+        self.rooms: List[List[Tuple[int, int]]] = []
+        self.busy: List[Tuple[int, int]] = []
+        self.last_start = None
+
+    def add(self, start: int, end: int) -> int:
+        """
+        区間を追加し、割り当てた部屋の番号を返す
+
+        Raises:
+            ValueError: 開始時刻が前に追加した区間より早いとき
+        """
+        if self.last_start is not None and start < self.last_start:
+            raise ValueError("intervals must arrive in non-decreasing order of start time")
+        self.last_start = start
+
+        if self.busy and self.busy[0][0] <= start:
+            _, r = self.busy[0]
+            heapq.heapreplace(self.busy, (end, r))
+        else:
+            r = len(self.rooms)
+            self.rooms.append([])
+            heapq.heappush(self.busy, (end, r))
+
+        self.rooms[r].append((start, end))
+        return r
+
+
 def main():
     """メイン関数: 標準入力から区間を読み込み、結果を出力"""
     # 入力
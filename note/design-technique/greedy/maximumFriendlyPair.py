@@ -16,8 +16,17 @@ AtCoder Regular Contest 092 C - 2D Plane 2N Points
 重要な観察:
 - y座標でソートすることで、y座標の条件は自動的に満たされる
 - 各赤い点に対して、使える青い点の中でx座標が最小のものを貪欲に選ぶ
+
+maximum_friendly_pairs は各赤い点で全ての青い点を見るので O(N^2) かかる
+大きな入力向けの発展版:
+- match_friendly_pairs_sweep: x座標の順に点を掃引し（スイープライン）、
+  まだペアになっていない赤い点のy座標を Fenwick 木で管理する O(N log N)
+- hopcroft_karp: 任意の条件（述語）でのペアを二部マッチングとして求める
+  O(E √V) (V: 点の数, E: 条件を満たす組の数)
 """
 
+from bisect import bisect_left
+
 
 def maximum_friendly_pairs(red_points: list[tuple[int, int]],
                           blue_points: list[tuple[int, int]]) -> int:
@@ -77,6 +86,237 @@ def maximum_friendly_pairs(red_points: list[tuple[int, int]],
     return pair_count
 
 
+def match_friendly_pairs_sweep(red_points: list[tuple[int, int]],
+                               blue_points: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    仲良しペアを最大数だけ作り、(赤の番号, 青の番号) のリストで返す（スイープライン）
+
+    アルゴリズム:
+    1. 全ての点を x 座標の昇順に並べる（同じ x なら青を先にする → rx < bx を厳密に守る）
+    2. 赤い点が来たら「待っている赤」に入れる
+    3. 青い点 (bx, by) が来たら、待っている赤のうち ry < by で ry が最大のものとペアにする
+       - 待っている赤は全て rx < bx を満たす
+       - y の条件を満たす中で最も厳しい（y が大きい）赤を使い、
+         y の小さい赤を後の青のために残す
+
+    待っている赤の管理:
+    - 赤い点の y 座標を昇順に並べた位置（同じ y でも別の位置）を Fenwick 木の添字にし、
+      待っている赤の個数を持つ
+    - ry < by となる位置は [0, bisect_left(ys, by)) → その中の待っている赤の個数 c を求め、
+      c 番目（= 最も右）の位置を Fenwick 木の上で二分探索する
+
+    計算量: O(N log N)
+
+    Args:
+        red_points: 赤い点のリスト [(x, y), ...]
+        blue_points: 青い点のリスト [(x, y), ...]
+
+    Returns:
+        ペアのリスト [(赤い点の番号, 青い点の番号), ...]（番号は入力の添字）
+
+    例:
+        match_friendly_pairs_sweep([(0, 0), (1, 3)], [(2, 2), (4, 4)]) -> [(0, 0), (1, 1)]
+    """
+    R = len(red_points)
+
+    # 赤い点の y 座標の昇順の位置
+    order = sorted(range(R), key=lambda i: red_points[i][1])
+    ys = [red_points[i][1] for i in order]
+    slot = [0] * R
+    for pos, i in enumerate(order):
+        slot[i] = pos
+
+    tree = [0] * (R + 1)
+    log = R.bit_length()
+
+    def add(pos: int, delta: int) -> None:
+        i = pos + 1
+        while i <= R:
+            tree[i] += delta
+            i += i & -i
+
+    def count(pos: int) -> int:
+        """位置 [0, pos) の待っている赤の個数"""
+        total = 0
+        while pos > 0:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def select(c: int) -> int:
+        """待っている赤のうち c 番目 (1-indexed) の位置"""
+        pos = 0
+        for k in range(log, -1, -1):
+            nxt = pos + (1 << k)
+            if nxt <= R and tree[nxt] < c:
+                pos = nxt
+                c -= tree[nxt]
+        return pos
+
+    # (x, 0 = 青 / 1 = 赤, 番号) の順に掃引する
+    events = [(x, 1, i) for i, (x, _) in enumerate(red_points)]
+    events += [(x, 0, j) for j, (x, _) in enumerate(blue_points)]
+    events.sort()
+
+    pairs = []
+    for _, is_red, i in events:
+        if is_red:
+            add(slot[i], 1)
+            continue
+
+        by = blue_points[i][1]
+        c = count(bisect_left(ys, by))
+        if c == 0:
+            continue
+
+        pos = select(c)
+        add(pos, -1)
+        pairs.append((order[pos], i))
+
+    return pairs
+
+
+def maximum_friendly_pairs_sweep(red_points: list[tuple[int, int]],
+                                 blue_points: list[tuple[int, int]]) -> int:
+    """
+    最大仲良しペア数を O(N log N) で計算する
+
+    Args:
+        red_points: 赤い点のリスト [(x, y), ...]
+        blue_points: 青い点のリスト [(x, y), ...]
+
+    Returns:
+        作成可能な最大ペア数
+    """
+    return len(match_friendly_pairs_sweep(red_points, blue_points))
+
+
+def hopcroft_karp(adj: list[list[int]], n_right: int) -> tuple[int, list[int]]:
+    """
+    二部グラフの最大マッチングを Hopcroft-Karp 法で求める
+
+    アルゴリズム（1 フェーズ）:
+    1. BFS: まだマッチしていない左の頂点から交互路をたどり、左の頂点に層の番号をつける
+       マッチしていない右の頂点に初めて届いた層 (limit) で打ち切る
+    2. DFS: 層の番号が 1 ずつ増える辺だけを使って、マッチしていない右の頂点までの
+       最短の増加路（層 limit の頂点から、マッチしていない右の頂点へ出る路）を、
+       頂点を共有しないように見つけられるだけ見つけて反転する
+    3. 増加路がなくなるまで繰り返す（フェーズ数は O(√V)）
+
+    DFS は再帰の代わりにスタックを使う（長い増加路でも再帰の上限にかからない）
+
+    計算量: O(E √V)
+
+    Args:
+        adj: adj[u] = 左の頂点 u とつながる右の頂点のリスト
+        n_right: 右の頂点数
+
+    Returns:
+        (マッチングの大きさ, match_left) のタプル
+        - match_left[u]: 左の頂点 u とペアになった右の頂点（なければ -1）
+
+    例:
+        hopcroft_karp([[0, 1], [0]], 2) -> (2, [1, 0])
+    """
+    n_left = len(adj)
+    match_left = [-1] * n_left
+    match_right = [-1] * n_right
+    size = 0
+
+    while True:
+        # === 1. BFS で層を作る ===
+        level = [-1] * n_left
+        queue = [u for u in range(n_left) if match_left[u] == -1]
+        for u in queue:
+            level[u] = 0
+
+        # limit = マッチしていない右の頂点に初めて届いた左の頂点の層（最短の増加路の長さ）
+        # limit が決まったら、それより深い層は作らない
+        limit = -1
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            if limit != -1 and level[u] > limit:
+                break
+            for v in adj[u]:
+                w = match_right[v]
+                if w == -1:
+                    if limit == -1:
+                        limit = level[u]
+                elif level[w] == -1 and limit == -1:
+                    level[w] = level[u] + 1
+                    queue.append(w)
+
+        if limit == -1:
+            break
+
+        # === 2. DFS で増加路を探して反転する ===
+        # it[u] = u の辺のうち次に調べる位置
+        it = [0] * n_left
+        for s in range(n_left):
+            if match_left[s] != -1:
+                continue
+
+            stack = [s]
+            while stack:
+                u = stack[-1]
+                if it[u] == len(adj[u]):
+                    # u からは増加路がない → このフェーズではもう使わない
+                    level[u] = -1
+                    stack.pop()
+                    continue
+
+                v = adj[u][it[u]]
+                w = match_right[v]
+                if w == -1 and level[u] == limit:
+                    # 最短の長さの増加路が見つかった
+                    # スタック上の各頂点を、今見ている辺の先とペアにし直す
+                    for x in stack:
+                        y = adj[x][it[x]]
+                        match_left[x] = y
+                        match_right[y] = x
+                        level[x] = -1
+                    size += 1
+                    break
+
+                if w != -1 and level[u] < limit and level[w] == level[u] + 1:
+                    stack.append(w)
+                else:
+                    it[u] += 1
+
+    return size, match_left
+
+
+def maximum_pairs_by_predicate(red_points: list, blue_points: list, can_pair) -> list[tuple[int, int]]:
+    """
+    任意の条件 can_pair(赤, 青) でペアを最大数だけ作る（Hopcroft-Karp 法）
+
+    仲良しペア以外の条件（例: 両方の座標の差が d 以内）にも使える
+    全ての組で can_pair を呼ぶので、辺を作るのに O(N M) かかる
+
+    Args:
+        red_points: 赤い点のリスト
+        blue_points: 青い点のリスト
+        can_pair: ペアにできるなら True を返す関数
+
+    Returns:
+        ペアのリスト [(赤い点の番号, 青い点の番号), ...]
+
+    例:
+        dominates = lambda r, b: r[0] < b[0] and r[1] < b[1]
+        maximum_pairs_by_predicate(red_points, blue_points, dominates)
+        → len(...) は maximum_friendly_pairs_sweep と同じ
+    """
+    adj = [
+        [j for j, b in enumerate(blue_points) if can_pair(r, b)]
+        for r in red_points
+    ]
+    _, match_left = hopcroft_karp(adj, len(blue_points))
+
+    return [(i, j) for i, j in enumerate(match_left) if j != -1]
+
+
 def main() -> None:
     """メイン処理"""
     # 入力
@@ -0,0 +1,242 @@
+"""
+Batched and Multi-Source Dijkstra
+
+Two ways to run Dijkstra's algorithm from many sources at once.
+
+1. Batch (independent searches from each source)
+   - The graph is packed into CSR (Compressed Sparse Row) form:
+     offsets[v] .. offsets[v + 1] is the range of edges leaving v in targets/weights
+   - The three arrays are placed in one shared-memory block,
+     so worker processes read the same buffer instead of receiving a pickled copy
+   - Each source is searched in a ProcessPoolExecutor
+
+2. Multi-source (one search seeded with every source)
+   - All sources start at distance 0 in the same priority queue
+   - dist[v] = distance to the nearest source, origin[v] = which source that is
+   - Useful for nearest-facility queries
+
+Complexity:
+- Batch: O(S (V + E) log V) total work, divided across processes
+- Multi-source: O((V + E) log V), the same as a single Dijkstra
+"""
+
+import heapq
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+
+from problems.dijkstra import INF, Graph
+
+# CSR buffers attached by each worker process
+_worker_shm: SharedMemory | None = None
+_worker_csr: tuple[memoryview, memoryview, memoryview] | None = None
+
+
+def to_csr(graph: Graph) -> tuple[array, array, array]:
+    """
+    Converts an adjacency list of Edge objects into CSR arrays.
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+
+    Returns:
+        (offsets, targets, weights) tuple
+        - offsets: array('q') of length V + 1
+        - targets: array('q') of length E
+        - weights: array('d') of length E
+
+    Example:
+        graph = [[Edge(1, 4), Edge(2, 1)], [], [Edge(1, 2)]]
+        to_csr(graph) -> ([0, 2, 2, 3], [1, 2, 1], [4.0, 1.0, 2.0])
+    """
+    offsets = array("q", [0])
+    targets = array("q")
+    weights = array("d")
+
+    for edges in graph:
+        for edge in edges:
+            targets.append(edge.to)
+            weights.append(edge.weight)
+        offsets.append(len(targets))
+
+    return offsets, targets, weights
+
+
+def dijkstra_csr(offsets, targets, weights, start: int) -> list[float]:
+    """
+    Dijkstra's algorithm that reads the graph from CSR arrays.
+
+    Accepts anything indexable (array, memoryview over shared memory, list).
+
+    Args:
+        offsets, targets, weights: CSR arrays from to_csr
+        start: Starting vertex
+
+    Returns:
+        List of shortest distances to each vertex
+    """
+    N = len(offsets) - 1
+    dist = [INF] * N
+    dist[start] = 0
+
+    pq = [(0, start)]
+
+    while pq:
+        d, v = heapq.heappop(pq)
+
+        # Skip stale entries
+        if d > dist[v]:
+            continue
+
+        for i in range(offsets[v], offsets[v + 1]):
+            to = targets[i]
+            nd = d + weights[i]
+            if nd < dist[to]:
+                dist[to] = nd
+                heapq.heappush(pq, (nd, to))
+
+    return dist
+
+
+def _csr_views(buf: memoryview, N: int, E: int):
+    """Splits one shared buffer into the offsets/targets/weights views."""
+    offsets_end = (N + 1) * 8
+    targets_end = offsets_end + E * 8
+    offsets = buf[:offsets_end].cast("q")
+    targets = buf[offsets_end:targets_end].cast("q")
+    weights = buf[targets_end : targets_end + E * 8].cast("d")
+    return offsets, targets, weights
+
+
+def _init_worker(name: str, N: int, E: int) -> None:
+    """Attaches the shared CSR buffer once per worker process."""
+    global _worker_shm, _worker_csr
+    _worker_shm = SharedMemory(name=name)
+    _worker_csr = _csr_views(_worker_shm.buf, N, E)
+
+    # Detach when the worker exits. atexit handlers are skipped by
+    # fork/forkserver workers (they leave through os._exit), while
+    # multiprocessing finalizers run under every start method.
+    Finalize(None, _release_worker, exitpriority=0)
+
+
+def _release_worker() -> None:
+    """Releases the CSR views and closes the worker's handle to the buffer."""
+    global _worker_shm, _worker_csr
+    if _worker_csr is not None:
+        for view in _worker_csr:
+            view.release()
+        _worker_csr = None
+    if _worker_shm is not None:
+        _worker_shm.close()
+        _worker_shm = None
+
+
+def _worker_search(s: int) -> array:
+    offsets, targets, weights = _worker_csr
+    return array("d", dijkstra_csr(offsets, targets, weights, s))
+
+
+def dijkstra_batch(
+    graph: Graph,
+    sources: list[int],
+    max_workers: int | None = None,
+    chunksize: int = 16,
+) -> list[array]:
+    """
+    Runs an independent Dijkstra search from each source in parallel.
+
+    The graph is converted to CSR and copied into shared memory once.
+    Workers only receive the block name and the sizes, so the cost of
+    starting the pool does not grow with the size of the graph.
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+        sources: Starting vertices
+        max_workers: Number of worker processes (None: number of CPUs)
+        chunksize: Number of sources sent to a worker at once
+
+    Returns:
+        List of distance rows, rows[i][v] = distance from sources[i] to v
+
+    Example:
+        rows = dijkstra_batch(graph, [0, 3])
+        rows[1][2] -> shortest distance from 3 to 2
+    """
+    offsets, targets, weights = to_csr(graph)
+    N = len(graph)
+    E = len(targets)
+
+    # Allocate at least 1 byte: SharedMemory rejects size 0
+    size = max(1, (N + 1) * 8 + E * 16)
+    shm = SharedMemory(create=True, size=size)
+    try:
+        views = _csr_views(shm.buf, N, E)
+        for view, data in zip(views, (offsets, targets, weights)):
+            view[:] = data
+            view.release()
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(shm.name, N, E),
+        ) as executor:
+            return list(executor.map(_worker_search, sources, chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def multi_source_dijkstra(
+    graph: Graph, sources: list[int]
+) -> tuple[list[float], list[int]]:
+    """
+    Finds the distance from every vertex to its nearest source.
+
+    All sources are pushed with distance 0 at the start, as if a virtual
+    vertex had 0-weight edges to each of them. The label of the source is
+    carried along each relaxation, so every vertex also learns which
+    source it is closest to.
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+        sources: Starting vertices (e.g. facilities)
+
+    Returns:
+        (dist, origin) tuple
+        - dist[v]: Distance from the nearest source to v (INF if unreachable)
+        - origin[v]: The nearest source (-1 if unreachable)
+
+    Example:
+        # 0 -1- 1 -1- 2 -5- 3 (edges both ways), facilities at 0 and 3
+        multi_source_dijkstra(graph, [0, 3]) -> ([0, 1, 2, 0], [0, 0, 0, 3])
+    """
+    N = len(graph)
+    dist = [INF] * N
+    origin = [-1] * N
+
+    pq = []
+    for s in sources:
+        if dist[s] == 0:
+            continue
+        dist[s] = 0
+        origin[s] = s
+        pq.append((0, s))
+    heapq.heapify(pq)
+
+    while pq:
+        d, v = heapq.heappop(pq)
+
+        # Skip stale entries
+        if d > dist[v]:
+            continue
+
+        for edge in graph[v]:
+            nd = d + edge.weight
+            if nd < dist[edge.to]:
+                dist[edge.to] = nd
+                origin[edge.to] = origin[v]
+                heapq.heappush(pq, (nd, edge.to))
+
+    return dist, origin
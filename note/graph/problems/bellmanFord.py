@@ -7,11 +7,21 @@ code 14.2 ベルマン・フォード法の実装
 計算量: O(V * E)
 - V: 頂点数
 - E: 辺数
+
+高速化版:
+- spfa: 更新された頂点だけをキューで管理する Bellman-Ford (SLF/LLL 付き)
+- bellman_ford_edge_list: 辺リストをフラットな配列で持ち、1 ラウンドをまとめて緩和する版
+- どちらも負閉路そのものと、距離が -INF になる頂点集合を返す
 """
 
+from collections import deque
+
 # 無限大を表す値
 INF = float("inf")
 
+# SPFA の LLL で、1 回の取り出しの前に先頭を末尾へ回す回数の上限
+LLL_MAX_ROTATIONS = 8
+
 
 class Edge:
     """辺を表すクラス（重み付き有向辺）"""
@@ -71,12 +81,380 @@ def bellmanFord(graph: Graph, start: int) -> tuple[list[float], bool]:
         - dist: 各頂点への最短距離（負閉路がある場合は無意味）
         - has_negative_cycle: 負閉路が存在するか
     """
+    dist, _, has_negative_cycle = bellmanFord_with_prev(graph, start)
+    return dist, has_negative_cycle
+
+
+def _walk_to_cycle(prev: list[int], v: int) -> list[int]:
+    """
+    先行頂点配列 prev を v から辿って閉路を取り出す
+
+    v から prev を N 回辿ると、閉路があれば必ず閉路上の頂点に到達する
+    （N 回目のラウンドで更新された頂点は負閉路から到達可能なため）
+
+    Args:
+        prev: prev[v] = v の直前の頂点（なければ -1）
+        v: 辿り始める頂点
+
+    Returns:
+        閉路上の頂点を辺の向きの順に並べたリスト（閉路がなければ空リスト）
+    """
+    N = len(prev)
+
+    # N 回辿って閉路の内側に入る
+    for _ in range(N):
+        if v == -1:
+            return []
+        v = prev[v]
+    if v == -1:
+        return []
+
+    # 閉路を一周して頂点を集める（prev は逆向きなので最後に反転する）
+    cycle = [v]
+    u = prev[v]
+    while u != v:
+        cycle.append(u)
+        u = prev[u]
+    cycle.reverse()
+
+    return cycle
+
+
+def _find_cycle_in_prev(prev: list[int]) -> list[int]:
+    """
+    先行頂点グラフ（各頂点から prev[v] への辺）に含まれる閉路を 1 つ探す
+
+    緩和は真に小さくなるときだけ行うので、先行頂点グラフに閉路があれば
+    それは必ず負閉路になる
+
+    計算量: O(V)
+
+    Returns:
+        閉路上の頂点のリスト（閉路がなければ空リスト）
+    """
+    N = len(prev)
+
+    # 0: 未訪問, 1: 今回の探索で訪問中, 2: 探索済み
+    state = [0] * N
+
+    for s in range(N):
+        v = s
+        while v != -1 and state[v] == 0:
+            state[v] = 1
+            v = prev[v]
+
+        # 今回の探索中の頂点に戻ってきた = 閉路
+        if v != -1 and state[v] == 1:
+            return _walk_to_cycle(prev, v)
+
+        v = s
+        while v != -1 and state[v] == 1:
+            state[v] = 2
+            v = prev[v]
+
+    return []
+
+
+def _spread_negative_infinity(
+    dist: list[float], seeds: list[int], adj: list[list[int]]
+) -> None:
+    """
+    seeds から到達可能な全頂点の距離を -INF にする (BFS)
+
+    負閉路から到達できる頂点は、閉路を何周でも回れるので距離が -INF になる
+
+    Args:
+        dist: 距離配列（書き換えられる）
+        seeds: 負閉路から到達可能と分かっている頂点
+        adj: adj[v] = v から行ける頂点のリスト
+    """
+    todo = deque()
+    for v in seeds:
+        if dist[v] != -INF:
+            dist[v] = -INF
+            todo.append(v)
+
+    while todo:
+        v = todo.popleft()
+        for x in adj[v]:
+            if dist[x] == -INF:
+                continue
+            dist[x] = -INF
+            todo.append(x)
+
+
+def spfa(
+    graph: Graph, start: int, use_slf: bool = True, use_lll: bool = True
+) -> tuple[list[float], list[int]]:
+    """
+    SPFA (Shortest Path Faster Algorithm) で単一始点最短経路を求める
+
+    Bellman-Ford は毎ラウンド全ての辺を調べるが、距離が変わっていない頂点から
+    出る辺を緩和しても何も起きない。そこで「距離が更新された頂点」だけを
+    FIFO キューに積み、そこから出る辺だけを緩和する
+
+    ヒューリスティック:
+    - SLF (Small Label First): 積む頂点の距離がキュー先頭より小さければ先頭に積む
+    - LLL (Large Label Last): 先頭の距離がキュー内の平均より大きければ末尾に回す
+      どちらも「距離の小さい頂点から処理する」ことで無駄な再緩和を減らす
+      （末尾に回すのは 1 回の取り出しにつき LLL_MAX_ROTATIONS 回まで。
+        キューの長さだけ回すと 1 回の取り出しが O(キューの長さ) になる）
+
+    負閉路の検出:
+    - cnt[v] = 現在の dist[v] を実現する経路の辺数
+    - cnt[v] >= N になったら、その経路は同じ頂点を 2 回通る = 負閉路を経由している
+    - その頂点はそれ以上緩和せずに凍結し、最後に凍結した頂点から到達可能な頂点を -INF にする
+    - cnt が N に届くまでには負閉路を何周も回ることがあるので、N 回緩和するごとに
+      先行頂点グラフの閉路も探す (O(V)、緩和 1 回あたりならし O(1))
+      見つかったら閉路から到達可能な頂点をその場で -INF にして凍結し、以降は処理しない
+
+    計算量: 最悪 O(V * E)（Bellman-Ford と同じ）、疎なグラフでは平均的にずっと速い
+
+    Args:
+        graph: 重み付き有向グラフ（隣接リスト表現）
+        start: 始点
+        use_slf: SLF ヒューリスティックを使うか
+        use_lll: LLL ヒューリスティックを使うか
+
+    Returns:
+        (dist, negative_cycle) のタプル
+        - dist: 各頂点への最短距離（到達不能は INF、負閉路の影響を受ける頂点は -INF）
+        - negative_cycle: 始点から到達可能な負閉路の頂点列（辺の向きの順、なければ空リスト）
+
+    例:
+        # 0 -> 1 -> 2 -> 1 (1 -> 2 -> 1 が重み -1 の負閉路), 2 -> 3
+        spfa(graph, 0) -> ([0, -INF, -INF, -INF], [1, 2])
+    """
+    N = len(graph)
+
+    dist = [INF] * N
+    prev = [-1] * N
+    cnt = [0] * N
+    in_queue = [False] * N
+    frozen = [False] * N  # 負閉路を経由して更新された頂点
+    seeds = []
+
+    negative_cycle = []
+    adj = None
+
+    dist[start] = 0
+    que = deque([start])
+    in_queue[start] = True
+
+    # キュー内の頂点の距離の合計（LLL で平均を求めるため）
+    queue_sum = 0
+
+    # 次に先行頂点グラフの閉路を探すまでの緩和回数
+    until_check = N
+
+    while que:
+        if use_lll:
+            # 先頭が平均より大きい間は末尾に回す（回数に上限をつける）
+            for _ in range(min(len(que) - 1, LLL_MAX_ROTATIONS)):
+                if dist[que[0]] * len(que) <= queue_sum:
+                    break
+                que.rotate(-1)
+
+        v = que.popleft()
+        in_queue[v] = False
+        queue_sum -= dist[v]
+
+        # キューに入っている間に凍結された頂点は処理しない
+        if frozen[v]:
+            continue
+
+        dv = dist[v]
+        for edge in graph[v]:
+            to = edge.to
+            nd = dv + edge.weight
+            if frozen[to] or nd >= dist[to]:
+                continue
+
+            # キュー内の頂点の距離が下がったら合計も合わせる
+            if in_queue[to]:
+                queue_sum -= dist[to] - nd
+
+            dist[to] = nd
+            prev[to] = v
+            cnt[to] = cnt[v] + 1
+            until_check -= 1
+
+            # N 本以上の辺を使った経路で更新された = 負閉路を経由している
+            if cnt[to] >= N:
+                frozen[to] = True
+                seeds.append(to)
+                continue
+
+            if not in_queue[to]:
+                in_queue[to] = True
+                queue_sum += nd
+                if use_slf and que and nd < dist[que[0]]:
+                    que.appendleft(to)
+                else:
+                    que.append(to)
+
+        if until_check > 0:
+            continue
+        until_check = N
+
+        # 凍結済みの頂点を除いた先行頂点グラフで閉路を探す（見つけた閉路を何度も拾わない）
+        cycle = _find_cycle_in_prev(
+            [-1 if frozen[u] else p for u, p in enumerate(prev)]
+        )
+        if not cycle:
+            continue
+        if not negative_cycle:
+            negative_cycle = cycle
+
+        # 閉路から到達可能な頂点を -INF にして凍結し、キューからも除く
+        if adj is None:
+            adj = [[edge.to for edge in edges] for edges in graph]
+        _spread_negative_infinity(dist, cycle, adj)
+        for u in range(N):
+            if dist[u] == -INF:
+                frozen[u] = True
+                in_queue[u] = False
+        que = deque(u for u in que if in_queue[u])
+        queue_sum = sum(dist[u] for u in que)
+
+    if not seeds and not negative_cycle:
+        return dist, []
+
+    # 先行頂点グラフの閉路を探す（まだ閉路が現れていなければ辺リスト版で確実に取り出す）
+    if not negative_cycle:
+        negative_cycle = _find_cycle_in_prev(prev)
+    if not negative_cycle:
+        src, dst, weight = to_edge_list(graph)
+        _, negative_cycle = bellman_ford_edge_list(N, src, dst, weight, start)
+
+    if adj is None:
+        adj = [[edge.to for edge in edges] for edges in graph]
+    _spread_negative_infinity(dist, seeds, adj)
+
+    return dist, negative_cycle
+
+
+def to_edge_list(graph: Graph) -> tuple[list[int], list[int], list[float]]:
+    """
+    隣接リストを辺リスト（始点・終点・重みの 3 本のフラットな配列）に変換する
+
+    Edge オブジェクトの属性アクセスを避け、1 ラウンドの緩和を
+    zip で一気に回せるようにするための表現
+
+    Returns:
+        (src, dst, weight) のタプル
+        - i 番目の辺は src[i] -> dst[i]（重み weight[i]）
+    """
+    src, dst, weight = [], [], []
+    for v, edges in enumerate(graph):
+        for edge in edges:
+            src.append(v)
+            dst.append(edge.to)
+            weight.append(edge.weight)
+
+    return src, dst, weight
+
+
+def relax_edge_list(
+    dist: list[float],
+    prev: list[int],
+    src: list[int],
+    dst: list[int],
+    weight: list[float],
+) -> list[int]:
+    """
+    辺リスト全体に対して 1 ラウンド分の緩和処理を行う
+
+    dist[u] = INF のとき INF + w = INF なので比較は必ず偽になり、
+    到達不能チェックの分岐を省ける
+
+    Args:
+        dist: 距離配列（書き換えられる）
+        prev: 先行頂点配列（書き換えられる）
+        src, dst, weight: to_edge_list で作った辺リスト
+
+    Returns:
+        このラウンドで距離が更新された頂点のリスト
+    """
+    updated = []
+    for u, v, w in zip(src, dst, weight):
+        nd = dist[u] + w
+        if nd < dist[v]:
+            dist[v] = nd
+            prev[v] = u
+            updated.append(v)
+
+    return updated
+
+
+def bellman_ford_edge_list(
+    N: int, src: list[int], dst: list[int], weight: list[float], start: int
+) -> tuple[list[float], list[int]]:
+    """
+    辺リスト版のベルマン・フォード法（更新がなくなった時点で打ち切る）
+
+    - 更新のないラウンドがあればその時点で最短路が確定している
+    - N 回目のラウンドでも更新された頂点は負閉路から到達可能
+      → その頂点から prev を N 回辿ると負閉路に入る
+
+    計算量: O(V * E)
+
+    Args:
+        N: 頂点数
+        src, dst, weight: to_edge_list で作った辺リスト
+        start: 始点
+
+    Returns:
+        (dist, negative_cycle) のタプル（spfa と同じ形式）
+    """
+    dist = [INF] * N
+    prev = [-1] * N
+    dist[start] = 0
+
+    updated = []
+    for _ in range(N):
+        updated = relax_edge_list(dist, prev, src, dst, weight)
+        if not updated:
+            return dist, []
+
+    negative_cycle = _walk_to_cycle(prev, updated[-1])
+
+    adj = [[] for _ in range(N)]
+    for u, v in zip(src, dst):
+        adj[u].append(v)
+    _spread_negative_infinity(dist, updated, adj)
+
+    return dist, negative_cycle
+
+
+def bellmanFord_with_prev(
+    graph: Graph, start: int
+) -> tuple[list[float], list[int], bool]:
+    """
+    ベルマン・フォード法で最短距離と最短路木（直前の頂点）を同時に求める
+
+    緩和処理で dist[to] が更新されたとき、prev[to] = v と記録する
+    prev を終点から始点まで辿れば最短路が復元できる
+
+    Args:
+        graph: 重み付き有向グラフ（隣接リスト表現）
+        start: 始点
+
+    Returns:
+        (dist, prev, has_negative_cycle) のタプル
+        - dist: 各頂点への最短距離（負閉路がある場合は無意味）
+        - prev: prev[v] = 最短路における v の直前の頂点（始点と到達不能な頂点は -1）
+        - has_negative_cycle: 負閉路が存在するか
+    """
     N = len(graph)
 
     # 距離配列を初期化
     dist = [INF] * N
     dist[start] = 0
 
+    # prev[v] = v を最後に更新した頂点（なければ -1）
+    prev = [-1] * N
+
     # 負閉路の有無
     has_negative_cycle = False
 
@@ -97,6 +475,8 @@ def bellmanFord(graph: Graph, start: int) -> tuple[list[float], bool]:
                 # 緩和処理を行い、更新されたら update を True にする
                 # ここでdistを更新することでINFの頂点が到達可能として更新されることがあり、その場合次のiter_countで処理される
                 if chmin(dist, edge.to, dist[v] + edge.weight):
+                    # どの頂点から更新されたかを記録する
+                    prev[edge.to] = v
                     update = True
 
         # 更新が行われなかったら、すでに最短路が求められている
@@ -107,4 +487,4 @@ def bellmanFord(graph: Graph, start: int) -> tuple[list[float], bool]:
         if iter_count == N - 1 and update:
             has_negative_cycle = True
 
-    return dist, has_negative_cycle
+    return dist, prev, has_negative_cycle
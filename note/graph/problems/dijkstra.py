@@ -81,12 +81,36 @@ def dijkstra(graph: Graph, start: int) -> list[float]:
     Returns:
         List of shortest distances to each vertex
     """
+    dist, _ = dijkstra_with_prev(graph, start)
+    return dist
+
+
+def dijkstra_with_prev(graph: Graph, start: int) -> tuple[list[float], list[int]]:
+    """
+    Dijkstra's algorithm that also records the shortest-path tree.
+
+    prev[v] is set to the vertex that last relaxed v, so following prev
+    from any vertex back to start gives its shortest path in reverse.
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+        start: Starting vertex
+
+    Returns:
+        (dist, prev) tuple
+        - dist: List of shortest distances to each vertex
+        - prev: prev[v] = previous vertex on the shortest path to v
+          (-1 for start and unreachable vertices)
+    """
     N = len(graph)
 
     # Initialize distance array
     dist = [INF] * N
     dist[start] = 0
 
+    # prev[v]: vertex that last relaxed v (-1 if none)
+    prev = [-1] * N
+
     # Priority queue: pairs of (distance, vertex index)
     # Python's heapq is a min-heap
     pq = [(dist[start], start)]
@@ -106,8 +130,10 @@ def dijkstra(graph: Graph, start: int) -> list[float]:
         for edge in graph[v]:
             # Relaxation process
             if chmin(dist, edge.to, dist[v] + edge.weight):
+                # Remember where the improvement came from
+                prev[edge.to] = v
                 # If updated, push the new distance to the heap
                 # (dist[edge.to], edge.to) is the current shortest distance to start edge
                 heapq.heappush(pq, (dist[edge.to], edge.to))
 
-    return dist
+    return dist, prev
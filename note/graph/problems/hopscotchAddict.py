@@ -11,9 +11,19 @@ Extended Dijkstra with state (vertex, path_length % 3)
 
 Complexity: O((V + E) log V)
 - Same as Dijkstra but with 3 states per vertex
+
+Generalization (product-graph BFS):
+- Every edge has length 1, so a plain BFS already visits states in order of
+  distance and the heap is unnecessary: O(k (V + E)) for k states per vertex
+- State (v, q) is encoded as the integer v * k + q and distances are kept in
+  one flat list of size N * k
+- product_bfs: q moves by an arbitrary automaton step(q, edge)
+- mod_k_bfs: q = path length mod k (hopscotch_addict is the case k = 3)
 """
 
 import heapq
+from collections import deque
+from collections.abc import Callable
 
 INF = float("inf")
 
@@ -110,3 +120,175 @@ def hopscotch_addict(graph: Graph, s: int, t: int) -> float:
     # We want to reach t with path length divisible by 3 (mod = 0)
     result = dist[t][0]
     return result if result != INF else -1
+
+
+def hopscotch_addict_path(graph: Graph, s: int, t: int) -> list[int]:
+    """
+    Same search as hopscotch_addict, but returns the route itself.
+
+    Each state (v, mod) is encoded as the integer v * 3 + mod, and
+    prev[state] records the state it was reached from. Walking prev back
+    from (t, 0) to (s, 0) gives the route.
+
+    Args:
+        graph: Unweighted directed graph (adjacency list)
+        s: Starting vertex
+        t: Target vertex
+
+    Returns:
+        Vertices on a shortest route from s to t whose length is divisible by 3
+        (the same vertex may appear more than once), or [] if no such route exists
+    """
+    N = len(graph)
+
+    dist = [INF] * (N * 3)
+    prev = [-1] * (N * 3)
+    dist[s * 3] = 0
+
+    pq = [(0, s * 3)]
+
+    while pq:
+        d, state = heapq.heappop(pq)
+
+        # Skip stale entries
+        if d > dist[state]:
+            continue
+
+        v, mod = divmod(state, 3)
+        next_mod = (mod + 1) % 3
+
+        for edge in graph[v]:
+            next_state = edge.to * 3 + next_mod
+            if dist[next_state] > d + 1:
+                dist[next_state] = d + 1
+                prev[next_state] = state
+                heapq.heappush(pq, (d + 1, next_state))
+
+    goal = t * 3
+    if dist[goal] == INF:
+        return []
+
+    # Restore the route by following prev back to (s, 0)
+    path = []
+    state = goal
+    while state != -1:
+        path.append(state // 3)
+        state = prev[state]
+    path.reverse()
+
+    return path
+
+
+def product_bfs(
+    graph: Graph,
+    s: int,
+    k: int,
+    step: Callable[[int, Edge], int],
+    start_state: int = 0,
+) -> list[int]:
+    """
+    BFS over the product of the graph and a finite automaton with k states.
+
+    Walking the edge `edge` while the automaton is in state q moves it to
+    step(q, edge). Returning -1 forbids the move, which lets the automaton
+    express constraints such as "edges must alternate colors".
+
+    Args:
+        graph: Directed graph (adjacency list, every edge has length 1)
+        s: Starting vertex
+        k: Number of automaton states (0 .. k-1)
+        step: Transition function of the automaton
+        start_state: Automaton state at s
+
+    Returns:
+        Flat distance list: dist[v * k + q] = minimum number of edges to reach v
+        with the automaton in state q (-1 if unreachable)
+
+    Example:
+        # Path length mod 4
+        dist = product_bfs(graph, 0, 4, lambda q, edge: (q + 1) % 4)
+        dist[t * 4 + 0] -> shortest path length to t divisible by 4
+    """
+    N = len(graph)
+    dist = [-1] * (N * k)
+
+    start = s * k + start_state
+    dist[start] = 0
+    que = deque([start])
+
+    while que:
+        state = que.popleft()
+        v, q = divmod(state, k)
+        next_dist = dist[state] + 1
+
+        for edge in graph[v]:
+            next_q = step(q, edge)
+            if next_q == -1:
+                continue
+
+            next_state = edge.to * k + next_q
+            if dist[next_state] != -1:
+                continue
+
+            dist[next_state] = next_dist
+            que.append(next_state)
+
+    return dist
+
+
+def mod_k_bfs(graph: Graph, s: int, k: int) -> list[int]:
+    """
+    product_bfs specialized for "path length mod k".
+
+    The next state only depends on the current one, so it is computed once per
+    popped state, and the edges are pre-multiplied by k (to * k) so that the
+    encoded next state is a single addition per edge.
+
+    Args:
+        graph: Directed graph (adjacency list, every edge has length 1)
+        s: Starting vertex
+        k: Modulus
+
+    Returns:
+        Flat distance list: dist[v * k + r] = minimum path length to v
+        with path length % k == r (-1 if unreachable)
+    """
+    N = len(graph)
+    dist = [-1] * (N * k)
+    base = [[edge.to * k for edge in edges] for edges in graph]
+
+    dist[s * k] = 0
+    que = deque([s * k])
+
+    while que:
+        state = que.popleft()
+        v, r = divmod(state, k)
+        next_r = r + 1 if r + 1 < k else 0
+        next_dist = dist[state] + 1
+
+        for to_base in base[v]:
+            next_state = to_base + next_r
+            if dist[next_state] != -1:
+                continue
+
+            dist[next_state] = next_dist
+            que.append(next_state)
+
+    return dist
+
+
+def hopscotch_addict_bfs(graph: Graph, s: int, t: int, k: int = 3) -> int:
+    """
+    hopscotch_addict solved with BFS instead of Dijkstra, for any modulus k.
+
+    Args:
+        graph: Unweighted directed graph (adjacency list)
+        s: Starting vertex
+        t: Target vertex
+        k: Path length must be divisible by k (default 3)
+
+    Returns:
+        Minimum path length from s to t that is divisible by k,
+        or -1 if no such path exists
+    """
+    return mod_k_bfs(graph, s, k)[t * k]
@@ -0,0 +1,198 @@
+"""
+Johnson's Algorithm (all-pairs shortest paths for sparse graphs)
+
+Finds all-pairs shortest paths in a graph that may contain negative weights
+(but no negative cycles) by combining Bellman-Ford and Dijkstra.
+
+Complexity: O(VE + V (V + E) log V)
+- V: Number of vertices
+- E: Number of edges
+- Memory: O(V + E), one distance row is produced per source
+
+Idea:
+1. Add a virtual vertex q with 0-weight edges to every vertex
+2. Run Bellman-Ford from q to get potentials h[v]
+3. Reweight every edge: w'(u, v) = w(u, v) + h[u] - h[v] (always >= 0)
+4. Run Dijkstra from every source on the reweighted graph
+5. Restore the distances: d(s, t) = d'(s, t) - h[s] + h[t]
+
+Why is w'(u, v) >= 0?
+- h is a shortest distance from q, so h[v] <= h[u] + w(u, v)
+- Therefore w(u, v) + h[u] - h[v] >= 0
+
+Why are shortest paths unchanged?
+- For any path s -> ... -> t the potentials telescope:
+  w'(path) = w(path) + h[s] - h[t]
+- Every s-t path is shifted by the same constant, so the order is kept
+
+Comparison with Floyd-Warshall:
+- Floyd-Warshall: O(V^3) time, O(V^2) memory, regardless of sparsity
+- Johnson: O(V E log V) time, rows are streamed, fast when E << V^2
+"""
+
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from problems.bellmanFord import spfa
+from problems.dijkstra import INF, Edge, Graph, dijkstra
+
+# Reweighted graph and potentials shared by each worker process
+_worker_graph: Graph = []
+_worker_potential: list[float] = []
+
+
+def johnson_potentials(graph: Graph) -> list[float] | None:
+    """
+    Computes the potentials h[v] used to remove negative weights.
+
+    The virtual vertex q is appended as vertex N, and the queue-based
+    Bellman-Ford (spfa) is run from it. Only vertices whose distance
+    actually changes are revisited, so this is cheap on sparse graphs.
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+
+    Returns:
+        List of potentials h[v], or None if a negative cycle exists
+    """
+    N = len(graph)
+
+    # q -> v for every v with weight 0
+    extended = [list(edges) for edges in graph]
+    extended.append([Edge(v, 0) for v in range(N)])
+
+    dist, negative_cycle = spfa(extended, N)
+    if negative_cycle:
+        return None
+
+    return dist[:N]
+
+
+def reweight(graph: Graph, h: list[float]) -> Graph:
+    """
+    Builds the graph with w'(u, v) = w(u, v) + h[u] - h[v].
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+        h: Potentials from johnson_potentials
+
+    Returns:
+        Reweighted graph with non-negative weights
+    """
+    return [
+        [Edge(edge.to, edge.weight + h[v] - h[edge.to]) for edge in edges]
+        for v, edges in enumerate(graph)
+    ]
+
+
+def _init_worker(graph: Graph, h: list[float]) -> None:
+    """Receives the reweighted graph once per worker process."""
+    global _worker_graph, _worker_potential
+    _worker_graph = graph
+    _worker_potential = h
+
+
+def _restore_row(graph: Graph, h: list[float], s: int) -> array:
+    """
+    Runs Dijkstra from s on the reweighted graph and restores real distances.
+
+    The row is returned as array('d') so that sending it back from
+    a worker process is a single memory copy instead of pickling N floats.
+    """
+    dist = dijkstra(graph, s)
+    hs = h[s]
+    return array("d", [d - hs + hv if d != INF else INF for d, hv in zip(dist, h)])
+
+
+def _worker_rows(chunk: list[int]) -> list[array]:
+    return [_restore_row(_worker_graph, _worker_potential, s) for s in chunk]
+
+
+def johnson(
+    graph: Graph,
+    sources: Iterable[int] | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[tuple[int, array]]:
+    """
+    Finds all-pairs shortest paths using Johnson's algorithm.
+
+    Rows are yielded one source at a time, so the V x V matrix never has to
+    be held in memory. With max_workers != 1 the Dijkstra runs are spread
+    across a process pool (each worker receives the graph only once), and
+    rows are still yielded in the order of sources.
+
+    Args:
+        graph: Weighted directed graph (adjacency list representation)
+        sources: Sources to compute rows for (default: all vertices)
+        max_workers: Number of worker processes
+                     (None: number of CPUs, 1: run in this process)
+        chunksize: Number of sources sent to a worker at once
+
+    Returns:
+        Iterator of (s, row) where row[t] is the shortest distance from s to t
+        (INF if unreachable)
+
+    Raises:
+        ValueError: If the graph has a negative cycle
+
+    Example:
+        for s, row in johnson(graph):
+            print(s, list(row))
+    """
+    h = johnson_potentials(graph)
+    if h is None:
+        raise ValueError("Graph contains a negative cycle")
+
+    reweighted = reweight(graph, h)
+
+    if sources is None:
+        sources = range(len(graph))
+
+    if max_workers == 1:
+        return ((s, _restore_row(reweighted, h, s)) for s in sources)
+
+    return _stream_rows(reweighted, h, sources, max_workers, chunksize)
+
+
+def _stream_rows(
+    graph: Graph,
+    h: list[float],
+    sources: Iterable[int],
+    max_workers: int | None,
+    chunksize: int,
+) -> Iterator[tuple[int, array]]:
+    """
+    Yields rows computed by a process pool in the order of sources.
+
+    executor.map submits every source up front, so finished rows pile up
+    when the caller consumes them slowly. Instead, at most 2 * workers
+    chunks are in flight, and the next chunk is submitted only after the
+    oldest one has been yielded.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    it = iter(sources)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(graph, h),
+    ) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(it, chunksize))
+                if not chunk:
+                    break
+                pending.append((chunk, executor.submit(_worker_rows, chunk)))
+
+            if not pending:
+                break
+
+            chunk, future = pending.popleft()
+            for s, row in zip(chunk, future.result()):
+                yield s, row
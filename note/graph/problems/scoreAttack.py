@@ -1,3 +1,6 @@
+from problems.bellmanFord import Edge, spfa
+
+
 def chmax(a: list[float], index: int, b: float) -> bool:
     """
     Function to perform relaxation.
@@ -64,3 +67,55 @@ def scoreAttack(graph: list[list[tuple[int, int]]], start: int = 0):
             return "inf"
 
     return max(dist)
+
+
+def find_positive_cycle(
+    graph: list[list[tuple[int, int]]], start: int = 0
+) -> tuple[list[float], list[int]]:
+    """
+    Find the best score of every vertex and an actual positive cycle.
+
+    Maximizing the score is the same as minimizing the negated score,
+    so the weights are negated and the queue-based Bellman-Ford (spfa)
+    is reused. A positive cycle in the original graph becomes a negative
+    cycle in the negated graph.
+
+    Complexity: O(VE) in the worst case, usually much faster on sparse graphs
+
+    Args:
+        graph: Weighted directed graph (adjacency list with (to, weight) tuples)
+        start: Starting vertex (default 0)
+
+    Returns:
+        (score, positive_cycle) tuple
+        - score: Best score of each vertex (-inf if unreachable,
+          inf if a positive cycle can be used on the way)
+        - positive_cycle: Vertices of one positive cycle reachable from start
+          in edge order (empty list if none)
+    """
+    negated = [[Edge(to, -weight) for to, weight in edges] for edges in graph]
+    dist, positive_cycle = spfa(negated, start)
+
+    # Negate back: -INF (cycle affected) -> inf, INF (unreachable) -> -inf
+    score = [-d for d in dist]
+
+    return score, positive_cycle
+
+
+def scoreAttack_spfa(graph: list[list[tuple[int, int]]], start: int = 0):
+    """
+    Same as scoreAttack, but only revisits vertices whose score changed.
+
+    Args:
+        graph: Weighted directed graph (adjacency list with (to, weight) tuples)
+        start: Starting vertex (default 0)
+
+    Returns:
+        Maximum score if finite, "inf" if infinite
+    """
+    score, positive_cycle = find_positive_cycle(graph, start)
+
+    if positive_cycle:
+        return "inf"
+
+    return max(score)
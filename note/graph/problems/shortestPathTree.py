@@ -0,0 +1,183 @@
+"""
+Shortest-Path Tree and K Shortest Paths (Yen's Algorithm)
+
+Single-source searches (BFS, Dijkstra, Bellman-Ford) can record prev[v],
+the vertex that v was last relaxed from. The edges prev[v] -> v form a tree
+rooted at the source: the shortest-path tree. Once it is built, the route to
+any vertex is recovered by walking prev back to the source, without running
+the search again.
+
+ShortestPathTree keeps dist/prev in flat arrays so it can be cached
+(and pickled) cheaply and queried many times.
+
+Yen's algorithm finds the K shortest loopless paths from s to t by
+repeatedly running Dijkstra on the graph with some edges/vertices removed.
+
+Complexity:
+- Building a tree: same as the underlying search
+- path_to(t): O(length of the path)
+- Yen's algorithm: O(K V (V + E) log V)
+"""
+
+import heapq
+from array import array
+
+from problems.bellmanFord import bellmanFord_with_prev
+from problems.dijkstra import INF, Graph, dijkstra_with_prev
+from structures.bfs import bfs_shortest_path_with_prev
+
+
+class ShortestPathTree:
+    """Shortest distances and predecessors from a single source"""
+
+    def __init__(self, source: int, dist: list[float], prev: list[int]):
+        self.source = source
+        self.dist = array("d", dist)
+        self.prev = array("q", prev)
+
+    def __repr__(self):
+        return f"ShortestPathTree(source={self.source}, n={len(self.dist)})"
+
+    def has_path_to(self, t: int) -> bool:
+        """Whether t is reachable from the source"""
+        return self.dist[t] != INF
+
+    def distance(self, t: int) -> float:
+        """Shortest distance from the source to t (INF if unreachable)"""
+        return self.dist[t]
+
+    def path_to(self, t: int) -> list[int]:
+        """
+        Restores the shortest path from the source to t.
+
+        Args:
+            t: Target vertex
+
+        Returns:
+            Vertices on the path from source to t, or [] if t is unreachable
+        """
+        if not self.has_path_to(t):
+            return []
+
+        path = []
+        v = t
+        while v != -1:
+            path.append(v)
+            v = self.prev[v]
+        path.reverse()
+
+        return path
+
+
+def dijkstra_tree(graph: Graph, start: int) -> ShortestPathTree:
+    """Builds the shortest-path tree with Dijkstra's algorithm."""
+    dist, prev = dijkstra_with_prev(graph, start)
+    return ShortestPathTree(start, dist, prev)
+
+
+def bellman_ford_tree(graph: Graph, start: int) -> ShortestPathTree | None:
+    """
+    Builds the shortest-path tree with the Bellman-Ford algorithm.
+
+    Returns None if a negative cycle is reachable from start,
+    because shortest paths are not defined in that case.
+    """
+    dist, prev, has_negative_cycle = bellmanFord_with_prev(graph, start)
+    if has_negative_cycle:
+        return None
+    return ShortestPathTree(start, dist, prev)
+
+
+def bfs_tree(graph: list[list[int]], start: int) -> ShortestPathTree:
+    """Builds the shortest-path tree of an unweighted graph with BFS."""
+    dist, prev = bfs_shortest_path_with_prev(graph, start)
+    return ShortestPathTree(start, [d if d != -1 else INF for d in dist], prev)
+
+
+def k_shortest_paths(
+    graph: Graph, s: int, t: int, K: int
+) -> list[tuple[float, list[int]]]:
+    """
+    Finds the K shortest loopless paths from s to t (Yen's algorithm).
+
+    Algorithm flow:
+    1. A[0] = the shortest path (Dijkstra)
+    2. For the last found path A[k-1] and every spur vertex on it:
+       - root = A[k-1] up to the spur vertex
+       - Remove the next edge of every found path sharing the same root
+         (so the same path is not found again)
+       - Remove the root vertices except the spur vertex (keeps the path loopless)
+       - spur path = Dijkstra from the spur vertex to t on the remaining graph
+       - root + spur path is a candidate
+    3. A[k] = the cheapest candidate
+    4. Repeat until K paths are found or no candidates remain
+
+    Args:
+        graph: Weighted directed graph with non-negative weights
+        s: Starting vertex
+        t: Target vertex
+        K: Number of paths to find
+
+    Returns:
+        Up to K (cost, path) tuples in increasing order of cost
+
+    Example:
+        # 0 -> 1 -> 3 (cost 2), 0 -> 2 -> 3 (cost 3), 0 -> 3 (cost 5)
+        k_shortest_paths(graph, 0, 3, 2) -> [(2, [0, 1, 3]), (3, [0, 2, 3])]
+    """
+    first = dijkstra_tree(graph, s)
+    if K <= 0 or not first.has_path_to(t):
+        return []
+
+    # Cheapest weight of each edge (u, v); Dijkstra always uses this one
+    weight = {}
+    for u, edges in enumerate(graph):
+        for edge in edges:
+            if weight.get((u, edge.to), INF) > edge.weight:
+                weight[(u, edge.to)] = edge.weight
+
+    def path_cost(path: list[int]) -> float:
+        return sum(weight[(path[j], path[j + 1])] for j in range(len(path) - 1))
+
+    found = [(path_cost(first.path_to(t)), first.path_to(t))]
+    candidates = []
+    seen = {tuple(found[0][1])}
+
+    while len(found) < K:
+        last_path = found[-1][1]
+
+        for i in range(len(last_path) - 1):
+            spur = last_path[i]
+            root = last_path[: i + 1]
+
+            # Edges leaving the spur vertex that were already used after this root
+            removed_edges = {
+                (path[i], path[i + 1]) for _, path in found if path[: i + 1] == root
+            }
+            removed_vertices = set(root[:-1])
+
+            restricted = [
+                []
+                if v in removed_vertices
+                else [
+                    edge
+                    for edge in edges
+                    if (v, edge.to) not in removed_edges
+                    and edge.to not in removed_vertices
+                ]
+                for v, edges in enumerate(graph)
+            ]
+
+            spur_tree = dijkstra_tree(restricted, spur)
+            if spur_tree.has_path_to(t):
+                path = root[:-1] + spur_tree.path_to(t)
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    heapq.heappush(candidates, (path_cost(path), path))
+
+        if not candidates:
+            break
+
+        found.append(heapq.heappop(candidates))
+
+    return found
@@ -5,7 +5,7 @@ code 13.1 のPython実装
 """
 
 from collections import deque
-from typing import List
+from typing import List, Tuple
 
 
 def bfs(graph: List[List[int]], s: int) -> List[bool]:
@@ -131,3 +131,49 @@ def bfs_shortest_path(graph: List[List[int]], s: int) -> List[int]:
 
     return dist
 
+
+def bfs_shortest_path_with_prev(
+    graph: List[List[int]], s: int
+) -> Tuple[List[int], List[int]]:
+    """
+    幅優先探索で最短路長と最短路木（直前の頂点）を同時に求める
+
+    頂点 x を初めて発見したときの頂点 v が、s から x への最短路における
+    x の直前の頂点になる（BFS は始点に近い順に頂点を発見するため）
+
+    Args:
+        graph: 隣接リスト表現のグラフ
+        s: 始点
+
+    Returns:
+        (dist, prev) のタプル
+        - dist: 各頂点への最短距離（到達不可能な場合は -1）
+        - prev: prev[v] = 最短路における v の直前の頂点（始点と到達不能な頂点は -1）
+
+    例:
+        graph = [[1, 2], [3], [3], []]
+        bfs_shortest_path_with_prev(graph, 0) -> ([0, 1, 1, 2], [-1, 0, 0, 1])
+        # 3 -> 1 -> 0 と辿ると最短路 0 -> 1 -> 3 が得られる
+    """
+    N = len(graph)
+
+    dist = [-1] * N
+    prev = [-1] * N
+
+    que = deque()
+    dist[s] = 0
+    que.append(s)
+
+    while que:
+        v = que.popleft()
+
+        for x in graph[v]:
+            if dist[x] != -1:
+                continue
+
+            # x は v から初めて発見された
+            dist[x] = dist[v] + 1
+            prev[x] = v
+            que.append(x)
+
+    return dist, prev
@@ -0,0 +1,311 @@
+"""
+ソートの共通の入り口 (sort) と、入力に応じたアルゴリズムの自動選択
+
+algorithms 以下のソートは、それぞれ引数や戻り値の形が違う
+（quick_sort(a, left, right) は in-place、merge_sort_simple は新しいリストを返す、など）
+sort(data, key, reverse, stable, algorithm) はこれを 1 つの形にそろえる
+- list.sort と同じく data を直接書き換え、None を返す
+- key(x) は各要素について 1 回だけ計算する
+
+algorithm='auto' では、まず入力を 1 回なめて特徴を調べ (profile)、速いものを選ぶ:
+1. ほぼソート済み（単調な run が少ない） → natural_merge_sort  O(N log R)
+2. 整数のキーで値の範囲が狭い             → 計数ソート          O(N + K)
+3. 整数のキーで値の範囲が 32bit 以内     → LSD 基数ソート      O(P N)
+4. 文字列のキー                         → MSD 基数ソート
+5. 重複が多い（異なるキーが少ない）       → キーごとにまとめる  O(N + D log D)
+6. それ以外                             → 安定性が必要なら natural_merge_sort、
+                                            不要ならイントロソート
+
+安定性:
+- stable=True（デフォルト）なら、等しいキーの要素は元の順序のまま
+- 不安定なアルゴリズムを明示したときは (キー, 元の位置) で比較して安定にする
+- reverse=True でも等しいキーの順序は保たれる（反転 → 昇順に安定ソート → 反転）
+"""
+
+from array import array
+
+from algorithms.bucketSort import (
+    RADIX_BITS,
+    counting_sort,
+    counting_sort_by_key,
+    msd_radix_sort,
+    radix_sort_lsd,
+    radix_sort_lsd_by_key,
+)
+from algorithms.heapSort import heap_sort, heap_sort_4ary
+from algorithms.mergeSort import natural_merge_sort
+from algorithms.quickSort import intro_sort
+from algorithms.sampleSort import sample_sort
+
+# 値の範囲 (最大値 - 最小値 + 1) が要素数のこの倍数以下なら計数ソートを使う
+COUNTING_RANGE_FACTOR = 2
+
+# LSD 基数ソートを使う要素数の下限と、パス数の上限（4 パス = 32bit）
+RADIX_THRESHOLD = 256
+RADIX_MAX_PASSES = 4
+
+# 重複の判定に使うサンプルの大きさと、「重複が多い」とみなす異なる値の割合
+DUPLICATE_SAMPLE = 256
+DUPLICATE_RATIO = 8
+
+# 指定できるアルゴリズム
+ALGORITHMS = ("auto", "merge", "intro", "heap", "heap4", "counting", "radix", "msd", "group", "sample")
+
+
+class SortProfile:
+    """入力のキー列の特徴"""
+
+    def __init__(self, n: int, kind: str, lo, hi, runs: int, distinct: float):
+        # 要素数
+        self.n = n
+        # キーの種類: 'int' / 'str' / 'other'
+        self.kind = kind
+        # 整数のキーの最小値・最大値（int 以外は None）
+        self.lo = lo
+        self.hi = hi
+        # 単調な run の数（昇順・降順のうち少ない方、ソート済みなら 1）
+        self.runs = runs
+        # サンプル中の異なるキーの割合 (0 〜 1]（ハッシュできないキーは 1.0）
+        self.distinct = distinct
+
+    def __repr__(self):
+        return (
+            f"SortProfile(n={self.n}, kind={self.kind!r}, lo={self.lo}, hi={self.hi}, "
+            f"runs={self.runs}, distinct={self.distinct:.2f})"
+        )
+
+
+def profile(keys: list) -> SortProfile:
+    """
+    キー列の特徴を調べる O(N)
+
+    - 種類: 全て int（bool は除く）か、全て str か、全て bytes か
+    - 整数なら最小値・最大値
+    - 降下 (keys[i] < keys[i - 1]) と上昇の回数 → 昇順・降順の run の数
+    - 先頭から等間隔に取った DUPLICATE_SAMPLE 個のうち、異なる値の割合
+
+    例:
+        profile([3, 1, 2, 2]) -> SortProfile(n=4, kind='int', lo=1, hi=3, runs=2, distinct=0.75)
+    """
+    n = len(keys)
+    if n == 0:
+        return SortProfile(0, "other", None, None, 1, 1.0)
+
+    first_type = type(keys[0])
+    if first_type in (int, str, bytes) and all(type(k) is first_type for k in keys):
+        kind = "int" if first_type is int else "str"
+    else:
+        kind = "other"
+
+    lo = hi = None
+    if kind == "int":
+        lo = min(keys)
+        hi = max(keys)
+
+    descents = ascents = 0
+    prev = keys[0]
+    for k in keys:
+        if k < prev:
+            descents += 1
+        elif prev < k:
+            ascents += 1
+        prev = k
+    runs = min(descents, ascents) + 1
+
+    step = max(1, n // DUPLICATE_SAMPLE)
+    sample = keys[::step]
+    try:
+        distinct = len(set(sample)) / len(sample)
+    except TypeError:
+        distinct = 1.0
+
+    return SortProfile(n, kind, lo, hi, runs, distinct)
+
+
+def choose_algorithm(p: SortProfile, stable: bool, has_key: bool) -> str:
+    """
+    profile の結果から algorithm='auto' で使うアルゴリズムの名前を選ぶ
+
+    Args:
+        p: profile(keys) の結果
+        stable: 安定性が必要か
+        has_key: key 関数が指定されているか
+
+    Returns:
+        ALGORITHMS のどれか（'auto' 以外）
+    """
+    # run が log2 N 個以下なら、run をマージするだけで O(N log log N)
+    if p.runs <= p.n.bit_length():
+        return "merge"
+
+    if p.kind == "int":
+        if p.hi - p.lo + 1 <= COUNTING_RANGE_FACTOR * p.n:
+            return "counting"
+
+        passes = -(-(p.hi - p.lo).bit_length() // RADIX_BITS)
+        if p.n >= RADIX_THRESHOLD and passes <= RADIX_MAX_PASSES:
+            return "radix"
+
+    if p.kind == "str":
+        return "msd"
+
+    if p.distinct * DUPLICATE_RATIO <= 1:
+        return "group"
+
+    if stable or has_key:
+        return "merge"
+    return "intro"
+
+
+def _group_sort(items: list, keys: list) -> list:
+    """
+    キーごとに要素をまとめ、異なるキーだけをソートしてつなげる（安定）
+
+    計算量: O(N + D log D) (D: 異なるキーの数)
+    """
+    groups = {}
+    for k, x in zip(keys, items):
+        group = groups.get(k)
+        if group is None:
+            groups[k] = [x]
+        else:
+            group.append(x)
+
+    distinct = list(groups)
+    natural_merge_sort(distinct)
+
+    return [x for k in distinct for x in groups[k]]
+
+
+def _decorated_sort(items: list, keys: list, sorter) -> list:
+    """
+    (キー, 元の位置) の組を不安定なソート sorter でソートして、要素を並べ直す
+
+    元の位置で同点を解消するので、結果は安定ソートと同じになる
+    key を受け取らない intro_sort / heap_sort を key 付きで使うためにも使う
+    """
+    decorated = [(k, i) for i, k in enumerate(keys)]
+    sorter(decorated)
+    return [items[i] for _, i in decorated]
+
+
+def _require_int_keys(p: SortProfile, algorithm: str) -> None:
+    if p.kind != "int":
+        raise ValueError(f"algorithm={algorithm!r} requires integer keys")
+
+
+def _sort_ascending(items: list, key, stable: bool, algorithm: str) -> list:
+    """items を昇順にソートしたリストを返す（items 自体を書き換えることもある）"""
+    keys = items if key is None else [key(x) for x in items]
+    p = profile(keys)
+
+    if algorithm == "auto":
+        algorithm = choose_algorithm(p, stable, key is not None)
+
+    if algorithm == "merge":
+        if key is None:
+            natural_merge_sort(items)
+            return items
+        # キーは計算済みなので、(キー, 要素) の組をキーで並べる
+        pairs = list(zip(keys, items))
+        natural_merge_sort(pairs, key=lambda pair: pair[0])
+        return [x for _, x in pairs]
+
+    if algorithm == "counting":
+        _require_int_keys(p, algorithm)
+        if key is None:
+            counting_sort(items)
+            return items
+        pairs = list(zip(keys, items))
+        return [x for _, x in counting_sort_by_key(pairs, key=lambda pair: pair[0])]
+
+    if algorithm == "radix":
+        _require_int_keys(p, algorithm)
+        if key is None:
+            radix_sort_lsd(items)
+            return items
+        pairs = list(zip(keys, items))
+        return [x for _, x in radix_sort_lsd_by_key(pairs, key=lambda pair: pair[0])]
+
+    if algorithm == "msd":
+        if p.kind != "str":
+            raise ValueError("algorithm='msd' requires str or bytes keys")
+        if key is None:
+            msd_radix_sort(items)
+            return items
+        pairs = list(zip(keys, items))
+        msd_radix_sort(pairs, key=lambda pair: pair[0])
+        return [x for _, x in pairs]
+
+    if algorithm == "group":
+        return _group_sort(items, keys)
+
+    if algorithm == "sample":
+        _require_int_keys(p, algorithm)
+        if key is not None:
+            raise ValueError("algorithm='sample' does not support key")
+        # 整数だけなら、等しい要素は区別できないので安定性は問題にならない
+        sample_sort(items)
+        return items
+
+    sorter = {"intro": intro_sort, "heap": heap_sort, "heap4": heap_sort_4ary}[algorithm]
+    if key is None and not stable:
+        sorter(items)
+        return items
+    return _decorated_sort(items, keys, sorter)
+
+
+def sort(
+    data: list | array,
+    key=None,
+    reverse: bool = False,
+    stable: bool = True,
+    algorithm: str = "auto",
+) -> None:
+    """
+    配列をソートする (in-place)
+
+    Args:
+        data: ソート対象（list または array）
+        key: 比較に使うキーを返す関数 (デフォルト: 要素そのもの、各要素で 1 回だけ呼ぶ)
+        reverse: True なら降順
+        stable: 等しいキーの要素の順序を保つか
+        algorithm: 'auto'（入力から選ぶ）または ALGORITHMS のどれか
+                   - 'merge': natural_merge_sort（安定、ほぼソート済みに強い）
+                   - 'intro' / 'heap' / 'heap4': イントロソート / ヒープソート
+                   - 'counting' / 'radix': 整数キーの計数ソート / LSD 基数ソート（安定）
+                   - 'msd': 文字列キーの MSD 基数ソート（安定）
+                   - 'group': キーごとにまとめる（安定、重複が多いとき）
+                   - 'sample': 整数の並列サンプルソート（key は使えない）
+
+    Raises:
+        ValueError: 知らない algorithm や、キーの型に合わない algorithm を指定したとき
+
+    例:
+        a = [5, 2, 8, 2, 1]
+        sort(a) -> a = [1, 2, 2, 5, 8]
+
+        logs = [("b", 2), ("a", 1), ("c", 2)]
+        sort(logs, key=lambda x: x[1], reverse=True) -> [("b", 2), ("c", 2), ("a", 1)]
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm: {algorithm!r}")
+
+    if len(data) <= 1:
+        return
+
+    items = list(data)
+
+    if reverse:
+        # 反転してから昇順に安定ソートし、もう一度反転する
+        # → 等しいキーの要素は元の順序のまま降順に並ぶ
+        items.reverse()
+        items = _sort_ascending(items, key, stable, algorithm)
+        items.reverse()
+    else:
+        items = _sort_ascending(items, key, stable, algorithm)
+
+    if isinstance(data, array):
+        data[:] = array(data.typecode, items)
+    else:
+        data[:] = items
@@ -14,8 +14,23 @@
 - 要素の値の範囲が分かっている場合に効率的
 - 安定ソートではない（実装による）
 - 分布が均等な場合に高速
+
+発展版:
+- counting_sort: 値の範囲を最小値・最大値から決める（負の値も可、無駄な領域を確保しない）
+- radix_sort_lsd: 下位バイトから 1 バイトずつ安定なバケット分けを繰り返す（64bit 整数や負の値も可）
+- msd_radix_sort: 文字列を先頭の文字から順にバケット分けする
+- *_by_key / key 引数: レコードをキーで安定にソートする
 """
 
+from array import array
+
+# 基数ソートの 1 パスで見るビット数（1 バイト）とバケット数
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+
+# MSD 基数ソートで、この長さ以下の区間は挿入ソートにする
+MSD_CUTOFF = 16
+
 
 def bucket_sort(a: list[int]) -> None:
     """
@@ -75,3 +90,224 @@ def bucket_sort(a: list[int]) -> None:
     for i in range(N):
         a[i] = a2[i]
 
+
+def counting_sort(a: list[int]) -> None:
+    """
+    配列を計数ソートでソートする (in-place)
+
+    bucket_sort と同じ手順だが、カウント配列の大きさを
+    実際の最小値・最大値から決める（num[v - lo] = 値 v の出現回数）
+    - 小さい入力に 100001 要素の配列を確保しない
+    - MAX を超える値や負の値も扱える
+
+    計算量: O(N + K) (K: 最大値 - 最小値 + 1)
+
+    Args:
+        a: ソート対象の配列
+
+    例:
+        a = [3, -1, 2, -1, 0]
+        counting_sort(a) -> a = [-1, -1, 0, 2, 3]
+    """
+    if not a:
+        return
+
+    lo = min(a)
+    hi = max(a)
+
+    num = [0] * (hi - lo + 1)
+    for x in a:
+        num[x - lo] += 1
+
+    # 値の小さい順に、出現回数だけ書き戻す
+    i = 0
+    for v, c in enumerate(num):
+        for _ in range(c):
+            a[i] = v + lo
+            i += 1
+
+
+def counting_sort_by_key(records: list, key) -> list:
+    """
+    整数のキーでレコードを計数ソートする（安定）
+
+    累積和で各キーの書き込み位置を決め、後ろから配置するので
+    同じキーのレコードは元の順序が保たれる
+
+    計算量: O(N + K) (K: キーの最大値 - 最小値 + 1)
+
+    Args:
+        records: ソート対象のレコード
+        key: レコードから整数のキーを返す関数（各レコードで 1 回だけ呼ぶ）
+
+    Returns:
+        ソート済みの新しいリスト
+
+    例:
+        counting_sort_by_key([("b", 2), ("a", 1), ("c", 2)], key=lambda r: r[1])
+        -> [("a", 1), ("b", 2), ("c", 2)]
+    """
+    N = len(records)
+    if N == 0:
+        return []
+
+    keys = [key(r) for r in records]
+    lo = min(keys)
+    hi = max(keys)
+
+    num = [0] * (hi - lo + 1)
+    for k in keys:
+        num[k - lo] += 1
+
+    # num[v] = キー v + lo 以下のレコードの個数
+    for v in range(1, len(num)):
+        num[v] += num[v - 1]
+
+    result = [None] * N
+    for i in range(N - 1, -1, -1):
+        k = keys[i] - lo
+        num[k] -= 1
+        result[num[k]] = records[i]
+
+    return result
+
+
+def _lsd_order(keys: list[int]) -> list[int]:
+    """
+    キーの昇順に並べたときの添字の順列を LSD 基数ソートで求める（安定）
+
+    - 最小値を引いて全てのキーを 0 以上にする（負の値に対応）
+    - (最大値 - 最小値) のビット数から必要なパス数を決める
+      → 値の範囲が狭ければ 64bit でも数パスで終わる
+    - 各パスは下位から RADIX_BITS ビットずつ、安定なバケット分けを行う
+    """
+    lo = min(keys)
+    shifted = [k - lo for k in keys]
+    passes = -(-max(shifted).bit_length() // RADIX_BITS)
+
+    order = list(range(len(keys)))
+    mask = RADIX - 1
+    for p in range(passes):
+        shift = p * RADIX_BITS
+        buckets = [[] for _ in range(RADIX)]
+        for i in order:
+            buckets[(shifted[i] >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+
+    return order
+
+
+def radix_sort_lsd(a: list[int] | array) -> None:
+    """
+    整数の配列を LSD (Least Significant Digit) 基数ソートでソートする (in-place)
+
+    下位バイトから順に、そのバイトの値で安定なバケット分けを行う
+    前のパスの順序が同じバケット内で保たれるので、全パスが終わると全体がソートされる
+
+    計算量: O(P (N + 256)) (P: パス数 = 値の範囲のバイト数、64bit なら最大 8)
+
+    Args:
+        a: ソート対象の配列（list または array('q') など）
+
+    例:
+        a = array('q', [2**40, -7, 3, -2**62])
+        radix_sort_lsd(a) -> a = array('q', [-2**62, -7, 3, 2**40])
+    """
+    if len(a) <= 1:
+        return
+
+    result = [a[i] for i in _lsd_order(list(a))]
+    if isinstance(a, array):
+        a[:] = array(a.typecode, result)
+    else:
+        a[:] = result
+
+
+def radix_sort_lsd_by_key(records: list, key) -> list:
+    """
+    整数のキーでレコードを LSD 基数ソートする（安定）
+
+    Args:
+        records: ソート対象のレコード
+        key: レコードから整数のキーを返す関数（各レコードで 1 回だけ呼ぶ）
+
+    Returns:
+        ソート済みの新しいリスト
+    """
+    if not records:
+        return []
+
+    keys = [key(r) for r in records]
+    return [records[i] for i in _lsd_order(keys)]
+
+
+def msd_radix_sort(a: list, key=None) -> None:
+    """
+    文字列の配列を MSD (Most Significant Digit) 基数ソートでソートする (in-place、安定)
+
+    先頭の文字でバケット分けし、各バケットを次の文字で再びバケット分けする
+    - 長さが d の文字列（d 文字目がない）は、そのバケットの先頭に置く
+    - 区間が MSD_CUTOFF 以下になったら挿入ソートで仕上げる
+    - 再帰の代わりに (左端, 右端, 文字の位置) のスタックを使う（長い文字列でも深くならない）
+
+    計算量: O(見る文字の総数 + バケット分けの回数 × 文字種の数)
+
+    Args:
+        a: ソート対象の配列（str または bytes のリスト）
+        key: 比較に使う文字列を返す関数（デフォルト: 要素そのもの、各要素で 1 回だけ呼ぶ）
+
+    例:
+        a = ["she", "sells", "sea", "shells", "by", "the", "sea"]
+        msd_radix_sort(a) -> a = ["by", "sea", "sea", "sells", "she", "shells", "the"]
+    """
+    N = len(a)
+    if N <= 1:
+        return
+
+    if key is None:
+        keys, values = a, None
+    else:
+        keys, values = [key(x) for x in a], a
+
+    stack = [(0, N, 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+
+        if hi - lo <= MSD_CUTOFF:
+            # 挿入ソート（先頭 d 文字は全て等しいので、文字列全体を比較してよい）
+            for i in range(lo + 1, hi):
+                k = keys[i]
+                v = values[i] if values is not None else None
+                j = i
+                while j > lo and keys[j - 1] > k:
+                    keys[j] = keys[j - 1]
+                    if values is not None:
+                        values[j] = values[j - 1]
+                    j -= 1
+                keys[j] = k
+                if values is not None:
+                    values[j] = v
+            continue
+
+        # d 文字目でバケット分け（添字を入れるので元の順序が保たれる）
+        finished = []  # 長さが d の文字列
+        buckets = {}
+        for i in range(lo, hi):
+            k = keys[i]
+            if len(k) == d:
+                finished.append(i)
+            else:
+                buckets.setdefault(k[d], []).append(i)
+
+        order = finished
+        start = lo + len(finished)
+        for c in sorted(buckets):
+            bucket = buckets[c]
+            order.extend(bucket)
+            if len(bucket) > 1:
+                stack.append((start, start + len(bucket), d + 1))
+            start += len(bucket)
+
+        keys[lo:hi] = [keys[i] for i in order]
+        if values is not None:
+            values[lo:hi] = [values[i] for i in order]
@@ -0,0 +1,322 @@
+"""
+外部マージソート (External Merge Sort) の実装
+
+メモリに載りきらない大きなファイルをソートするアルゴリズム
+
+手順:
+1. ラン生成: 入力をメモリ予算に収まるチャンクに分けて読み、
+   それぞれをメモリ内でソートして一時ファイル（ラン）に書き出す
+   - チャンクは独立しているので、複数プロセスで並列に処理できる
+2. k-way マージ: 各ランの先頭要素を最小ヒープに入れ、最小値を出力しては
+   同じランの次の要素をヒープに入れる
+   - ランが多すぎる場合は max_fan_in 個ずつマージして段数を増やす
+
+計算量:
+- 時間: O(N log N)
+- I/O: 入力を (1 + マージの段数) 回読み書きする
+- メモリ: memory_budget 程度（ラン生成のチャンク + マージ時の読み込みバッファ）
+
+対応する入力形式:
+- 固定長のバイナリ整数（array の typecode で指定、デフォルトは 64bit 符号付き 'q'）
+- 改行区切りのレコード（バイト列として辞書順に比較する）
+"""
+
+import os
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data-structure")
+)
+from structures.heap import MinHeap
+
+from algorithms.mergeSort import natural_merge_sort
+from algorithms.quickSort import intro_sort
+
+# ラン生成で 1 チャンクに読み込む入力のバイト数の目安
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# 1 回のマージで同時に開くランの数の上限
+DEFAULT_MAX_FAN_IN = 64
+
+# ランの読み終わりを表す番兵
+_EXHAUSTED = object()
+
+
+def _plan_fixed_chunks(path: str, record_size: int, chunk_bytes: int) -> list[tuple[int, int]]:
+    """
+    固定長レコードのファイルを (offset, length) のチャンクに分ける
+
+    チャンクの長さはレコードサイズの倍数にそろえる
+    """
+    size = os.path.getsize(path)
+    chunk_bytes = max(record_size, chunk_bytes // record_size * record_size)
+
+    return [(offset, min(chunk_bytes, size - offset)) for offset in range(0, size, chunk_bytes)]
+
+
+def _plan_line_chunks(path: str, chunk_bytes: int) -> list[tuple[int, int]]:
+    """
+    改行区切りのファイルを (offset, length) のチャンクに分ける
+
+    チャンクの終わりが行の途中にならないよう、次の改行まで延ばす
+    """
+    size = os.path.getsize(path)
+    chunk_bytes = max(1, chunk_bytes)
+    chunks = []
+
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            # チャンク末尾のバイトから次の改行までを読み飛ばす
+            f.seek(min(start + chunk_bytes, size) - 1)
+            f.readline()
+            end = f.tell()
+
+            chunks.append((start, end - start))
+            start = end
+
+    return chunks
+
+
+def _read_chunk(kind: str, path: str, offset: int, length: int, typecode: str) -> list:
+    """チャンクを読み込んでレコードのリストにする（行レコードは改行を除く）"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(length)
+
+    if kind == "fixed":
+        records = array(typecode)
+        records.frombytes(data)
+        return records.tolist()
+
+    records = data.split(b"\n")
+    # 最後の改行の後ろの空要素を取り除く
+    if records and records[-1] == b"":
+        records.pop()
+    return records
+
+
+def _write_run(kind: str, path: str, records, typecode: str, buffer_bytes: int) -> None:
+    """
+    ソート済みのレコード列をファイルに書き出す
+
+    固定長は array にためてまとめて書き、行レコードはバッファ付きで書く
+    """
+    with open(path, "wb", buffering=max(buffer_bytes, 1 << 16)) as f:
+        if kind == "fixed":
+            buf = array(typecode)
+            limit = max(1, buffer_bytes // buf.itemsize)
+            for x in records:
+                buf.append(x)
+                if len(buf) >= limit:
+                    buf.tofile(f)
+                    buf = array(typecode)
+            buf.tofile(f)
+        else:
+            for record in records:
+                f.write(record)
+                f.write(b"\n")
+
+
+def _read_run(kind: str, path: str, typecode: str, buffer_bytes: int):
+    """ランを先頭から 1 レコードずつ返す（buffer_bytes ずつまとめて読む）"""
+    if kind == "fixed":
+        itemsize = array(typecode).itemsize
+        step = max(1, buffer_bytes // itemsize) * itemsize
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(step)
+                if not data:
+                    return
+                records = array(typecode)
+                records.frombytes(data)
+                yield from records
+    else:
+        with open(path, "rb", buffering=max(buffer_bytes, 1 << 16)) as f:
+            for line in f:
+                # ランの各行は必ず改行で終わる
+                yield line[:-1]
+
+
+def _sort_chunk(task: tuple) -> str:
+    """
+    1 チャンクを読み込み、メモリ内でソートしてランとして書き出す
+
+    ワーカープロセスにはファイル名と範囲だけを渡し、データ自体は
+    ワーカーが直接読む（大きなリストを pickle して送らない）
+    """
+    kind, path, offset, length, typecode, run_path, buffer_bytes = task
+
+    records = _read_chunk(kind, path, offset, length, typecode)
+
+    if kind == "fixed":
+        intro_sort(records)
+    else:
+        natural_merge_sort(records)
+
+    _write_run(kind, run_path, records, typecode, buffer_bytes)
+    return run_path
+
+
+def kway_merge(runs: list):
+    """
+    ソート済みの列をいくつか受け取り、全体をソート順に 1 つずつ返す
+
+    ヒープには (値, ランの番号) を入れる
+    - 値が等しいときはランの番号が小さい方が先 → 入力順が保たれる（安定）
+    - 取り出した直後に同じランの次の値を入れるので、replace_top で 1 回の降下で済む
+
+    計算量: O(N log k) (k: ランの数)
+
+    Args:
+        runs: ソート済みの列（イテレータ）のリスト
+
+    例:
+        list(kway_merge([iter([1, 4]), iter([2, 3, 5])])) -> [1, 2, 3, 4, 5]
+    """
+    iterators = [iter(run) for run in runs]
+    heap = MinHeap()
+
+    for index, it in enumerate(iterators):
+        first = next(it, _EXHAUSTED)
+        if first is not _EXHAUSTED:
+            heap.push((first, index))
+
+    while not heap.is_empty():
+        x, index = heap.top()
+        yield x
+
+        nxt = next(iterators[index], _EXHAUSTED)
+        if nxt is _EXHAUSTED:
+            heap.pop()
+        else:
+            heap.replace_top((nxt, index))
+
+
+def _external_sort(
+    kind: str,
+    input_path: str,
+    output_path: str,
+    typecode: str,
+    memory_budget: int,
+    max_workers: int,
+    max_fan_in: int,
+    tmp_dir: str | None,
+) -> None:
+    """external_sort_ints / external_sort_lines の本体"""
+    if kind == "fixed":
+        record_size = array(typecode).itemsize
+        chunks = _plan_fixed_chunks(input_path, record_size, memory_budget)
+    else:
+        chunks = _plan_line_chunks(input_path, memory_budget)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        # === 1. ラン生成 ===
+        tasks = [
+            (
+                kind,
+                input_path,
+                offset,
+                length,
+                typecode,
+                os.path.join(work_dir, f"run-0-{i}"),
+                memory_budget // 8,
+            )
+            for i, (offset, length) in enumerate(chunks)
+        ]
+
+        if max_workers == 1:
+            runs = [_sort_chunk(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                runs = list(executor.map(_sort_chunk, tasks))
+
+        # === 2. ランが多すぎる間は max_fan_in 個ずつまとめる ===
+        max_fan_in = max(2, max_fan_in)
+        level = 1
+        while len(runs) > max_fan_in:
+            next_runs = []
+            for g in range(0, len(runs), max_fan_in):
+                group = runs[g : g + max_fan_in]
+                if len(group) == 1:
+                    next_runs.append(group[0])
+                    continue
+
+                buffer_bytes = memory_budget // (len(group) + 1)
+                merged_path = os.path.join(work_dir, f"run-{level}-{g}")
+                readers = [_read_run(kind, run, typecode, buffer_bytes) for run in group]
+                _write_run(kind, merged_path, kway_merge(readers), typecode, buffer_bytes)
+
+                for run in group:
+                    os.remove(run)
+                next_runs.append(merged_path)
+
+            runs = next_runs
+            level += 1
+
+        # === 3. 最後のマージで出力ファイルに書く ===
+        buffer_bytes = memory_budget // (len(runs) + 1)
+        readers = [_read_run(kind, run, typecode, buffer_bytes) for run in runs]
+        _write_run(kind, output_path, kway_merge(readers), typecode, buffer_bytes)
+
+
+def external_sort_ints(
+    input_path: str,
+    output_path: str,
+    typecode: str = "q",
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    max_workers: int = 1,
+    max_fan_in: int = DEFAULT_MAX_FAN_IN,
+    tmp_dir: str | None = None,
+) -> None:
+    """
+    固定長のバイナリ整数を並べたファイルを昇順にソートする
+
+    Args:
+        input_path: 入力ファイル（ネイティブのバイトオーダーの整数列）
+        output_path: 出力ファイル（同じ形式）
+        typecode: array の typecode（'q': 64bit, 'i': 32bit, 'Q': 符号なし 64bit など）
+        memory_budget: 1 チャンクで読み込む入力のバイト数
+                       （Python の int は 1 個あたりこれより大きくなるので余裕をもって指定する）
+        max_workers: ラン生成に使うプロセス数（1 ならこのプロセスで順に処理）
+        max_fan_in: 1 回のマージで同時に開くランの数
+        tmp_dir: ランを置く一時ディレクトリ（デフォルト: OS の一時ディレクトリ）
+
+    例:
+        array('q', [5, -2, 9, 0]).tofile(open("in.bin", "wb"))
+        external_sort_ints("in.bin", "out.bin")
+        # out.bin = [-2, 0, 5, 9]
+    """
+    _external_sort(
+        "fixed", input_path, output_path, typecode, memory_budget, max_workers, max_fan_in, tmp_dir
+    )
+
+
+def external_sort_lines(
+    input_path: str,
+    output_path: str,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    max_workers: int = 1,
+    max_fan_in: int = DEFAULT_MAX_FAN_IN,
+    tmp_dir: str | None = None,
+) -> None:
+    """
+    改行区切りのファイルを行単位で（バイト列の辞書順に）ソートする
+
+    行の比較は改行を除いて行う。出力の各行は必ず改行で終わる
+    等しい行は入力での順序が保たれる（安定）
+
+    Args:
+        input_path: 入力ファイル
+        output_path: 出力ファイル
+        memory_budget: 1 チャンクで読み込む入力のバイト数の目安
+        max_workers: ラン生成に使うプロセス数（1 ならこのプロセスで順に処理）
+        max_fan_in: 1 回のマージで同時に開くランの数
+        tmp_dir: ランを置く一時ディレクトリ（デフォルト: OS の一時ディレクトリ）
+    """
+    _external_sort(
+        "lines", input_path, output_path, "q", memory_budget, max_workers, max_fan_in, tmp_dir
+    )
@@ -15,8 +15,15 @@
 - in-place ソート（追加メモリがほぼ不要）
 - 常に O(N log N) の性能を保証
 - 実装が複雑で定数倍が大きい
+
+全体をソートしなくてよい場合:
+- partial_sort: 小さい方から k 個だけ取り出す O(N + k log N)
+- top_k: 大きさ k のヒープだけを持って、終わりのない入力から上位 k 個を求める O(N log k)
+- heap_sort_4ary: 4 分ヒープ + ボトムアップの降下で比較とメモリアクセスを減らしたヒープソート
 """
 
+import heapq
+
 
 def heapify(a: list[int], i: int, N: int) -> None:
     """
@@ -111,3 +118,177 @@ def heap_sort(a: list[int]) -> None:
         heapify(a, 0, i)
 
     # 配列が昇順にソートされて完成
+
+
+def heap_sort_range(a: list[int], left: int, right: int) -> None:
+    """
+    配列の区間 [left, right) だけをヒープソートでソートする (in-place)
+
+    heap_sort と同じ手順だが、a[left] をヒープの根として扱う
+    （ノード i の子は left + 2*(i-left) + 1, left + 2*(i-left) + 2）
+    イントロソートで再帰が深くなりすぎた区間の退避先として使う
+
+    再帰の代わりにループで穴を降ろしていくので、区間が大きくてもスタックを消費しない
+
+    Args:
+        a: ソート対象の配列
+        left: ソート範囲の左端
+        right: ソート範囲の右端(含まない)
+    """
+    N = right - left
+
+    def sift_down(i: int, n: int) -> None:
+        # a[left:left+n] をヒープとみなして、相対位置 i の値を降ろす
+        x = a[left + i]
+        while True:
+            child = i * 2 + 1
+            if child >= n:
+                break
+            if child + 1 < n and a[left + child + 1] > a[left + child]:
+                child += 1
+            if a[left + child] <= x:
+                break
+            a[left + i] = a[left + child]
+            i = child
+        a[left + i] = x
+
+    # フェーズ1: 区間全体をヒープに変換する
+    for i in range(N // 2 - 1, -1, -1):
+        sift_down(i, N)
+
+    # フェーズ2: 最大値を区間の末尾に移していく
+    for i in range(N - 1, 0, -1):
+        a[left], a[left + i] = a[left + i], a[left]
+        sift_down(0, i)
+
+
+def partial_sort(a: list[int], k: int) -> None:
+    """
+    配列の小さい方から k 個だけをソートして先頭に並べる (in-place)
+
+    全体をソートせず、ヒープの構築 O(N) + k 回の取り出し O(k log N) で済ませる
+    k が N よりずっと小さいとき、heap_sort の O(N log N) より速い
+
+    処理後:
+    - a[0:k] は小さい方から k 個の昇順
+    - a[k:] は残りの要素（順序は不定）
+
+    Args:
+        a: 対象の配列
+        k: 取り出す個数
+
+    例:
+        a = [5, 2, 8, 1, 9, 3]
+        partial_sort(a, 3) -> a[:3] = [1, 2, 3]
+    """
+    k = min(k, len(a))
+
+    # 最小ヒープを構築して k 回取り出す
+    heapq.heapify(a)
+    smallest = [heapq.heappop(a) for _ in range(k)]
+
+    # 取り出した k 個を先頭に、残りのヒープをその後ろに置く
+    a[:0] = smallest
+
+
+def top_k(iterable, k: int) -> list:
+    """
+    入力列の大きい方から k 個を、降順で返す
+
+    大きさ k の最小ヒープだけを持つ:
+    - ヒープの根 = これまでの上位 k 個のうち最小のもの（ボーダー）
+    - 新しい値がボーダーより大きければ、根と入れ替えて降ろす
+    入力全体を保持しないので、終わりのない入力（ストリーム）にも使える
+
+    計算量: O(N log k)、空間 O(k)
+
+    Args:
+        iterable: 値の列（ジェネレータなども可）
+        k: 求める個数
+
+    Returns:
+        上位 k 個（降順）
+
+    例:
+        top_k(iter([5, 1, 9, 3, 7]), 2) -> [9, 7]
+    """
+    if k <= 0:
+        return []
+
+    heap = []
+    for x in iterable:
+        if len(heap) < k:
+            heapq.heappush(heap, x)
+        elif x > heap[0]:
+            heapq.heapreplace(heap, x)
+
+    heap.sort(reverse=True)
+    return heap
+
+
+def _sift_down_4ary(a: list[int], i: int, N: int) -> None:
+    """
+    4 分ヒープ a[0:N] で、位置 i の値を正しい位置まで降ろす（ボトムアップ版）
+
+    4 分ヒープ:
+    - ノード i の子: 4*i + 1 .. 4*i + 4、親: (i - 1) // 4
+    - 木の高さが log4 N になり、2 分ヒープの半分になる
+    - 兄弟 4 つは配列上で隣り合うので、キャッシュに載りやすい
+
+    ボトムアップの降下:
+    - 通常は「子の最大値と x の比較」を毎段行うが、根から降ろす値は
+      たいてい葉の近くまで降りる
+    - そこで x とは比較せずに、最大の子を引き上げながら葉まで穴を降ろし、
+      最後に x を葉から上に戻す（上に戻る距離は短い）
+    """
+    x = a[i]
+    start = i
+
+    # 最大の子を引き上げながら、穴を葉まで降ろす
+    while True:
+        child = 4 * i + 1
+        if child >= N:
+            break
+
+        best = child
+        for j in range(child + 1, min(child + 4, N)):
+            if a[j] > a[best]:
+                best = j
+
+        a[i] = a[best]
+        i = best
+
+    # 葉から x を入れる位置まで上げる（start より上には行かない）
+    while i > start:
+        parent = (i - 1) // 4
+        if a[parent] >= x:
+            break
+        a[i] = a[parent]
+        i = parent
+
+    a[i] = x
+
+
+def heap_sort_4ary(a: list[int]) -> None:
+    """
+    4 分ヒープとボトムアップの降下を使ったヒープソート (in-place)
+
+    手順は heap_sort と同じ:
+    1. 最後の非葉ノード ((N - 2) // 4) から根に向かってヒープ化
+    2. 根（最大値）を末尾と交換し、ヒープを 1 つ縮めて根を降ろす
+
+    Args:
+        a: ソート対象の配列
+
+    例:
+        a = [5, 2, 8, 1, 9]
+        heap_sort_4ary(a) -> a = [1, 2, 5, 8, 9]
+    """
+    N = len(a)
+
+    for i in range((N - 2) // 4, -1, -1):
+        _sift_down_4ary(a, i, N)
+
+    for i in range(N - 1, 0, -1):
+        a[0], a[i] = a[i], a[0]
+        _sift_down_4ary(a, 0, i)
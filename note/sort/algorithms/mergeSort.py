@@ -15,8 +15,22 @@
 - 外部ソートに適している
 - 並列化が容易
 - 常にO(N log N)の性能を保証
+
+自然マージソート (natural_merge_sort):
+- 入力にすでにある昇順/降順の並び (run) を見つけて、それをマージの単位にする
+- 再帰を使わないボトムアップのマージで、補助配列はソート全体で 1 つだけ確保する
+- 同じ側が続けて勝つときは二分探索でまとめてコピーする (galloping)
+- ほぼソート済みの入力では O(N) に近くなる
 """
 
+from bisect import bisect_left, bisect_right
+
+# これより短い run は二分挿入ソートで伸ばしてからマージする
+MIN_RUN = 32
+
+# 同じ側がこの回数続けて勝ったら galloping に切り替える
+MIN_GALLOP = 7
+
 
 def merge_sort(a: list[int], left: int = None, right: int = None) -> None:
     """
@@ -188,3 +202,214 @@ def merge_sort_simple(a: list[int]) -> list[int]:
     result.extend(right[j:])
 
     return result
+
+
+def _count_run(keys: list, values: list | None, lo: int, n: int) -> int:
+    """
+    lo から始まる run（昇順または狭義降順の並び）の終端を返す
+
+    狭義降順の run はその場で反転して昇順にする
+    （等しい要素を含む降順を反転すると順序が入れ替わるので、狭義降順に限る = 安定性を保つ）
+
+    Returns:
+        run の右端（含まない）
+    """
+    hi = lo + 1
+    if hi == n:
+        return hi
+
+    if keys[hi] < keys[lo]:
+        # 狭義降順の run
+        while hi + 1 < n and keys[hi + 1] < keys[hi]:
+            hi += 1
+        hi += 1
+        keys[lo:hi] = keys[lo:hi][::-1]
+        if values is not None:
+            values[lo:hi] = values[lo:hi][::-1]
+    else:
+        # 昇順（広義）の run
+        while hi + 1 < n and keys[hi + 1] >= keys[hi]:
+            hi += 1
+        hi += 1
+
+    return hi
+
+
+def _binary_insertion_sort(
+    keys: list, values: list | None, lo: int, start: int, hi: int
+) -> None:
+    """
+    [lo, start) がソート済みのとき、[start, hi) の要素を二分探索で挿入していく
+
+    bisect_right で「等しい要素の後ろ」に挿入するので安定
+    """
+    for i in range(start, hi):
+        k = keys[i]
+        pos = bisect_right(keys, k, lo, i)
+        if pos == i:
+            continue
+
+        # [pos, i) を 1 つ右にずらして pos に挿入
+        keys[pos + 1 : i + 1] = keys[pos:i]
+        keys[pos] = k
+        if values is not None:
+            v = values[i]
+            values[pos + 1 : i + 1] = values[pos:i]
+            values[pos] = v
+
+
+def _merge_runs(
+    src_keys: list,
+    src_values: list | None,
+    dst_keys: list,
+    dst_values: list | None,
+    lo: int,
+    mid: int,
+    hi: int,
+) -> None:
+    """
+    src の 2 つの run [lo, mid) と [mid, hi) をマージして dst の [lo, hi) に書く
+
+    - 左の run の末尾 <= 右の run の先頭なら、すでに並んでいるのでそのままコピー
+    - 同じ側が MIN_GALLOP 回続けて勝ったら、相手の先頭に負けるまでの範囲を
+      二分探索で求めてまとめてコピーする (galloping)
+    - 等しい場合は左を先に取る → 安定
+    """
+    if src_keys[mid - 1] <= src_keys[mid]:
+        dst_keys[lo:hi] = src_keys[lo:hi]
+        if src_values is not None:
+            dst_values[lo:hi] = src_values[lo:hi]
+        return
+
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+
+    while i < mid and j < hi:
+        if left_wins >= MIN_GALLOP:
+            # 左の run から、右の先頭以下の要素をまとめて取る
+            end = bisect_right(src_keys, src_keys[j], i, mid)
+            dst_keys[k : k + end - i] = src_keys[i:end]
+            if src_values is not None:
+                dst_values[k : k + end - i] = src_values[i:end]
+            k += end - i
+            i = end
+            left_wins = 0
+            continue
+
+        if right_wins >= MIN_GALLOP:
+            # 右の run から、左の先頭未満の要素をまとめて取る
+            end = bisect_left(src_keys, src_keys[i], j, hi)
+            dst_keys[k : k + end - j] = src_keys[j:end]
+            if src_values is not None:
+                dst_values[k : k + end - j] = src_values[j:end]
+            k += end - j
+            j = end
+            right_wins = 0
+            continue
+
+        if src_keys[j] < src_keys[i]:
+            dst_keys[k] = src_keys[j]
+            if src_values is not None:
+                dst_values[k] = src_values[j]
+            j += 1
+            right_wins += 1
+            left_wins = 0
+        else:
+            dst_keys[k] = src_keys[i]
+            if src_values is not None:
+                dst_values[k] = src_values[i]
+            i += 1
+            left_wins += 1
+            right_wins = 0
+        k += 1
+
+    # 残りをコピー（どちらか一方は空）
+    dst_keys[k : k + mid - i] = src_keys[i:mid]
+    dst_keys[k + mid - i : hi] = src_keys[j:hi]
+    if src_values is not None:
+        dst_values[k : k + mid - i] = src_values[i:mid]
+        dst_values[k + mid - i : hi] = src_values[j:hi]
+
+
+def natural_merge_sort(a: list, key=None) -> None:
+    """
+    配列aをボトムアップの自然マージソートでソートする（安定）
+
+    アルゴリズム:
+    1. 先頭から run を切り出す（狭義降順は反転、短い run は二分挿入ソートで MIN_RUN まで伸ばす）
+    2. 隣り合う run を 2 つずつマージする
+       - a と補助配列 buf を交互に読み書きする（補助配列はこの 1 つだけ）
+    3. run が 1 つになったら完了（最後に buf 側にあれば a に書き戻す）
+
+    key を指定した場合:
+    - key(x) は各要素について 1 回だけ計算し、キーの配列と要素の配列を並べて動かす
+
+    計算量:
+    - 最悪 O(N log N)
+    - run が R 個なら O(N log R)（ソート済みなら O(N)）
+
+    Args:
+        a: ソートする配列（直接書き換える）
+        key: 比較に使うキーを返す関数 (デフォルト: 要素そのもの)
+
+    例:
+        a = [1, 2, 3, 9, 8, 7, 4, 5, 6]
+        natural_merge_sort(a) → a = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+        logs = [("b", 2), ("a", 1), ("c", 2)]
+        natural_merge_sort(logs, key=lambda x: x[1]) → [("a", 1), ("b", 2), ("c", 2)]
+    """
+    n = len(a)
+    if n <= 1:
+        return
+
+    if key is None:
+        keys, values = a, None
+    else:
+        keys, values = [key(x) for x in a], a
+
+    # === 1. run の切り出し ===
+    # bounds[t] .. bounds[t + 1] が t 番目の run
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = _count_run(keys, values, lo, n)
+        if hi - lo < MIN_RUN:
+            end = min(lo + MIN_RUN, n)
+            _binary_insertion_sort(keys, values, lo, hi, end)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+
+    # === 2. ボトムアップのマージ ===
+    buf_keys = [None] * n
+    buf_values = [None] * n if values is not None else None
+
+    src_keys, src_values = keys, values
+    dst_keys, dst_values = buf_keys, buf_values
+
+    while len(bounds) > 2:
+        next_bounds = [0]
+        for t in range(0, len(bounds) - 2, 2):
+            lo, mid, hi = bounds[t], bounds[t + 1], bounds[t + 2]
+            _merge_runs(src_keys, src_values, dst_keys, dst_values, lo, mid, hi)
+            next_bounds.append(hi)
+
+        # run が奇数個なら、最後の run は相手がいないのでそのままコピー
+        if len(bounds) % 2 == 0:
+            lo = bounds[-2]
+            dst_keys[lo:n] = src_keys[lo:n]
+            if src_values is not None:
+                dst_values[lo:n] = src_values[lo:n]
+            next_bounds.append(n)
+
+        bounds = next_bounds
+        src_keys, dst_keys = dst_keys, src_keys
+        src_values, dst_values = dst_values, src_values
+
+    # === 3. 結果が補助配列側にあれば書き戻す ===
+    if src_keys is buf_keys:
+        if values is None:
+            a[:] = buf_keys
+        else:
+            a[:] = buf_values
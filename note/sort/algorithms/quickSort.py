@@ -15,8 +15,23 @@
 - in-placeソート (追加の配列が不要)
 - 実用的には最も高速なソートの1つ
 - ピボットの選び方で性能が変わる
+
+イントロソート (intro_sort):
+- ピボットは 3 点の中央値（大きい区間では ninther = 中央値の中央値）
+- 3 分割 (Dutch national flag) で、ピボットと等しい要素をまとめて確定させる
+- 小さい側だけ再帰し、大きい側はループで処理する → 再帰の深さは O(log N)
+- 区間が小さくなったら挿入ソートに切り替える
+- 分割の深さが 2 log N を超えたらヒープソートに切り替える → 最悪 O(N log N)
 """
 
+from algorithms.heapSort import heap_sort_range
+
+# この長さ以下の区間は挿入ソートで処理する
+INSERTION_SORT_THRESHOLD = 16
+
+# この長さより大きい区間は ninther でピボットを選ぶ
+NINTHER_THRESHOLD = 128
+
 
 def quick_sort(a: list[int], left: int = None, right: int = None) -> None:
     """
@@ -100,3 +115,137 @@ def quick_sort_simple(a: list[int]) -> list[int]:
 
     # 再帰的にソートして結合
     return quick_sort_simple(left) + middle + quick_sort_simple(right)
+
+
+def _insertion_sort_range(a: list[int], left: int, right: int) -> None:
+    """区間 [left, right) を挿入ソートでソートする"""
+    for i in range(left + 1, right):
+        insert_value = a[i]
+        position = i
+        while position > left and a[position - 1] > insert_value:
+            a[position] = a[position - 1]
+            position -= 1
+        a[position] = insert_value
+
+
+def _median_of_three(x: int, y: int, z: int) -> int:
+    """3 つの値の中央値を返す"""
+    if x < y:
+        if y < z:
+            return y
+        return z if x < z else x
+    if x < z:
+        return x
+    return z if y < z else y
+
+
+def _choose_pivot(a: list[int], left: int, right: int) -> int:
+    """
+    区間 [left, right) のピボットの値を選ぶ
+
+    - 先頭・中央・末尾の 3 点の中央値をとる
+      → ソート済み・逆順の入力でも区間がほぼ半分に分かれる
+    - 区間が大きいときは 9 点を 3 組に分けて中央値の中央値 (ninther) をとる
+    """
+    n = right - left
+    mid = left + n // 2
+    last = right - 1
+
+    if n <= NINTHER_THRESHOLD:
+        return _median_of_three(a[left], a[mid], a[last])
+
+    step = n // 8
+    return _median_of_three(
+        _median_of_three(a[left], a[left + step], a[left + 2 * step]),
+        _median_of_three(a[mid - step], a[mid], a[mid + step]),
+        _median_of_three(a[last - 2 * step], a[last - step], a[last]),
+    )
+
+
+def _partition3(a: list[int], left: int, right: int, pivot: int) -> tuple[int, int]:
+    """
+    区間 [left, right) をピボットとの大小で 3 つに分ける (Dutch national flag)
+
+    処理後:
+    - a[left:lt]  < pivot
+    - a[lt:gt]   == pivot（位置が確定しているので以降は触らない）
+    - a[gt:right] > pivot
+
+    Returns:
+        (lt, gt) のタプル
+    """
+    lt = left  # pivot 未満の要素の右端
+    i = left  # 未処理の要素の左端
+    gt = right  # pivot より大きい要素の左端
+
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            lt += 1
+            i += 1
+        elif x > pivot:
+            gt -= 1
+            a[i], a[gt] = a[gt], x
+        else:
+            i += 1
+
+    return lt, gt
+
+
+def _intro_sort(a: list[int], left: int, right: int, depth_limit: int) -> None:
+    """intro_sort の本体（区間 [left, right) を depth_limit 回まで分割してソートする）"""
+    while right - left > INSERTION_SORT_THRESHOLD:
+        # 分割が偏り続けている = 最悪ケースに近いのでヒープソートに任せる
+        if depth_limit == 0:
+            heap_sort_range(a, left, right)
+            return
+        depth_limit -= 1
+
+        pivot = _choose_pivot(a, left, right)
+        lt, gt = _partition3(a, left, right, pivot)
+
+        # 小さい側だけ再帰し、大きい側はループで続ける（スタックの深さを O(log N) に抑える）
+        if lt - left < right - gt:
+            _intro_sort(a, left, lt, depth_limit)
+            left = gt
+        else:
+            _intro_sort(a, gt, right, depth_limit)
+            right = lt
+
+    _insertion_sort_range(a, left, right)
+
+
+def intro_sort(a: list[int], left: int = None, right: int = None) -> None:
+    """
+    配列aを区間[left, right)に対してイントロソートでソートする
+
+    quick_sort の弱点を補ったもの:
+    - 重複が多い入力: 3 分割でピボットと等しい要素を一度に確定させる
+    - ソート済み・逆順の入力: 3 点の中央値でピボットを選ぶ
+    - 意図的に作られた最悪入力: 深さ 2 log N を超えたらヒープソートに切り替える
+    - 深い再帰: 小さい側だけ再帰する
+
+    計算量: 最悪 O(N log N)、空間 O(log N)
+
+    Args:
+        a: ソートする配列
+        left: ソート範囲の左端 (デフォルト: 0)
+        right: ソート範囲の右端(含まない) (デフォルト: len(a))
+
+    例:
+        a = [5, 2, 8, 2, 1, 9, 2]
+        intro_sort(a) -> a = [1, 2, 2, 2, 5, 8, 9]
+    """
+    if left is None:
+        left = 0
+    if right is None:
+        right = len(a)
+
+    n = right - left
+    if n <= 1:
+        return
+
+    # 2 * floor(log2(n))
+    depth_limit = 2 * (n.bit_length() - 1)
+    _intro_sort(a, left, right, depth_limit)
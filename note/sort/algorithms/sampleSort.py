@@ -0,0 +1,208 @@
+"""
+サンプルソート (Sample Sort) の並列実装
+
+クイックソートのピボットを 1 つではなく P-1 個（スプリッタ）にして、
+配列を P 個のバケットに一度に分け、各バケットを別々のプロセスでソートする
+
+手順:
+1. サンプリング: 入力からランダムに P * OVERSAMPLE 個を取り出してソートし、
+   等間隔に P-1 個をスプリッタとして選ぶ（サンプルが多いほどバケットの大きさがそろう）
+2. 分配（並列）: 入力を P 個の区間に分け、各プロセスが自分の区間の要素を
+   バケット番号順に並べ替えて、バケットごとの個数を返す
+3. 親プロセスで個数の累積和をとり、各バケットの出力位置を決める
+4. ソート（並列）: 各プロセスが 1 つのバケットを全区間から集めてソートし、出力位置に書く
+   バケット b の要素は全てバケット b+1 の要素以下なので、並べるだけで全体がソートされる
+
+データの受け渡し:
+- 入力と出力は共有メモリ (SharedMemory) 上の整数配列として置く
+- プロセスには区間の位置と個数だけを渡すので、データ本体を pickle しない
+
+計算量:
+- 全体の仕事量: O(N log N)
+- P プロセスでは 1 プロセスあたり O((N / P) log N) 程度（バケットの偏りがなければ）
+"""
+
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+
+from algorithms.quickSort import intro_sort
+
+# スプリッタ 1 つあたりのサンプル数
+OVERSAMPLE = 32
+
+# これより小さい入力はプロセスを使わずにソートする
+PARALLEL_THRESHOLD = 1 << 15
+
+# 各ワーカープロセスが共有メモリ上の配列を参照するための変数
+_worker_shms: list[SharedMemory] = []
+_worker_input: memoryview | None = None
+_worker_output: memoryview | None = None
+
+
+def _init_worker(input_name: str, output_name: str, n: int, typecode: str) -> None:
+    """ワーカープロセスの起動時に、入力と出力の共有メモリに接続する"""
+    global _worker_shms, _worker_input, _worker_output
+    input_shm = SharedMemory(name=input_name)
+    output_shm = SharedMemory(name=output_name)
+    _worker_shms = [input_shm, output_shm]
+
+    itemsize = array(typecode).itemsize
+    _worker_input = input_shm.buf[: n * itemsize].cast(typecode)
+    _worker_output = output_shm.buf[: n * itemsize].cast(typecode)
+
+    # ワーカーの終了時に接続を閉じる（fork / forkserver のワーカーは os._exit で
+    # 終わるので atexit は呼ばれない。multiprocessing の Finalize はどの方式でも呼ばれる）
+    Finalize(None, _release_worker, exitpriority=0)
+
+
+def _release_worker() -> None:
+    """ワーカープロセスの view を解放し、共有メモリへの接続を閉じる"""
+    global _worker_shms, _worker_input, _worker_output
+    for view in (_worker_input, _worker_output):
+        if view is not None:
+            view.release()
+    _worker_input = _worker_output = None
+
+    for shm in _worker_shms:
+        shm.close()
+    _worker_shms = []
+
+
+def _partition_slice(task: tuple) -> list[int]:
+    """
+    入力の区間 [lo, hi) をバケット番号順に並べ替え、バケットごとの個数を返す
+
+    バケット番号 = スプリッタの中で x 以下のものの個数 (bisect_right)
+    """
+    lo, hi, splitters, typecode = task
+
+    groups = [[] for _ in range(len(splitters) + 1)]
+    for x in _worker_input[lo:hi].tolist():
+        groups[bisect_right(splitters, x)].append(x)
+
+    _worker_input[lo:hi] = array(typecode, [x for group in groups for x in group])
+
+    return [len(group) for group in groups]
+
+
+def _sort_bucket(task: tuple) -> None:
+    """
+    各区間に散らばっている 1 つのバケットの要素を集めてソートし、出力位置に書く
+    """
+    pieces, dst, typecode = task
+
+    data = []
+    for start, length in pieces:
+        data.extend(_worker_input[start : start + length].tolist())
+
+    intro_sort(data)
+
+    _worker_output[dst : dst + len(data)] = array(typecode, data)
+
+
+def _release(shm: SharedMemory) -> None:
+    """共有メモリを閉じて削除する（close が失敗しても unlink は行う）"""
+    try:
+        shm.close()
+    finally:
+        shm.unlink()
+
+
+def choose_splitters(a: list[int], num_buckets: int) -> list[int]:
+    """
+    ランダムサンプルから num_buckets - 1 個のスプリッタを選ぶ
+
+    Args:
+        a: 入力配列
+        num_buckets: バケット数
+
+    Returns:
+        昇順のスプリッタのリスト
+    """
+    size = min(len(a), num_buckets * OVERSAMPLE)
+    sample = random.sample(a, size)
+    sample.sort()
+
+    step = size / num_buckets
+    return [sample[int(step * b)] for b in range(1, num_buckets)]
+
+
+def sample_sort(
+    a: list[int], max_workers: int | None = None, typecode: str = "q"
+) -> None:
+    """
+    配列aを並列サンプルソートでソートする (in-place)
+
+    Args:
+        a: ソートする整数の配列
+        max_workers: 使うプロセス数 (デフォルト: CPU 数)
+        typecode: 共有メモリ上の配列の型（'q': 64bit 符号付き整数）
+
+    例:
+        a = [random.randint(-10**9, 10**9) for _ in range(10**6)]
+        sample_sort(a, max_workers=32)
+    """
+    n = len(a)
+    workers = max_workers or os.cpu_count() or 1
+
+    if n < PARALLEL_THRESHOLD or workers == 1:
+        intro_sort(a)
+        return
+
+    splitters = choose_splitters(a, workers)
+    num_buckets = len(splitters) + 1
+
+    itemsize = array(typecode).itemsize
+    input_shm = SharedMemory(create=True, size=n * itemsize)
+    output_shm = None
+    try:
+        # 出力側の作成に失敗しても、入力側は finally で解放される
+        output_shm = SharedMemory(create=True, size=n * itemsize)
+
+        # with で抜けるときに view を release する（残っていると close できない）
+        with input_shm.buf[: n * itemsize].cast(typecode) as view:
+            view[:] = array(typecode, a)
+
+        # 入力を workers 個の区間に分ける
+        bounds = [n * i // workers for i in range(workers + 1)]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(input_shm.name, output_shm.name, n, typecode),
+        ) as executor:
+            # === 2. 分配 ===
+            partition_tasks = [
+                (bounds[i], bounds[i + 1], splitters, typecode) for i in range(workers)
+            ]
+            counts = list(executor.map(_partition_slice, partition_tasks))
+
+            # === 3. 各バケットの元の位置（区間ごと）と出力位置を求める ===
+            sort_tasks = []
+            dst = 0
+            slice_offset = bounds[:-1]
+            for b in range(num_buckets):
+                pieces = []
+                for i in range(workers):
+                    pieces.append((slice_offset[i], counts[i][b]))
+                    slice_offset[i] += counts[i][b]
+                sort_tasks.append((pieces, dst, typecode))
+                dst += sum(counts[i][b] for i in range(workers))
+
+            # === 4. バケットごとのソート ===
+            list(executor.map(_sort_bucket, sort_tasks))
+
+        with output_shm.buf[: n * itemsize].cast(typecode) as view:
+            a[:] = view.tolist()
+    finally:
+        # 片方の解放が例外を投げても、もう片方は必ず解放する
+        try:
+            _release(input_shm)
+        finally:
+            if output_shm is not None:
+                _release(output_shm)
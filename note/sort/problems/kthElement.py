@@ -1,4 +1,6 @@
 import heapq
+import math
+from bisect import bisect_left
 
 
 def kthElement(nums, k):
@@ -26,3 +28,210 @@ def kthElement(nums, k):
             result.append(-max_heap[0])
 
     return result
+
+
+class DualHeap:
+    """
+    削除に対応した「k番目に小さい値」の管理（遅延削除つきの 2 つのヒープ）
+
+    kthElement と同じく、小さい方から k 個を最大ヒープ low に、残りを最小ヒープ high に持つ
+    削除は heapq では任意位置から行えないので、遅延削除を使う:
+    - delayed[x] = 削除予定の x の個数（ヒープには残っている）
+    - 削除予定の値がヒープの先頭に来たときに初めて取り除く
+    - low_size / high_size は削除予定を除いた「有効な」要素数
+
+    計算量: add / remove / kth いずれも償却 O(log N)
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.low = []  # 小さい方から k 個（値を反転して最大ヒープにする）
+        self.high = []  # 残りの要素（最小ヒープ）
+        self.delayed = {}
+        self.low_size = 0
+        self.high_size = 0
+
+    def _prune(self, heap: list, sign: int) -> None:
+        """ヒープの先頭にある削除予定の値を取り除く"""
+        while heap:
+            x = sign * heap[0]
+            count = self.delayed.get(x, 0)
+            if count == 0:
+                break
+            # 参照しただけの値や数え終わった値をキーとして残さない（辞書が増え続けないように）
+            if count == 1:
+                del self.delayed[x]
+            else:
+                self.delayed[x] = count - 1
+            heapq.heappop(heap)
+
+    def _balance(self) -> None:
+        """有効な要素数を low = min(k, 全体), high = 残り にそろえる"""
+        while self.low_size > self.k:
+            x = -heapq.heappop(self.low)
+            self.low_size -= 1
+            heapq.heappush(self.high, x)
+            self.high_size += 1
+            self._prune(self.low, -1)
+
+        while self.low_size < self.k and self.high_size > 0:
+            x = heapq.heappop(self.high)
+            self.high_size -= 1
+            heapq.heappush(self.low, -x)
+            self.low_size += 1
+            self._prune(self.high, 1)
+
+    def add(self, x) -> None:
+        """値 x を追加する"""
+        if self.low and x <= -self.low[0]:
+            heapq.heappush(self.low, -x)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, x)
+            self.high_size += 1
+        self._balance()
+
+    def remove(self, x) -> None:
+        """値 x を 1 つ削除する（x は現在含まれていること）"""
+        self.delayed[x] = self.delayed.get(x, 0) + 1
+
+        # low の要素は全て high の要素以下なので、x <= low の最大値なら low 側にある
+        if self.low and x <= -self.low[0]:
+            self.low_size -= 1
+            self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            self._prune(self.high, 1)
+        self._balance()
+
+    def kth(self):
+        """k番目に小さい値（要素が k 個未満なら None）"""
+        if self.low_size < self.k:
+            return None
+        return -self.low[0]
+
+
+def sliding_window_kth(nums: list, w: int, k: int) -> list:
+    """
+    幅 w の各スライディングウィンドウについて、k番目に小さい値を求める
+
+    ウィンドウを 1 つずらすたびに、出ていく値を remove、入ってくる値を add する
+
+    計算量: O(N log w)
+
+    Args:
+        nums: 値の列
+        w: ウィンドウの幅
+        k: 何番目か (1-indexed, 1 <= k <= w)
+
+    Returns:
+        各ウィンドウ nums[i:i+w] の k番目に小さい値のリスト
+
+    例:
+        sliding_window_kth([5, 1, 4, 2, 3], 3, 2) -> [4, 2, 3]
+    """
+    heap = DualHeap(k)
+    result = []
+
+    for i, x in enumerate(nums):
+        heap.add(x)
+        if i >= w:
+            heap.remove(nums[i - w])
+        if i >= w - 1:
+            result.append(heap.kth())
+
+    return result
+
+
+def sliding_window_median(nums: list, w: int) -> list:
+    """
+    幅 w の各スライディングウィンドウの中央値（w が偶数なら小さい方）を求める
+
+    例:
+        sliding_window_median([1, 3, -1, -3, 5, 3, 6, 7], 3) -> [1, -1, -1, 3, 5, 6]
+    """
+    return sliding_window_kth(nums, w, (w + 1) // 2)
+
+
+class FenwickOrderStatistics:
+    """
+    座標圧縮した値の上の Fenwick 木 (Binary Indexed Tree) による順序統計
+
+    - 登場しうる値を先に全て受け取り、ソートして 1..n の番号をつける
+    - tree は「番号ごとの個数」の Fenwick 木
+    - rank(x): x 未満の個数 = 番号 < x の個数の和
+    - select(k): 累積個数が k に達する最小の番号を、2 の冪ずつ木を降りて求める
+
+    計算量: add / remove / rank / select いずれも O(log n)
+    """
+
+    def __init__(self, universe):
+        self.values = sorted(set(universe))
+        self.n = len(self.values)
+        self.tree = [0] * (self.n + 1)
+        self.size = 0
+        self.top_bit = 1 << max(0, self.n.bit_length() - 1)
+
+    def add(self, x, count: int = 1) -> None:
+        """値 x を count 個追加する（x は universe に含まれていること）"""
+        i = bisect_left(self.values, x) + 1
+        self.size += count
+        while i <= self.n:
+            self.tree[i] += count
+            i += i & -i
+
+    def remove(self, x, count: int = 1) -> None:
+        """値 x を count 個削除する"""
+        self.add(x, -count)
+
+    def rank(self, x) -> int:
+        """x より小さい要素の個数"""
+        i = bisect_left(self.values, x)
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def select(self, k: int):
+        """
+        k番目に小さい値 (1-indexed, 1 <= k <= size)
+
+        pos から 2^j 先のノードは (pos, pos + 2^j] の個数を持つので、
+        それを足しても k に届かなければ進む、を大きい j から順に行う
+        """
+        pos = 0
+        step = self.top_bit
+        while step > 0:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] < k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return self.values[pos]
+
+
+def sliding_window_quantile(nums: list, w: int, p: float) -> list:
+    """
+    幅 w の各スライディングウィンドウの p 分位点（最近順位法）を求める
+
+    値の種類が事前に分かっている（nums 全体）ので、FenwickOrderStatistics を使う
+    p を変えても同じ構造で求められる
+
+    計算量: O(N log N)
+
+    例:
+        sliding_window_quantile(latencies, 60, 0.99) -> 各 60 点窓の p99
+    """
+    k = min(w, max(1, math.ceil(p * w)))
+    fenwick = FenwickOrderStatistics(nums)
+    result = []
+
+    for i, x in enumerate(nums):
+        fenwick.add(x)
+        if i >= w:
+            fenwick.remove(nums[i - w])
+        if i >= w - 1:
+            result.append(fenwick.select(k))
+
+    return result
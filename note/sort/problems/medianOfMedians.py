@@ -1,3 +1,21 @@
+"""
+k 番目に小さい要素の選択 (Selection)
+
+- median_of_medians: 最悪 O(N) 保証。ただし再帰のたびに新しいリストを作るので定数倍が大きい
+- introselect: 配列をその場で 3 分割するクイック選択。分割が偏り続けたときだけ
+  median_of_medians でピボットを選ぶ（平均 O(N)、最悪も O(N)）
+- floyd_rivest_select: 小さなサンプルで k 番目の周辺を先に絞り込むクイック選択
+  （比較回数が N + min(k, N-k) + o(N) 程度まで減る）
+- multi_select / quantiles: 複数の k をまとめて 1 回の分割の木で求める（p50/p95/p99 など）
+"""
+
+import math
+from bisect import bisect_left
+
+# この長さ以下の区間は挿入ソートで仕上げる
+SMALL_RANGE = 16
+
+
 def median_of_medians(a, k):
     """
     Median of Medians アルゴリズム
@@ -124,3 +142,247 @@ def median_of_medians(a, k):
 
     # メイン処理: select を呼び出す
     return select(a, k)
+
+
+def _insertion_sort_range(a: list, lo: int, hi: int) -> None:
+    """区間 [lo, hi) を挿入ソートでソートする"""
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i
+        while j > lo and a[j - 1] > x:
+            a[j] = a[j - 1]
+            j -= 1
+        a[j] = x
+
+
+def _partition3(a: list, lo: int, hi: int, pivot) -> tuple[int, int]:
+    """
+    区間 [lo, hi) をその場で 3 分割する
+
+    処理後: a[lo:lt] < pivot, a[lt:gt] == pivot, a[gt:hi] > pivot
+
+    Returns:
+        (lt, gt) のタプル
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            lt += 1
+            i += 1
+        elif x > pivot:
+            gt -= 1
+            a[i], a[gt] = a[gt], x
+        else:
+            i += 1
+    return lt, gt
+
+
+def _choose_pivot(a: list, lo: int, hi: int, stalled: bool):
+    """
+    区間 [lo, hi) のピボットを選ぶ
+
+    - 通常: 先頭・中央・末尾の中央値（速い）
+    - 分割が偏り続けている (stalled): median_of_medians で選ぶ（遅いが 3:7 以上の分割を保証）
+    """
+    if stalled:
+        n = hi - lo
+        return median_of_medians(a[lo:hi], (n + 1) // 2)
+
+    x, y, z = a[lo], a[(lo + hi) // 2], a[hi - 1]
+    if x > y:
+        x, y = y, x
+    if y > z:
+        y = z
+    return x if x > y else y
+
+
+def introselect(a: list, k: int):
+    """
+    k番目に小さい要素をその場での分割で求める (Introselect)
+
+    アルゴリズムの流れ:
+    1. 3 点の中央値をピボットにして区間を 3 分割する（新しいリストは作らない）
+    2. k 番目を含む側だけを残す
+    3. 残った区間が元の 3/4 より大きい分割が 2 回続いたら「進んでいない」とみなし、
+       次のピボットだけ median_of_medians で選ぶ
+    4. 区間が小さくなったら挿入ソートして k 番目を読む
+
+    計算量: 平均 O(N)、最悪 O(N)
+
+    Args:
+        a: 配列（要素の順序が入れ替わる）
+        k: 何番目か (1-indexed, 1 <= k <= len(a))
+
+    Returns:
+        k番目に小さい値
+        呼び出し後、a[k-1] はその値で、a[:k-1] はそれ以下、a[k:] はそれ以上になる
+
+    例:
+        a = [5, 3, 8, 1, 9, 2, 7]
+        introselect(a, 3) -> 3
+    """
+    target = k - 1
+    lo, hi = 0, len(a)
+    bad = 0
+
+    while hi - lo > SMALL_RANGE:
+        n = hi - lo
+        pivot = _choose_pivot(a, lo, hi, bad >= 2)
+        lt, gt = _partition3(a, lo, hi, pivot)
+
+        if lt <= target < gt:
+            return pivot
+
+        if target < lt:
+            hi = lt
+        else:
+            lo = gt
+
+        # 残りが 3/4 より大きければ、この分割は偏っていた
+        bad = bad + 1 if (hi - lo) * 4 > n * 3 else 0
+
+    _insertion_sort_range(a, lo, hi)
+    return a[target]
+
+
+def floyd_rivest_select(a: list, k: int):
+    """
+    k番目に小さい要素を Floyd-Rivest のアルゴリズムで求める（その場で並べ替える）
+
+    アイデア:
+    - 区間が大きいときは、k 番目の周辺からとった小さな区間（サンプル）で先に
+      再帰的に選択を行う。するとサンプル内の k 番目の値は、全体の k 番目に
+      非常に近い値になる
+    - その値をピボットにすると、分割後に残る区間がとても小さくなる
+
+    計算量: 平均 O(N)（比較回数 N + min(k, N - k) + o(N)）
+
+    Args:
+        a: 配列（要素の順序が入れ替わる）
+        k: 何番目か (1-indexed, 1 <= k <= len(a))
+
+    Returns:
+        k番目に小さい値
+    """
+
+    def select(left: int, right: int, k: int) -> None:
+        # a[left..right] (両端を含む) の中で、a[k] に k 番目の値を置く
+        while right > left:
+            if right - left > 600:
+                # k 番目の周辺から大きさ s 程度のサンプル区間を決めて、先にその中で選択する
+                n = right - left + 1
+                i = k - left + 1
+                z = math.log(n)
+                s = 0.5 * math.exp(2 * z / 3)
+                sd = 0.5 * math.sqrt(z * s * (n - s) / n) * (1 if i >= n / 2 else -1)
+                new_left = max(left, int(k - i * s / n + sd))
+                new_right = min(right, int(k + (n - i) * s / n + sd))
+                select(new_left, new_right, k)
+
+            # a[k] をピボットにして分割する
+            t = a[k]
+            i = left
+            j = right
+            a[left], a[k] = a[k], a[left]
+            if a[right] > t:
+                a[right], a[left] = a[left], a[right]
+
+            while i < j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+                while a[i] < t:
+                    i += 1
+                while a[j] > t:
+                    j -= 1
+
+            if a[left] == t:
+                a[left], a[j] = a[j], a[left]
+            else:
+                j += 1
+                a[j], a[right] = a[right], a[j]
+
+            # ピボットの最終位置 j と k を比べて、k を含む側だけを残す
+            if j <= k:
+                left = j + 1
+            if k <= j:
+                right = j - 1
+
+    select(0, len(a) - 1, k - 1)
+    return a[k - 1]
+
+
+def multi_select(a: list, ks: list[int]) -> list:
+    """
+    複数の k について、k番目に小さい要素をまとめて求める（その場で並べ替える）
+
+    クイック選択で分割したとき、どちらかの側だけでなく「求めたい k を含む側」を
+    全て処理する。k が m 個なら分割の木のうち m 本の枝だけを辿ることになり、
+    k ごとに選択をやり直すより速い
+
+    計算量: 平均 O(N log m) (m: k の個数)
+
+    Args:
+        a: 配列（要素の順序が入れ替わる）
+        ks: 何番目かのリスト (1-indexed)
+
+    Returns:
+        ks と同じ順序で、それぞれの k番目に小さい値
+
+    例:
+        multi_select([5, 3, 8, 1, 9, 2, 7], [1, 4, 7]) -> [1, 5, 9]
+    """
+    targets = sorted(set(k - 1 for k in ks))
+    found = {}
+
+    # (区間の左端, 右端, targets の範囲の左端, 右端, 偏った分割の連続回数)
+    stack = [(0, len(a), 0, len(targets), 0)]
+    while stack:
+        lo, hi, tl, th, bad = stack.pop()
+
+        if hi - lo <= SMALL_RANGE:
+            _insertion_sort_range(a, lo, hi)
+            for t in targets[tl:th]:
+                found[t] = a[t]
+            continue
+
+        n = hi - lo
+        pivot = _choose_pivot(a, lo, hi, bad >= 2)
+        lt, gt = _partition3(a, lo, hi, pivot)
+
+        # targets を「左側」「ピボットと等しい部分」「右側」に振り分ける
+        i = bisect_left(targets, lt, tl, th)
+        j = bisect_left(targets, gt, tl, th)
+        for t in targets[i:j]:
+            found[t] = pivot
+
+        if tl < i:
+            stack.append((lo, lt, tl, i, bad + 1 if (lt - lo) * 4 > n * 3 else 0))
+        if j < th:
+            stack.append((gt, hi, j, th, bad + 1 if (hi - gt) * 4 > n * 3 else 0))
+
+    return [found[k - 1] for k in ks]
+
+
+def quantiles(a: list, ps: list[float]) -> list:
+    """
+    分位点 (p50, p95, p99 など) を最近順位法で求める
+
+    p 分位点 = ceil(p * N) 番目に小さい値（1 <= 順位 <= N に丸める）
+    multi_select で全ての分位点を 1 回で求める。元の配列は変更しない
+
+    Args:
+        a: 値の配列（空でないこと）
+        ps: 分位のリスト (0 <= p <= 1)
+
+    Returns:
+        ps と同じ順序で、各分位点の値
+
+    例:
+        quantiles(latencies, [0.5, 0.95, 0.99]) -> [p50, p95, p99]
+    """
+    N = len(a)
+    ks = [min(N, max(1, math.ceil(p * N))) for p in ps]
+    return multi_select(list(a), ks)
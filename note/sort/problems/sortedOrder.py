@@ -1,3 +1,21 @@
+"""
+ソート済みの順序の管理
+
+- insertionSort: 配列を挿入ソートしてから x を線形探索し、x が何番目かを返す
+- SortedList: 要素を大きさ約 LOAD のソート済みブロックに分けて持つ順序付きコンテナ
+  挿入・削除のたびに全体をソートし直さなくてよい
+
+SortedList の計算量 (N: 要素数, B: ブロック数 ≈ N / LOAD):
+- add / remove: O(log N + LOAD)（ブロック内のずらしは連続メモリの移動なので速い）
+- bisect / rank / select (添字アクセス): O(log N)
+  - ブロックの最大値の二分探索 + ブロック内の二分探索
+  - 各ブロックの要素数を Fenwick 木で持ち、前のブロックの要素数の和を O(log B) で求める
+- 一括構築: O(N log N)（ソート済みなら O(N)）
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+
 def insertionSort(nums, x):
     N = len(nums)
 
@@ -18,6 +36,212 @@ def insertionSort(nums, x):
     return -1
 
 
-nums = [4, 7, 1, 3, 6, 8]
+class SortedList:
+    """ソート済みブロックのリストによる順序付きコンテナ（重複可）"""
+
+    # 1 ブロックの目安の大きさ（2 倍を超えたら分割し、半分を下回ったら隣と併合する）
+    LOAD = 256
+
+    def __init__(self, iterable=()):
+        self._build(sorted(iterable))
+
+    def _build(self, values: list) -> None:
+        """ソート済みの values からブロックを作り直す"""
+        load = self.LOAD
+        self.blocks = [values[i : i + load] for i in range(0, len(values), load)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.size = len(values)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """ブロックの要素数の Fenwick 木を O(B) で作る"""
+        B = len(self.blocks)
+        tree = [0] * (B + 1)
+        for i in range(1, B + 1):
+            tree[i] += len(self.blocks[i - 1])
+            j = i + (i & -i)
+            if j <= B:
+                tree[j] += tree[i]
+        self.tree = tree
+
+    def _index_add(self, b: int, delta: int) -> None:
+        """ブロック b の要素数を delta 増やす"""
+        i = b + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _count_before(self, b: int) -> int:
+        """ブロック 0 .. b-1 の要素数の和"""
+        total = 0
+        while b > 0:
+            total += self.tree[b]
+            b -= b & -b
+        return total
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+    def __repr__(self):
+        return f"SortedList({list(self)})"
+
+    def __contains__(self, x) -> bool:
+        b = bisect_left(self.maxes, x)
+        if b == len(self.blocks):
+            return False
+        block = self.blocks[b]
+        return block[bisect_left(block, x)] == x
+
+    def __getitem__(self, k: int):
+        """k番目（0-indexed）に小さい値（select）"""
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("SortedList index out of range")
+
+        # Fenwick 木を降りて、累積の要素数が k を超える最初のブロックを探す
+        pos = 0
+        step = 1 << (len(self.blocks).bit_length() - 1)
+        while step > 0:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+
+        return self.blocks[pos][k]
+
+    def add(self, x) -> None:
+        """x を挿入する"""
+        if not self.blocks:
+            self._build([x])
+            return
+
+        # x 以上の最大値をもつ最初のブロック（なければ最後のブロック）に入れる
+        b = bisect_left(self.maxes, x)
+        if b == len(self.blocks):
+            b -= 1
+
+        block = self.blocks[b]
+        insort(block, x)
+        self.maxes[b] = block[-1]
+        self.size += 1
+
+        # 大きくなりすぎたブロックは半分に分ける（ブロックの並びが変わるので索引を作り直す）
+        if len(block) > 2 * self.LOAD:
+            half = len(block) // 2
+            self.blocks[b : b + 1] = [block[:half], block[half:]]
+            self.maxes[b : b + 1] = [block[half - 1], block[-1]]
+            self._build_index()
+        else:
+            self._index_add(b, 1)
+
+    def discard(self, x) -> bool:
+        """x を 1 つ削除する（含まれていなければ何もしない）。削除したら True を返す"""
+        b = bisect_left(self.maxes, x)
+        if b == len(self.blocks):
+            return False
+
+        block = self.blocks[b]
+        i = bisect_left(block, x)
+        if block[i] != x:
+            return False
+
+        del block[i]
+        self.size -= 1
+
+        if len(block) >= self.LOAD // 2 or len(self.blocks) == 1:
+            if block:
+                self.maxes[b] = block[-1]
+                self._index_add(b, -1)
+            else:
+                # 最後の 1 ブロックが空になった
+                del self.blocks[b]
+                del self.maxes[b]
+                self._build_index()
+            return True
+
+        # 小さくなりすぎたブロックは隣のブロックと併合する
+        # （削除が続いても小さなブロックが増えず、maxes の二分探索と Fenwick 木が長くならない）
+        if b == len(self.blocks) - 1:
+            b -= 1
+        merged = self.blocks[b] + self.blocks[b + 1]
+        if len(merged) > 2 * self.LOAD:
+            half = len(merged) // 2
+            parts = [merged[:half], merged[half:]]
+        else:
+            parts = [merged]
+        self.blocks[b : b + 2] = parts
+        self.maxes[b : b + 2] = [part[-1] for part in parts]
+        self._build_index()
+
+        return True
+
+    def remove(self, x) -> None:
+        """x を 1 つ削除する（含まれていなければ ValueError）"""
+        if not self.discard(x):
+            raise ValueError(f"{x} is not in SortedList")
+
+    def update(self, iterable) -> None:
+        """
+        まとめて挿入する（一括構築）
+
+        1 つずつ add するより、全体をソートし直してブロックを作り直す方が速い
+        （既存部分はソート済みなので、Python のソートがほぼ線形で処理する）
+        """
+        values = list(self)
+        values.extend(iterable)
+        values.sort()
+        self._build(values)
+
+    def bisect_left(self, x) -> int:
+        """x より小さい要素の個数（= x を挿入できる最も左の位置）"""
+        b = bisect_left(self.maxes, x)
+        if b == len(self.blocks):
+            return self.size
+        return self._count_before(b) + bisect_left(self.blocks[b], x)
+
+    def bisect_right(self, x) -> int:
+        """x 以下の要素の個数（= x を挿入できる最も右の位置）"""
+        b = bisect_right(self.maxes, x)
+        if b == len(self.blocks):
+            return self.size
+        return self._count_before(b) + bisect_right(self.blocks[b], x)
+
+    def rank(self, x) -> int:
+        """x より小さい要素の個数"""
+        return self.bisect_left(x)
+
+    def rank_of(self, xs) -> list[int]:
+        """
+        各 x が小さい方から何番目か (1-indexed) をまとめて求める
+
+        insertionSort(nums, x) と同じく、含まれていない x は -1
+        （重複がある場合は最初の位置）
+
+        例:
+            SortedList([4, 7, 1, 3, 6, 8]).rank_of([7, 5]) -> [5, -1]
+        """
+        result = []
+        for x in xs:
+            b = bisect_left(self.maxes, x)
+            if b == len(self.blocks):
+                result.append(-1)
+                continue
+            block = self.blocks[b]
+            i = bisect_left(block, x)
+            if block[i] != x:
+                result.append(-1)
+            else:
+                result.append(self._count_before(b) + i + 1)
+        return result
+
+
+if __name__ == "__main__":
+    nums = [4, 7, 1, 3, 6, 8]
 
-print(insertionSort(nums, 7))
+    print(insertionSort(nums, 7))